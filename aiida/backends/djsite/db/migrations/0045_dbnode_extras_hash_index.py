@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Migration that adds an index on the `_aiida_hash` extra of nodes, which is used to look up nodes for caching."""
+
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.45'
+DOWN_REVISION = '1.0.44'
+
+forward_sql = [
+    """CREATE INDEX IF NOT EXISTS ix_db_dbnode_extras_aiida_hash ON db_dbnode ((extras ->> '_aiida_hash'));""",
+]
+
+reverse_sql = [
+    """DROP INDEX IF EXISTS ix_db_dbnode_extras_aiida_hash;""",
+]
+
+
+class Migration(migrations.Migration):
+    """Migration that adds an index on the `_aiida_hash` extra of nodes."""
+    dependencies = [
+        ('db', '0044_dbgroup_type_string'),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql='\n'.join(forward_sql), reverse_sql='\n'.join(reverse_sql)),
+        upgrade_schema_version(REVISION, DOWN_REVISION),
+    ]
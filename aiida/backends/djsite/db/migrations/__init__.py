@@ -21,7 +21,7 @@ class DeserializationException(AiidaException):
     pass
 
 
-LATEST_MIGRATION = '0044_dbgroup_type_string'
+LATEST_MIGRATION = '0045_dbnode_extras_hash_index'
 
 
 def _update_schema_version(version, apps, _):
@@ -43,6 +43,14 @@ class DjangoBackendManager(BackendManager):
         os.environ['DJANGO_SETTINGS_MODULE'] = 'aiida.backends.djsite.settings'
         django.setup()  # pylint: disable=no-member
 
+        # Invalidate the results cached by the QueryBuilder whenever Django writes to the database
+        from django.db import connection
+        from django.db.backends.signals import connection_created
+        from .utils import watch_connection
+
+        connection_created.connect(watch_connection)
+        watch_connection(None, connection)
+
         # For QueryBuilder only
         from . import get_scoped_session
         get_scoped_session(**kwargs)
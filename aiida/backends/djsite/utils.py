@@ -25,3 +25,41 @@ def delete_nodes_and_connections_django(pks_to_delete):  # pylint: disable=inval
         models.DbLink.objects.filter(Q(input__in=pks_to_delete) | Q(output__in=pks_to_delete)).delete()
         # now delete nodes
         models.DbNode.objects.filter(pk__in=pks_to_delete).delete()
+
+
+def watch_connection(sender, connection, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the results cached by the `QueryBuilder` whenever the given Django connection writes to the database.
+
+    This is a receiver of the `connection_created` signal, which is sent for every new connection of every thread.
+
+    :param connection: the Django database connection wrapper
+    """
+    if invalidate_on_write not in connection.execute_wrappers:
+        connection.execute_wrappers.append(invalidate_on_write)
+
+
+def invalidate_on_write(execute, sql, params, many, context):
+    """Execute wrapper of a Django connection that invalidates the results cached by the `QueryBuilder` after a write.
+
+    The `QueryBuilder` uses a separate connection, which only sees the change once it is committed, so within a
+    transaction the cache is only invalidated when it is committed. A single callback is registered per transaction,
+    rather than one per statement that writes.
+    """
+    # pylint: disable=import-error,no-name-in-module
+    from django.db import transaction
+    from aiida.backends.utils import is_write_statement
+    from aiida.orm.querybuilder import invalidate_result_cache, is_result_cache_enabled
+
+    result = execute(sql, params, many, context)
+
+    if not is_result_cache_enabled() or not is_write_statement(sql):
+        return result
+
+    connection = context['connection']
+
+    # Callbacks registered within a savepoint that is rolled back are discarded by Django, in which case the next write
+    # registers the callback again. Outside of an atomic block, the list is empty and the callback is run immediately.
+    if not any(func is invalidate_result_cache for _, func in connection.run_on_commit):
+        transaction.on_commit(invalidate_result_cache, using=connection.alias)
+
+    return result
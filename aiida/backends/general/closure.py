@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Optional table with the transitive closure of the provenance graph, used to look up ancestors and descendants.
+
+The table contains a row for every pair of nodes that are connected by a path of `create` and `input_calc` links, which
+are the links that are followed by the `with_ancestors` and `with_descendants` relationships of the `QueryBuilder`,
+with the `depth` of the shortest path, which is 0 for a direct link. The table does not exist by default and is built
+with ``verdi database closure build``, which also installs triggers on the link table, such that the database keeps the
+table up to date as links are added or deleted, regardless of the process or connection that changes them.
+"""
+from contextlib import contextmanager
+import weakref
+
+from sqlalchemy import Column, Integer, MetaData, Table
+
+from aiida.backends import BACKEND_DJANGO, BACKEND_SQLA
+from aiida.common import exceptions
+from aiida.common.links import LinkType
+
+__all__ = ('closure_table_exists', 'build_closure_table', 'drop_closure_table')
+
+CLOSURE_TABLE_NAME = 'db_dbnode_closure'
+
+CLOSURE_LINK_TYPES = (LinkType.CREATE.value, LinkType.INPUT_CALC.value)
+
+closure_table = Table(  # pylint: disable=invalid-name
+    CLOSURE_TABLE_NAME,
+    MetaData(),
+    Column('ancestor_id', Integer, primary_key=True),
+    Column('descendant_id', Integer, primary_key=True),
+    Column('depth', Integer, nullable=False),
+)
+
+SELECT_CLOSURE_TABLE_EXISTS = """
+    SELECT to_regclass(%(table_name)s) IS NOT NULL;
+    """
+
+SELECT_SERVER_VERSION = """
+    SHOW server_version_num;
+    """
+
+# The trigger on deleted links uses a transition table, which requires PostgreSQL 10
+MINIMUM_SERVER_VERSION = 100000
+
+# Links that are added or deleted by other transactions while the table is built would be missed, so they have to wait
+LOCK_LINK_TABLE = """
+    LOCK TABLE db_dblink IN SHARE ROW EXCLUSIVE MODE;
+    """
+
+CREATE_CLOSURE_TABLE = """
+    CREATE TABLE IF NOT EXISTS db_dbnode_closure (
+        ancestor_id integer NOT NULL REFERENCES db_dbnode (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        descendant_id integer NOT NULL REFERENCES db_dbnode (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        depth integer NOT NULL,
+        PRIMARY KEY (ancestor_id, descendant_id)
+    );
+    CREATE INDEX IF NOT EXISTS db_dbnode_closure_descendant_id ON db_dbnode_closure (descendant_id, ancestor_id);
+    TRUNCATE db_dbnode_closure;
+    """
+
+DROP_CLOSURE_TABLE = """
+    DROP TABLE IF EXISTS db_dbnode_closure;
+    """
+
+# Pairs of all nodes connected by a path of the followed links, with the depth of their shortest path
+FILL_CLOSURE_TABLE = """
+    WITH RECURSIVE walk (ancestor_id, descendant_id, depth) AS (
+        SELECT link.input_id, link.output_id, 0
+        FROM db_dblink AS link
+        WHERE link.type IN %(link_types)s
+        UNION
+        SELECT walk.ancestor_id, link.output_id, walk.depth + 1
+        FROM walk
+        JOIN db_dblink AS link ON link.input_id = walk.descendant_id
+        WHERE link.type IN %(link_types)s
+    )
+    INSERT INTO db_dbnode_closure (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, descendant_id, MIN(depth) FROM walk GROUP BY ancestor_id, descendant_id;
+    """
+
+# Pairs of the source and its ancestors with the target and its descendants, which are connected through the new link
+CREATE_INSERT_TRIGGER = """
+    CREATE OR REPLACE FUNCTION db_dbnode_closure_insert_link() RETURNS trigger AS $$
+    BEGIN
+        WITH ancestors (node_id, distance) AS (
+            SELECT NEW.input_id, 0
+            UNION ALL
+            SELECT ancestor_id, depth + 1 FROM db_dbnode_closure WHERE descendant_id = NEW.input_id
+        ), descendants (node_id, distance) AS (
+            SELECT NEW.output_id, 0
+            UNION ALL
+            SELECT descendant_id, depth + 1 FROM db_dbnode_closure WHERE ancestor_id = NEW.output_id
+        )
+        INSERT INTO db_dbnode_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestors.node_id, descendants.node_id, ancestors.distance + descendants.distance
+        FROM ancestors CROSS JOIN descendants
+        ON CONFLICT (ancestor_id, descendant_id) DO UPDATE SET depth = LEAST(db_dbnode_closure.depth, EXCLUDED.depth);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS db_dbnode_closure_insert_link ON db_dblink;
+    CREATE TRIGGER db_dbnode_closure_insert_link AFTER INSERT ON db_dblink
+    FOR EACH ROW WHEN (NEW.type IN %(link_types)s) EXECUTE PROCEDURE db_dbnode_closure_insert_link();
+    """
+
+# The targets of the deleted links and their descendants may have lost ancestors, so their rows are deleted and their
+# ancestors are recomputed from the remaining links. The rows of deleted nodes are removed by the foreign keys.
+CREATE_DELETE_TRIGGER = """
+    CREATE OR REPLACE FUNCTION db_dbnode_closure_delete_links() RETURNS trigger AS $$
+    DECLARE
+        affected integer[];
+    BEGIN
+        SELECT array_agg(DISTINCT nodes.node_id) INTO affected FROM (
+            SELECT deleted.output_id FROM deleted_links AS deleted WHERE deleted.type IN %(link_types)s
+            UNION
+            SELECT closure.descendant_id FROM db_dbnode_closure AS closure
+            JOIN deleted_links AS deleted ON closure.ancestor_id = deleted.output_id
+            WHERE deleted.type IN %(link_types)s
+        ) AS nodes (node_id);
+
+        IF affected IS NULL THEN
+            RETURN NULL;
+        END IF;
+
+        DELETE FROM db_dbnode_closure WHERE descendant_id = ANY(affected);
+
+        WITH RECURSIVE walk (ancestor_id, descendant_id, depth) AS (
+            SELECT link.input_id, link.output_id, 0
+            FROM db_dblink AS link
+            WHERE link.output_id = ANY(affected) AND link.type IN %(link_types)s
+            UNION
+            SELECT link.input_id, walk.descendant_id, walk.depth + 1
+            FROM walk
+            JOIN db_dblink AS link ON link.output_id = walk.ancestor_id
+            WHERE link.type IN %(link_types)s
+        )
+        INSERT INTO db_dbnode_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, MIN(depth) FROM walk GROUP BY ancestor_id, descendant_id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS db_dbnode_closure_delete_links ON db_dblink;
+    CREATE TRIGGER db_dbnode_closure_delete_links AFTER DELETE ON db_dblink
+    REFERENCING OLD TABLE AS deleted_links
+    FOR EACH STATEMENT EXECUTE PROCEDURE db_dbnode_closure_delete_links();
+    """
+
+DROP_TRIGGERS = """
+    DROP TRIGGER IF EXISTS db_dbnode_closure_insert_link ON db_dblink;
+    DROP TRIGGER IF EXISTS db_dbnode_closure_delete_links ON db_dblink;
+    DROP FUNCTION IF EXISTS db_dbnode_closure_insert_link();
+    DROP FUNCTION IF EXISTS db_dbnode_closure_delete_links();
+    """
+
+# The transaction of the session of the backend in which it was last checked whether the closure table exists, as a weak
+# reference, and the result of that check
+_CLOSURE_TABLE_CHECK = (None, None)
+
+
+def _fetchall(cursor, sql, parameters):
+    """Execute the statement and return all rows of its result.
+
+    :param cursor: DB-API cursor or SQLAlchemy connection
+    :param sql: the SQL statement
+    :param parameters: dictionary with the parameters of the statement
+    :return: list of rows
+    """
+    result = cursor.execute(sql, parameters)
+    return (cursor if result is None else result).fetchall()
+
+
+def closure_table_exists():
+    """Return whether the closure table exists in the database.
+
+    The table can be built or dropped by another process at any time, so the check is repeated for every transaction of
+    the session of the backend, but only performed once within a transaction.
+
+    :return: boolean, True if the closure table exists
+    """
+    from aiida.manage.manager import get_manager
+
+    global _CLOSURE_TABLE_CHECK  # pylint: disable=global-statement
+
+    session = get_manager().get_backend().get_session()
+    transaction, exists = _CLOSURE_TABLE_CHECK
+
+    if transaction is None or transaction() is not session.transaction:
+        exists = _fetchall(session.connection(), SELECT_CLOSURE_TABLE_EXISTS, {'table_name': CLOSURE_TABLE_NAME})[0][0]
+        _CLOSURE_TABLE_CHECK = (weakref.ref(session.transaction), exists)
+
+    return exists
+
+
+def _reset_closure_table_exists():
+    """Forget whether the closure table exists and clear the query and result caches, whose queries may use it.
+
+    Queries that are cached by other processes are not cleared, but the query cache is keyed on whether the table
+    exists, which these processes check again in their next transaction.
+    """
+    from aiida.orm.querybuilder import get_query_cache, invalidate_result_cache
+
+    global _CLOSURE_TABLE_CHECK  # pylint: disable=global-statement
+    _CLOSURE_TABLE_CHECK = (None, None)
+    get_query_cache().clear()
+    invalidate_result_cache()
+
+
+@contextmanager
+def _transaction_cursor():
+    """Return a cursor within a transaction of the backend of the current profile, to be used as a context manager."""
+    from aiida.manage import configuration
+    from aiida.manage.manager import get_manager
+
+    backend = get_manager().get_backend()
+
+    if configuration.PROFILE.database_backend == BACKEND_DJANGO:
+        with backend.transaction():
+            with backend.cursor() as cursor:
+                yield cursor
+    elif configuration.PROFILE.database_backend == BACKEND_SQLA:
+        with backend.transaction() as session:
+            yield session.connection()
+    else:
+        raise Exception('unknown backend {}'.format(configuration.PROFILE.database_backend))
+
+
+def build_closure_table():
+    """Create or empty the closure table, fill it from the links and install the triggers that keep it up to date.
+
+    :raises `~aiida.common.exceptions.FeatureNotAvailable`: if the version of PostgreSQL is lower than 10
+    """
+    with _transaction_cursor() as cursor:
+        server_version = int(_fetchall(cursor, SELECT_SERVER_VERSION, {})[0][0])
+
+        if server_version < MINIMUM_SERVER_VERSION:
+            raise exceptions.FeatureNotAvailable('the closure table requires PostgreSQL 10 or higher')
+
+        cursor.execute(LOCK_LINK_TABLE, {})
+        cursor.execute(CREATE_CLOSURE_TABLE, {})
+        cursor.execute(FILL_CLOSURE_TABLE, {'link_types': CLOSURE_LINK_TYPES})
+        cursor.execute(CREATE_INSERT_TRIGGER, {'link_types': CLOSURE_LINK_TYPES})
+        cursor.execute(CREATE_DELETE_TRIGGER, {'link_types': CLOSURE_LINK_TYPES})
+
+    _reset_closure_table_exists()
+
+
+def drop_closure_table():
+    """Drop the closure table and its triggers, after which ancestors and descendants are looked up recursively."""
+    with _transaction_cursor() as cursor:
+        cursor.execute(DROP_TRIGGERS, {})
+        cursor.execute(DROP_CLOSURE_TABLE, {})
+
+    _reset_closure_table_exists()
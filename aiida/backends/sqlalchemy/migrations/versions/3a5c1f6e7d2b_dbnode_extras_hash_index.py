@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Migration that adds an index on the `_aiida_hash` extra of nodes, which is used to look up nodes for caching.
+
+Revision ID: 3a5c1f6e7d2b
+Revises: bf591f31dd12
+Create Date: 2020-06-15 10:12:41.378465
+
+"""
+# pylint: disable=no-name-in-module,import-error,invalid-name,no-member
+from alembic import op
+from sqlalchemy.sql import text
+
+forward_sql = [
+    """CREATE INDEX IF NOT EXISTS ix_db_dbnode_extras_aiida_hash ON db_dbnode ((extras ->> '_aiida_hash'));""",
+]
+
+reverse_sql = [
+    """DROP INDEX IF EXISTS ix_db_dbnode_extras_aiida_hash;""",
+]
+
+# revision identifiers, used by Alembic.
+revision = '3a5c1f6e7d2b'
+down_revision = 'bf591f31dd12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    conn = op.get_bind()
+    statement = text('\n'.join(forward_sql))
+    conn.execute(statement)
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    conn = op.get_bind()
+    statement = text('\n'.join(reverse_sql))
+    conn.execute(statement)
@@ -12,7 +12,7 @@
 
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import relationship, backref
-from sqlalchemy.schema import Column
+from sqlalchemy.schema import Column, Index
 from sqlalchemy.types import Integer, String, DateTime, Text
 # Specific to PGSQL. If needed to be agnostic
 # http://docs.sqlalchemy.org/en/rel_0_9/core/custom_types.html?highlight=guid#backend-agnostic-guid-type
@@ -80,6 +80,9 @@ class DbNode(Base):
         passive_deletes=True
     )
 
+    # Index on the hash of the node, which is used to look up nodes when caching is enabled
+    __table_args__ = (Index('ix_db_dbnode_extras_aiida_hash', extras['_aiida_hash'].astext),)
+
     def __init__(self, *args, **kwargs):
         """Add three additional attributes to the base class: mtime, attributes and extras."""
         super().__init__(*args, **kwargs)
@@ -13,6 +13,9 @@ from aiida.manage import configuration
 
 AIIDA_ATTRIBUTE_SEP = '.'
 
+# Leading keywords of the SQL statements that never change the data in the database
+READ_ONLY_KEYWORDS = ('SELECT', 'SHOW', 'EXPLAIN', 'SET', 'BEGIN', 'COMMIT', 'SAVEPOINT', 'RELEASE')
+
 
 def create_sqlalchemy_engine(profile, **kwargs):
     """Create SQLAlchemy engine (to be used for QueryBuilder queries)
@@ -21,7 +24,7 @@ def create_sqlalchemy_engine(profile, **kwargs):
         See https://docs.sqlalchemy.org/en/13/core/engines.html?highlight=create_engine#sqlalchemy.create_engine for
         more info.
     """
-    from sqlalchemy import create_engine
+    from sqlalchemy import create_engine, event
     from aiida.common import json
 
     separator = ':' if profile.database_port else ''
@@ -33,10 +36,66 @@ def create_sqlalchemy_engine(profile, **kwargs):
         port=profile.database_port,
         name=profile.database_name
     )
-    return create_engine(
+    engine = create_engine(
         engine_url, json_serializer=json.dumps, json_deserializer=json.loads, encoding='utf-8', **kwargs
     )
 
+    event.listen(engine, 'after_cursor_execute', _record_write)
+    event.listen(engine, 'commit', _invalidate_if_written)
+    event.listen(engine, 'rollback', _invalidate_if_written)
+    event.listen(engine, 'rollback_savepoint', _invalidate_if_savepoint_written)
+
+    return engine
+
+
+def is_write_statement(statement):
+    """Return whether the given SQL statement may change the data in the database.
+
+    :param statement: the SQL statement
+    :return: False if the statement only reads data or controls the transaction, True otherwise
+    """
+    words = statement.lstrip(' \t\n(').split(None, 1)
+
+    if not words:
+        return False
+
+    keyword = words[0].upper()
+
+    if keyword == 'WITH':
+        return any(word in statement.upper() for word in ('INSERT', 'UPDATE', 'DELETE'))
+
+    return keyword not in READ_ONLY_KEYWORDS
+
+
+def _record_write(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument
+    """Invalidate the results cached by the `QueryBuilder` after a statement that writes to the database.
+
+    The connection is marked, such that the cache is invalidated again when its transaction is committed or rolled back,
+    which is when the change becomes visible to, or disappears for, the other connections and this one respectively.
+    """
+    from aiida.orm.querybuilder import invalidate_result_cache, is_result_cache_enabled
+
+    if is_result_cache_enabled() and is_write_statement(statement):
+        conn.info['written'] = True
+        invalidate_result_cache()
+
+
+def _invalidate_if_written(conn, *args):  # pylint: disable=unused-argument
+    """Invalidate the results cached by the `QueryBuilder` if the transaction that ended wrote to the database."""
+    if conn.info.pop('written', False):
+        from aiida.orm.querybuilder import invalidate_result_cache
+        invalidate_result_cache()
+
+
+def _invalidate_if_savepoint_written(conn, *args):  # pylint: disable=unused-argument
+    """Invalidate the results cached by the `QueryBuilder` if a savepoint is rolled back after writing to the database.
+
+    The mark of the connection is kept, since the writes before the savepoint still end with its transaction.
+    """
+    if conn.info.get('written', False):
+        from aiida.orm.querybuilder import invalidate_result_cache
+        invalidate_result_cache()
+
 
 def create_scoped_session_factory(engine, **kwargs):
     """Create scoped SQLAlchemy session factory"""
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""`verdi caching` commands."""
+import json
+
+import click
+
+from aiida.cmdline.commands.cmd_verdi import verdi
+from aiida.cmdline.params import options
+from aiida.cmdline.utils import decorators, echo
+
+
+@verdi.group('caching')
+def verdi_caching():
+    """Inspect the effectiveness of the caching mechanism."""
+
+
+@verdi_caching.command('stats')
+@click.option('-j', '--json', 'as_json', is_flag=True, help='Print the statistics as JSON.')
+@decorators.with_dbenv()
+def caching_stats(as_json):
+    """Show the statistics of the cache lookups, per node type and process type.
+
+    The statistics are written by every process, including the daemon workers, while the `caching.statistics` option
+    is enabled for the profile. The times are the average time in milliseconds per lookup spent on computing the hash
+    of the node and on querying for and validating the cache source.
+    """
+    from tabulate import tabulate
+    from aiida.manage.caching import load_caching_statistics
+    from aiida.manage.configuration import get_config_option
+
+    entries = load_caching_statistics()
+
+    if as_json:
+        echo.echo(json.dumps(entries, indent=4))
+        return
+
+    if not get_config_option('caching.statistics'):
+        echo.echo_warning('statistics are not being recorded, enable them with `verdi config caching.statistics True`')
+
+    if not entries:
+        echo.echo_info('no cache lookups have been recorded')
+        return
+
+    headers = [
+        'Node type', 'Process type', 'Attempts', 'Hits', 'Misses', 'Invalid', 'Hit rate', 'Hash (ms)', 'Lookup (ms)'
+    ]
+    rows = []
+
+    for entry in entries:
+        attempts = entry['attempts']
+        rows.append([
+            entry['node_type'],
+            entry['process_type'],
+            attempts,
+            entry['hits'],
+            entry['misses'],
+            entry['invalid'],
+            '{:.1%}'.format(entry['hits'] / attempts),
+            '{:.2f}'.format(1000 * entry['hash_time'] / attempts),
+            '{:.2f}'.format(1000 * entry['lookup_time'] / attempts),
+        ])
+
+    echo.echo(tabulate(rows, headers=headers))
+
+
+@verdi_caching.command('reset')
+@options.FORCE()
+@decorators.with_dbenv()
+def caching_reset(force):
+    """Delete the recorded statistics of the cache lookups."""
+    from aiida.manage.caching import reset_caching_statistics
+
+    if not force:
+        click.confirm('Are you sure you want to delete the recorded caching statistics?', abort=True)
+
+    reset_caching_statistics()
+    echo.echo_success('deleted the recorded caching statistics')
@@ -76,6 +76,43 @@ def database_migrate(force):
             echo.echo_success('migration completed')
 
 
+@verdi_database.group('closure')
+def verdi_database_closure():
+    """Manage the closure table of the provenance graph."""
+
+
+@verdi_database_closure.command('build')
+@decorators.with_dbenv()
+def database_closure_build():
+    """Build or rebuild the closure table of the provenance graph.
+
+    Once built, the table is used by the `QueryBuilder` for the `with_ancestors` and `with_descendants` relationships
+    instead of recursive queries, and it is kept up to date by triggers in the database as links are added or deleted.
+    Other processes that add or delete links wait until the table is built. Requires PostgreSQL 10 or higher.
+    """
+    from aiida.backends.general.closure import build_closure_table
+    from aiida.common.exceptions import FeatureNotAvailable
+
+    echo.echo_info('building the closure table, this can take a while for large databases...')
+
+    try:
+        build_closure_table()
+    except FeatureNotAvailable as exception:
+        echo.echo_critical(str(exception))
+
+    echo.echo_success('closure table built')
+
+
+@verdi_database_closure.command('drop')
+@decorators.with_dbenv()
+def database_closure_drop():
+    """Drop the closure table of the provenance graph."""
+    from aiida.backends.general.closure import drop_closure_table
+
+    drop_closure_table()
+    echo.echo_success('closure table dropped')
+
+
 @verdi_database.group('integrity')
 def verdi_database_integrity():
     """Check the integrity of the database and fix potential issues."""
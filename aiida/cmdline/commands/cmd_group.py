@@ -293,14 +293,17 @@ def group_list(
         builder.append(orm.Node, filters={'id': {'==': node.id}}, with_group='group')
 
     builder.order_by({orm.Group: {order_by: order_dir}})
-    result = builder.all()
+    result = builder.iterrows()
+
+    # The groups are returned as lightweight records, so the email of their user is looked up separately
+    user_emails = dict(orm.QueryBuilder().append(orm.User, project=['id', 'email']).all())
 
     projection_lambdas = {
-        'pk': lambda group: str(group.pk),
+        'pk': lambda group: str(group.id),
         'label': lambda group: group.label,
         'type_string': lambda group: group.type_string,
-        'count': lambda group: group.count(),
-        'user': lambda group: group.user.email.strip(),
+        'count': lambda group: group.load().count(),
+        'user': lambda group: user_emails[group.user_id].strip(),
         'description': lambda group: group.description
     }
 
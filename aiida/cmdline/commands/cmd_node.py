@@ -322,6 +322,10 @@ def node_delete(nodes, dry_run, verbose, force, **kwargs):
     delete_nodes(node_pks_to_delete, dry_run=dry_run, verbosity=verbosity, force=force, **kwargs)
 
 
+# Key of the setting in which `verdi node rehash` records up to which node id the nodes were rehashed
+REHASH_CURSOR_KEY = 'rehash|cursor'
+
+
 @verdi_node.command('rehash')
 @arguments.NODES()
 @click.option(
@@ -331,14 +335,45 @@ def node_delete(nodes, dry_run, verbose, force, **kwargs):
     default=None,
     help='Only include nodes that are class or sub class of the class identified by this entry point.'
 )
+@click.option(
+    '-b',
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help='Number of nodes whose hashes are written to the database with a single query.'
+)
+@click.option(
+    '-j',
+    '--processes',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of processes over which the batches of nodes are distributed.'
+)
+@click.option(
+    '-r',
+    '--resume',
+    is_flag=True,
+    default=False,
+    help='Continue a previous run with the same entry point that was interrupted, skipping the nodes it rehashed.'
+)
 @options.FORCE()
 @with_dbenv()
-def rehash(nodes, entry_point, force):
+def rehash(nodes, entry_point, batch_size, processes, resume, force):
     """Recompute the hash for nodes in the database.
 
     The set of nodes that will be rehashed can be filtered by their identifier and/or based on their class.
+    The nodes are partitioned in ranges of node ids, that are rehashed in batches, optionally distributed over multiple
+    processes. The progress of a run over all nodes is recorded, such that it can be resumed if it was interrupted.
     """
-    from aiida.orm import Data, ProcessNode, QueryBuilder
+    # pylint: disable=too-many-arguments,too-many-locals
+    from aiida.common.exceptions import NotExistent
+    from aiida.manage.manager import get_manager
+    from aiida.orm import Data, Node, ProcessNode, QueryBuilder
+
+    if nodes and resume:
+        echo.echo_critical('the `--resume` option cannot be used in combination with explicit nodes.')
 
     if not force:
         echo.echo_warning('This command will recompute and overwrite the hashes of all nodes.')
@@ -354,29 +389,131 @@ def rehash(nodes, entry_point, force):
             echo.echo('\n')
             echo.echo_critical('Migration aborted, the data has not been affected.')
 
+    settings = get_manager().get_backend_manager().get_settings_manager()
+    cursor_identifier = entry_point.__name__ if entry_point is not None else None
+
     # If no explicit entry point is defined, rehash all nodes, which are either Data nodes or ProcessNodes
     if entry_point is None:
         entry_point = (Data, ProcessNode)
 
     if nodes:
-        to_hash = [(node,) for node in nodes if isinstance(node, entry_point)]
-        num_nodes = len(to_hash)
-    else:
-        builder = QueryBuilder()
-        builder.append(entry_point, tag='node')
-        to_hash = builder.all()
-        num_nodes = builder.count()
+        to_hash = [node for node in nodes if isinstance(node, entry_point)]
+
+        if not to_hash:
+            echo.echo_critical('no matching nodes found')
+
+        for start in range(0, len(to_hash), batch_size):
+            Node.objects.rehash(to_hash[start:start + batch_size])
+
+        echo.echo_success('{} nodes re-hashed.'.format(len(to_hash)))
+        return
+
+    lower = None
+
+    if resume:
+        try:
+            cursor = settings.get(REHASH_CURSOR_KEY).value
+        except NotExistent:
+            cursor = None
+
+        if cursor and cursor['entry_point'] == cursor_identifier:
+            lower = cursor['pk']
+            echo.echo_info('resuming after the node with pk {}'.format(lower))
+        else:
+            echo.echo_warning('no interrupted run with the same entry point found, starting from the beginning')
+
+    builder = QueryBuilder()
+    builder.append(entry_point, tag='node', filters={'id': {'>': lower}} if lower is not None else {}, project='id')
+    builder.order_by({'node': {'id': 'asc'}})
+
+    ranges = []
+    num_nodes = 0
+    batch = []
+
+    for pk in builder.iterall(batch_size=batch_size):
+        batch.append(pk[0])
+        if len(batch) == batch_size:
+            ranges.append((batch[0], batch[-1], len(batch)))
+            batch = []
+        num_nodes += 1
 
-    if not to_hash:
+    if batch:
+        ranges.append((batch[0], batch[-1], len(batch)))
+
+    if not ranges:
         echo.echo_critical('no matching nodes found')
 
-    with click.progressbar(to_hash, label='Rehashing Nodes:') as iter_hash:
-        for node, in iter_hash:
-            node.rehash()
+    with click.progressbar(length=num_nodes, label='Rehashing Nodes:') as progress:
+        for upper, count in _iter_rehashed_ranges(entry_point, ranges, processes):
+            settings.set(REHASH_CURSOR_KEY, {'entry_point': cursor_identifier, 'pk': upper})
+            progress.update(count)
+
+    settings.delete(REHASH_CURSOR_KEY)
 
     echo.echo_success('{} nodes re-hashed.'.format(num_nodes))
 
 
+def _iter_rehashed_ranges(entry_point, ranges, processes):
+    """Rehash the nodes in the given ranges of node ids, yielding the upper bound and node count of each finished range.
+
+    The ranges are yielded in the order in which they were passed, such that all nodes with an id up to the last
+    yielded upper bound are guaranteed to have been rehashed.
+
+    :param entry_point: the node class or tuple of node classes to which to restrict the ranges
+    :param ranges: list of tuples of the lower and upper bound, both inclusive, and the number of nodes of each range
+    :param processes: the number of processes over which to distribute the ranges
+    """
+    import functools
+    import multiprocessing
+    from aiida.manage.configuration import get_profile
+
+    rehash_range = functools.partial(_rehash_range, entry_point)
+
+    if processes == 1:
+        for lower, upper, count in ranges:
+            rehash_range(lower, upper)
+            yield upper, count
+        return
+
+    # Workers are spawned instead of forked, such that they do not share the database connections of this process
+    context = multiprocessing.get_context('spawn')
+
+    with context.Pool(processes, initializer=_initialize_rehash_worker, initargs=(get_profile().name,)) as pool:
+        results = pool.imap(_rehash_range_star, [(entry_point, lower, upper) for lower, upper, _ in ranges])
+        for (_, upper, count), _ in zip(ranges, results):
+            yield upper, count
+
+
+def _initialize_rehash_worker(profile_name):
+    """Load the profile with the given name in a worker process of `verdi node rehash`."""
+    from aiida.manage.configuration import load_profile
+    from aiida.manage.manager import get_manager
+
+    load_profile(profile_name)
+    get_manager().get_backend()
+
+
+def _rehash_range_star(arguments):
+    """Call `_rehash_range` with a tuple of arguments, as passed by `multiprocessing.Pool.imap`."""
+    return _rehash_range(*arguments)
+
+
+def _rehash_range(entry_point, lower, upper):
+    """Rehash the nodes with an id in the given range, storing the hashes with a single query.
+
+    :param entry_point: the node class or tuple of node classes to which to restrict the range
+    :param lower: the lower bound of the range of node ids, inclusive
+    :param upper: the upper bound of the range of node ids, inclusive
+    :return: the number of nodes that were rehashed
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    builder = QueryBuilder()
+    builder.append(entry_point, filters={'id': {'and': [{'>=': lower}, {'<=': upper}]}}, project='*')
+
+    return Node.objects.rehash(node for node, in builder.iterall())
+
+
 @verdi_node.group('graph')
 def verdi_graph():
     """Create visual representations of the provenance graph."""
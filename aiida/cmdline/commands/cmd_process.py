@@ -77,14 +77,11 @@ def process_list(
         echo.echo(tabulated)
         echo.echo('\nTotal results: {}\n'.format(len(projected)))
         print_last_process_state_change()
-        # Second query to get active process count
-        # Currently this is slow but will be fixed wiith issue #2770
+        # Second query to get active process count, which is counted by the database instead of projecting all processes
         # We place it at the end so that the user can Ctrl+C after getting the process table.
         builder = CalculationQueryBuilder()
         filters = builder.get_filters(process_state=('created', 'waiting', 'running'))
-        query_set = builder.get_query_set(filters=filters)
-        projected = builder.get_projected(query_set, projections=['pk'])
-        worker_slot_use = len(projected) - 1
+        worker_slot_use = builder.get_count(filters=filters)
         check_worker_load(worker_slot_use)
 
 
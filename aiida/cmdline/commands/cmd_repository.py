@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""`verdi repository` commands."""
+
+import click
+
+from aiida.cmdline.commands.cmd_verdi import verdi
+from aiida.cmdline.utils import echo
+from aiida.common.objectstore import DEFAULT_PACK_MAX_OBJECT_SIZE, DEFAULT_PACK_SIZE_TARGET
+
+
+@verdi.group('repository')
+def verdi_repository():
+    """Inspect and maintain the file repository."""
+
+
+@verdi_repository.command('status')
+def repository_status():
+    """Show the number of loose and packed objects in the object store."""
+    from aiida.orm.utils.repository import get_object_store
+
+    loose, packed = get_object_store().count_objects()
+
+    echo.echo('Loose objects:  {}'.format(loose))
+    echo.echo('Packed objects: {}'.format(packed))
+
+
+@verdi_repository.command('repack')
+@click.option(
+    '--max-object-size',
+    type=click.INT,
+    default=DEFAULT_PACK_MAX_OBJECT_SIZE,
+    show_default=True,
+    help='Only pack loose objects up to this size in bytes.'
+)
+@click.option(
+    '--pack-size-target',
+    type=click.INT,
+    default=DEFAULT_PACK_SIZE_TARGET,
+    show_default=True,
+    help='Size in bytes beyond which a new pack file is started.'
+)
+def repository_repack(max_object_size, pack_size_target):
+    """Move small loose objects of the object store into pack files.
+
+    Reading many small files is dominated by file system metadata operations, which are avoided for objects that are
+    stored in large pack files. This command can safely be run while the daemon is running, for example periodically
+    through cron, but only one repack can run at the same time.
+    """
+    from aiida.common.exceptions import InvalidOperation
+    from aiida.orm.utils.repository import get_object_store
+
+    try:
+        count = get_object_store().repack(max_object_size=max_object_size, pack_size_target=pack_size_target)
+    except InvalidOperation as exception:
+        echo.echo_critical(str(exception))
+
+    echo.echo_success('packed {} objects'.format(count))
+
+
+@verdi_repository.command('clean')
+def repository_clean():
+    """Delete the objects of the object store that are no longer referenced by any node.
+
+    Objects are shared by all nodes with identical files, so they are not deleted together with the nodes. This command
+    walks the manifests of all nodes and deletes the objects that none of them references. It can safely be run while
+    the daemon is running, but the storing of nodes waits until it is done.
+    """
+    from aiida.orm.utils.repository import delete_unreferenced_objects
+
+    count = delete_unreferenced_objects()
+
+    echo.echo_success('deleted {} unreferenced objects'.format(count))
@@ -37,8 +37,15 @@ from aiida.restapi.common import config
     default=config.CLI_DEFAULTS['WSGI_PROFILE'],
     help='Whether to enable WSGI profiler middleware for finding bottlenecks'
 )
+@click.option(
+    '--approximate-count',
+    is_flag=True,
+    default=config.CLI_DEFAULTS['APPROXIMATE_COUNT'],
+    help='Whether to use the estimates of the query planner for the total number of results, which is faster for '
+    'large tables but can be inaccurate'
+)
 @click.option('--hookup/--no-hookup', 'hookup', is_flag=True, default=None, help='Hookup app to flask server')
-def restapi(hostname, port, config_dir, debug, wsgi_profile, hookup):
+def restapi(hostname, port, config_dir, debug, wsgi_profile, approximate_count, hookup):
     """
     Run the AiiDA REST API server.
 
@@ -54,5 +61,6 @@ def restapi(hostname, port, config_dir, debug, wsgi_profile, hookup):
         config=config_dir,
         debug=debug,
         wsgi_profile=wsgi_profile,
+        approximate_count=approximate_count,
         hookup=hookup,
     )
@@ -150,6 +150,8 @@ def run(scriptname, varargs, auto_group, auto_group_label_prefix, group_name, ex
             # Re-raise the exception to have the error code properly returned at the end
             raise
     finally:
+        if autogroup.CURRENT_AUTOGROUP is not None:
+            autogroup.CURRENT_AUTOGROUP.flush()
         autogroup.current_autogroup = None
         if handle:
             handle.close()
@@ -114,11 +114,6 @@ class CalculationQueryBuilder:
         :param limit: limit the query set to this number of entries
         :return: the query set, a list of dictionaries
         """
-        import datetime
-
-        from aiida import orm
-        from aiida.common import timezone
-
         # Define the list of projections for the QueryBuilder, which are all valid minus the compound projections
         projected_attributes = [
             self.mapper.get_attribute(projection)
@@ -126,6 +121,45 @@ class CalculationQueryBuilder:
             if projection not in self._compound_projections
         ]
 
+        builder = self._get_query_builder(relationships, filters, past_days, projected_attributes)
+
+        if order_by is not None:
+            builder.order_by({'process': order_by})
+        else:
+            builder.order_by({'process': {'ctime': 'asc'}})
+
+        if limit is not None:
+            builder.limit(limit)
+
+        return builder.iterdict()
+
+    def get_count(self, relationships=None, filters=None, past_days=None):
+        """
+        Return the number of calculations for the given filters and query parameters, as counted by the database
+
+        :param relationships: a mapping of relationships to join on, see `get_query_set`
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        :return: the number of calculations
+        """
+        return self._get_query_builder(relationships, filters, past_days).count()
+
+    @staticmethod
+    def _get_query_builder(relationships=None, filters=None, past_days=None, project=None):
+        """
+        Return a query builder for the calculations with the given filters and query parameters
+
+        :param relationships: a mapping of relationships to join on, see `get_query_set`
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        :param project: the projections of the calculations
+        :return: the query builder, in which the calculations are tagged with `process`
+        """
+        import datetime
+
+        from aiida import orm
+        from aiida.common import timezone
+
         if filters is None:
             filters = {}
 
@@ -133,21 +167,13 @@ class CalculationQueryBuilder:
             filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
 
         builder = orm.QueryBuilder()
-        builder.append(cls=orm.ProcessNode, filters=filters, project=projected_attributes, tag='process')
+        builder.append(cls=orm.ProcessNode, filters=filters, project=project, tag='process')
 
         if relationships is not None:
             for tag, entity in relationships.items():
                 builder.append(cls=type(entity), filters={'id': entity.id}, **{tag: 'process'})
 
-        if order_by is not None:
-            builder.order_by({'process': order_by})
-        else:
-            builder.order_by({'process': {'ctime': 'asc'}})
-
-        if limit is not None:
-            builder.limit(limit)
-
-        return builder.iterdict()
+        return builder
 
     def get_projected(self, query_set, projections):
         """
@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Module to define commonly used data structures."""
+import collections
+import threading
 from enum import Enum, IntEnum
 
 from .extendeddicts import DefaultFieldsAttributeDict
@@ -209,3 +211,123 @@ class LazyStore:
         :return: the object that was popped
         """
         return self._store.pop(key)
+
+
+class LRUCache:
+    """
+    A mapping whose total size is bounded, which evicts the least recently used entries when that bound is exceeded.
+
+    The size of each entry is computed by the `sizeof` callable, which by default counts each entry as one, such that
+    `maxsize` simply bounds the number of entries. A `maxsize` of `None` means the cache is unbounded and a `maxsize`
+    of zero disables it. The cache can safely be shared between threads.
+    """
+
+    def __init__(self, maxsize, sizeof=None):
+        """
+        :param maxsize: the maximum total size of the entries in the cache
+        :param sizeof: optional callable that returns the size of a value
+        """
+        self._maxsize = maxsize
+        self._sizeof = sizeof or (lambda value: 1)
+        self._entries = collections.OrderedDict()
+        self._currsize = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def maxsize(self):
+        """Return the maximum total size of the entries in the cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        """Set the maximum total size of the entries in the cache, evicting entries if necessary."""
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    @property
+    def currsize(self):
+        """Return the current total size of the entries in the cache."""
+        return self._currsize
+
+    def get(self, key, default=None):
+        """
+        Return the value for the given key, marking it as the most recently used entry.
+
+        :param key: the key of the entry
+        :param default: the value to return if the key is not in the cache
+        :return: the value or the default
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value):
+        """
+        Set the value for the given key, evicting the least recently used entries if the cache exceeds its size.
+
+        A value whose size exceeds the maximum size of the cache by itself is not stored.
+
+        :param key: the key of the entry
+        :param value: the value of the entry
+        """
+        size = self._sizeof(value)
+
+        with self._lock:
+            self.pop(key)
+
+            if self._maxsize is not None and size > self._maxsize:
+                return
+
+            self._entries[key] = (value, size)
+            self._currsize += size
+            self._evict()
+
+    def pop(self, key, default=None):
+        """
+        Remove the entry with the given key and return its value.
+
+        :param key: the key of the entry
+        :param default: the value to return if the key is not in the cache
+        :return: the value or the default
+        """
+        with self._lock:
+            try:
+                value, size = self._entries.pop(key)
+            except KeyError:
+                return default
+
+            self._currsize -= size
+
+            return value
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._currsize = 0
+
+    def _evict(self):
+        """Remove the least recently used entries until the total size no longer exceeds the maximum size."""
+        if self._maxsize is None:
+            return
+
+        while self._entries and self._currsize > self._maxsize:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._currsize -= size
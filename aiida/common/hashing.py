@@ -15,7 +15,10 @@ try:  # Python > 3.5
 except ImportError:  # Python 3.5
     from pyblake2 import blake2b
 import numbers
+import os
 import random
+import sqlite3
+import threading
 import time
 import uuid
 from collections import abc, OrderedDict
@@ -43,6 +46,16 @@ HASHING_KEY = 'HashingKey'
 # The key that is used to store the hash in the node extras
 _HASH_EXTRA_KEY = '_aiida_hash'
 
+# Size in bytes of the chunks in which file content is read when it is hashed
+HASHING_CHUNK_SIZE = 2**16
+
+# Files modified less than this number of seconds ago are not added to the `FileDigestCache`, because a subsequent
+# modification within the resolution of the file system timestamps would go unnoticed
+_DIGEST_CACHE_MIN_AGE = 2
+
+# Seconds to wait for a lock on the database of a `FileDigestCache` held by another process, before skipping the cache
+_DIGEST_CACHE_TIMEOUT = 1
+
 ###################################################################
 # THE FOLLOWING WAS TAKEN FROM DJANGO BUT IT CAN BE EASILY REPLACED
 ###################################################################
@@ -137,6 +150,141 @@ def _single_digest(obj_type, obj_bytes=b''):
 _END_DIGEST = _single_digest(')')
 
 
+def _stream_digest(obj_type, handle, chunk_size=HASHING_CHUNK_SIZE):
+    """Return the same digest as `_single_digest` for the content of a file-like object, reading it in chunks.
+
+    :param obj_type: the type of the object that is included in the digest
+    :param handle: file-like object opened in binary mode
+    :param chunk_size: the size in bytes of the chunks in which the content is read
+    """
+    digest = blake2b(person=obj_type.encode('ascii'), node_depth=0, **BLAKE2B_OPTIONS)
+
+    for chunk in iter(lambda: handle.read(chunk_size), b''):
+        digest.update(chunk)
+
+    return digest.digest()
+
+
+def get_file_content_digest(filepath, digest_cache=None):
+    """Return the digest of the content of a file as it is included in the hash of a folder.
+
+    :param filepath: absolute path of the file
+    :param digest_cache: optional `FileDigestCache` in which to look up and store the digest, such that it is only
+        computed if the file was modified since it was last hashed.
+    """
+    if digest_cache is None:
+        with open(filepath, 'rb') as handle:
+            return _stream_digest('fcontent', handle)
+
+    stat = os.stat(filepath)
+    digest = digest_cache.get(filepath, stat.st_size, stat.st_mtime_ns)
+
+    if digest is None:
+        with open(filepath, 'rb') as handle:
+            digest = _stream_digest('fcontent', handle)
+
+        if time.time() - stat.st_mtime > _DIGEST_CACHE_MIN_AGE:
+            digest_cache.set(filepath, stat.st_size, stat.st_mtime_ns, digest)
+
+    return digest
+
+
+class FileDigestCache:
+    """Persistent cache of the content digests of files, stored in an SQLite database.
+
+    The digest of a file is keyed on its path, size and modification time, such that unchanged files do not have to be
+    read again when a folder is rehashed. Entries with a size and modification time of zero can be used to store the
+    digests of immutable content, for example of an object in a content-addressable store keyed by its hash key.
+
+    The database can be shared by multiple processes. If it stays locked by another process for longer than the timeout,
+    lookups are treated as misses and new digests are not stored, since the digests can always be computed again.
+    """
+
+    def __init__(self, filepath, timeout=_DIGEST_CACHE_TIMEOUT):
+        """Construct a new instance.
+
+        :param filepath: absolute path of the database file, which is created if it does not yet exist
+        :param timeout: seconds to wait for a lock on the database that is held by another process
+        """
+        self._filepath = filepath
+        self._timeout = timeout
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def filepath(self):
+        """Return the absolute path of the database file."""
+        return self._filepath
+
+    def _get_connection(self):
+        """Return the connection to the database, opening a new one if the process was forked since it was opened.
+
+        :return: an `sqlite3.Connection`
+        """
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self._filepath, timeout=self._timeout, check_same_thread=False)
+            # The cache can always be regenerated, so there is no need to wait for writes to reach the disk
+            connection.execute('PRAGMA synchronous = OFF')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS digests '
+                '(path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime INTEGER NOT NULL, digest BLOB NOT NULL)'
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def get(self, path, size=0, mtime=0):
+        """Return the cached digest for the given path, or None if it is unknown or the file was modified.
+
+        :param path: the path of the file
+        :param size: the size of the file in bytes
+        :param mtime: the modification time of the file in nanoseconds
+        """
+        with self._lock:
+            try:
+                row = self._get_connection().execute(
+                    'SELECT digest FROM digests WHERE path = ? AND size = ? AND mtime = ?', (path, size, mtime)
+                ).fetchone()
+            except sqlite3.OperationalError:
+                # The database is locked by another process
+                return None
+
+        return None if row is None else bytes(row[0])
+
+    def set(self, path, size, mtime, digest):
+        """Store the digest for the given path, replacing any existing entry.
+
+        :param path: the path of the file
+        :param size: the size of the file in bytes
+        :param mtime: the modification time of the file in nanoseconds
+        :param digest: the digest of the content of the file
+        """
+        with self._lock:
+            try:
+                connection = self._get_connection()
+                with connection:
+                    connection.execute(
+                        'INSERT OR REPLACE INTO digests (path, size, mtime, digest) VALUES (?, ?, ?, ?)',
+                        (path, size, mtime, digest)
+                    )
+            except sqlite3.OperationalError:
+                # The database is locked by another process, so the digest is simply not cached
+                pass
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute('DELETE FROM digests')
+
+    def __len__(self):
+        with self._lock:
+            return self._get_connection().execute('SELECT COUNT(*) FROM digests').fetchone()[0]
+
+
 @_make_hash.register(bytes)
 def _(bytes_obj, **kwargs):
     """Hash arbitrary byte strings."""
@@ -259,11 +407,16 @@ def _(val, **kwargs):
 @_make_hash.register(Folder)
 def _(folder, **kwargs):
     """
-    Hash the content of a Folder object. The name of the folder itself is actually ignored
+    Hash the content of a Folder object. The name of the folder itself is actually ignored.
+    The content of the files is read in chunks, such that large files are never loaded in memory as a whole.
+
     :param ignored_folder_content: list of filenames to be ignored for the hashing
+    :param digest_cache: optional `FileDigestCache` used to avoid reading files that were not modified since they
+        were last hashed
     """
 
     ignored_folder_content = kwargs.get('ignored_folder_content', [])
+    digest_cache = kwargs.get('digest_cache', None)
 
     def folder_digests(subfolder):
         """traverses the given folder and yields digests for the contained objects"""
@@ -273,8 +426,7 @@ def _(folder, **kwargs):
 
             if isfile:
                 yield _single_digest('fname', name.encode('utf-8'))
-                with subfolder.open(name, mode='rb') as fhandle:
-                    yield _single_digest('fcontent', fhandle.read())
+                yield get_file_content_digest(subfolder.get_abs_path(name), digest_cache)
             else:
                 yield _single_digest('dir(', name.encode('utf-8'))
                 for digest in folder_digests(subfolder.get_subfolder(name)):
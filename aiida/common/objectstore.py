@@ -0,0 +1,621 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Content-addressable store of file objects on the local file system."""
+import contextlib
+import fcntl
+import hashlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+from .exceptions import InvalidOperation
+from .folders import GROUP_WRITABLE
+
+# Size in bytes of the chunks in which object content is read when it is written to the store
+DEFAULT_CHUNK_SIZE = 2**16
+
+# Loose objects up to this size in bytes are moved into pack files by `ObjectStore.repack`
+DEFAULT_PACK_MAX_OBJECT_SIZE = 2**16
+
+# Size in bytes beyond which no more objects are appended to a pack file and a new one is started
+DEFAULT_PACK_SIZE_TARGET = 2**32
+
+# Number of objects that are appended to a pack file before they are committed to the index
+DEFAULT_PACK_BATCH_SIZE = 1000
+
+
+class PackedObjectReader(io.RawIOBase):
+    """Read-only raw file handle to an object that is stored in a region of a pack file."""
+
+    def __init__(self, handle, offset, length):
+        """Construct a new instance.
+
+        The pack file is read with positional reads, such that the handle can be shared by multiple readers and threads.
+        It is not closed when the reader is closed.
+
+        :param handle: binary file handle to the pack file
+        :param offset: the offset in bytes of the start of the object in the pack file
+        :param length: the length in bytes of the object
+        """
+        super().__init__()
+        self._handle = handle
+        self._offset = offset
+        self._length = length
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError('invalid whence value: {}'.format(whence))
+
+        if position < 0:
+            raise ValueError('negative seek position {}'.format(position))
+
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer):
+        size = max(0, min(len(buffer), self._length - self._position))
+
+        if size == 0:
+            return 0
+
+        data = os.pread(self._handle.fileno(), size, self._offset + self._position)
+        buffer[:len(data)] = data
+        self._position += len(data)
+
+        return len(data)
+
+
+class ObjectStore:
+    """Content-addressable store of file objects.
+
+    Each object is stored under a key that is the SHA-256 hash of its content, such that identical objects that are
+    added multiple times, for example by different nodes, are only stored once. Objects are written as individual
+    "loose" files that are sharded over sub directories based on the first two characters of their key, in order to
+    keep the number of entries per directory limited.
+
+    Objects are first written to a temporary file in the sandbox of the store and then atomically moved to their final
+    location, such that concurrent writers of the same object can never leave a partially written object behind.
+
+    Since most objects are small, storing each one in its own file means that operating on the store is dominated by
+    file system metadata operations. Therefore, loose objects can be moved into large pack files by `repack`, in which
+    objects are appended one after the other. The location of each packed object is recorded in an SQLite index, which
+    is only updated after the pack file has been flushed to disk, after which the loose files are removed. Readers first
+    look for the loose object and then in the index, so the store can be repacked while it is being used. Each thread
+    keeps its connection to the index and the pack files are kept open, so instances should be reused for lookups.
+
+    Objects are not reference counted, since they are shared by any number of repositories. Instead, objects that are
+    no longer referenced are removed by `delete_unreferenced_objects`, which is coordinated with writers through `lock`.
+    """
+
+    _hash_type = 'sha256'
+
+    def __init__(self, basepath):
+        """Construct a new instance.
+
+        :param basepath: absolute path of the directory that contains the store, will be created if it does not exist
+        """
+        self._basepath = os.path.abspath(basepath)
+        self._local = threading.local()
+        self._pack_handles = {}
+
+    def close(self):
+        """Close the open pack files and the connection of the current thread to the index.
+
+        Handles to packed objects that were opened before can no longer be read. The instance itself can still be used
+        afterwards, in which case the files and the connection are opened again when needed.
+        """
+        for _, handle in self._pack_handles.values():
+            handle.close()
+
+        self._pack_handles.clear()
+
+        if getattr(self._local, 'connection', None) is not None:
+            self._local.connection.close()
+            self._local.connection = None
+            self._local.key = None
+
+    @property
+    def basepath(self):
+        """Return the absolute path of the directory that contains the store.
+
+        :return: the absolute path of the store
+        """
+        return self._basepath
+
+    @property
+    def _loose_path(self):
+        return os.path.join(self._basepath, 'loose')
+
+    @property
+    def _sandbox_path(self):
+        return os.path.join(self._basepath, 'sandbox')
+
+    @property
+    def _packs_path(self):
+        return os.path.join(self._basepath, 'packs')
+
+    @property
+    def _index_path(self):
+        return os.path.join(self._basepath, 'packs.idx')
+
+    @property
+    def mode_file(self):
+        """Return the mode with which the object files should be created."""
+        if GROUP_WRITABLE:
+            return 0o660
+
+        return 0o600
+
+    def _get_loose_path(self, hashkey):
+        """Return the absolute path of the loose file for the object with the given key.
+
+        :param hashkey: the key of the object
+        :return: absolute path of the file of the object
+        """
+        return os.path.join(self._loose_path, hashkey[:2], hashkey[2:])
+
+    def _get_pack_path(self, pack_id):
+        """Return the absolute path of the pack file with the given identifier.
+
+        :param pack_id: the integer identifier of the pack
+        :return: absolute path of the pack file
+        """
+        return os.path.join(self._packs_path, str(pack_id))
+
+    def _connect_index(self):
+        """Return a new connection to the index of the packed objects, creating the index if it does not yet exist.
+
+        The index is created in the sandbox and then moved into place, such that readers never see an index without its
+        table. This should only be called by `repack` while holding the lock on the pack files.
+
+        :return: an `sqlite3.Connection`
+        """
+        if not os.path.isfile(self._index_path):
+            os.makedirs(self._sandbox_path, exist_ok=True)
+            descriptor, temppath = tempfile.mkstemp(dir=self._sandbox_path)
+            os.close(descriptor)
+
+            try:
+                with contextlib.closing(sqlite3.connect(temppath)) as connection, connection:
+                    connection.execute(
+                        'CREATE TABLE packed (hashkey TEXT PRIMARY KEY, pack_id INTEGER NOT NULL, '
+                        'offset INTEGER NOT NULL, length INTEGER NOT NULL)'
+                    )
+                os.replace(temppath, self._index_path)
+            finally:
+                if os.path.exists(temppath):
+                    os.remove(temppath)
+
+        return sqlite3.connect(self._index_path)
+
+    def _get_index_connection(self):
+        """Return the connection of the current thread to the index of the packed objects.
+
+        The connection is opened once per thread and reused for all lookups. It is only opened again if the process was
+        forked or if the index file was replaced, for example because the store was removed and created again. Since
+        the connection keeps the file open, its inode cannot be reused by a new index file.
+
+        :return: an `sqlite3.Connection` or None if the index does not exist, because no object was ever packed
+        """
+        try:
+            key = (os.getpid(), os.stat(self._index_path).st_ino)
+        except FileNotFoundError:
+            return None
+
+        if getattr(self._local, 'key', None) != key:
+            self._local.connection = sqlite3.connect(self._index_path)
+            self._local.key = key
+
+        return self._local.connection
+
+    def _get_pack_handle(self, pack_id):
+        """Return a binary file handle to the pack file with the given identifier, which is shared by all threads.
+
+        Pack files are only ever appended to, so the handle is kept open and reused, unless the file was replaced.
+
+        :param pack_id: the integer identifier of the pack
+        :return: binary file handle to the pack file
+        """
+        filepath = self._get_pack_path(pack_id)
+        inode = os.stat(filepath).st_ino
+
+        try:
+            handle_inode, handle = self._pack_handles[pack_id]
+        except KeyError:
+            handle_inode, handle = None, None
+
+        if handle_inode != inode:
+            # Handles that are replaced are not closed, since they can still be used by readers, so they are closed
+            # when the last reader is garbage collected
+            handle = open(filepath, 'rb', buffering=0)
+            self._pack_handles[pack_id] = (inode, handle)
+
+        return handle
+
+    def _get_packed_location(self, hashkey):
+        """Return the location of a packed object.
+
+        :param hashkey: the key of the object
+        :return: tuple of the pack identifier, offset and length of the object or None if the object is not packed
+        """
+        connection = self._get_index_connection()
+
+        if connection is None:
+            return None
+
+        return connection.execute('SELECT pack_id, offset, length FROM packed WHERE hashkey = ?', (hashkey,)).fetchone()
+
+    def has_object(self, hashkey):
+        """Return whether the store contains an object with the given key.
+
+        :param hashkey: the key of the object
+        :return: True if the object exists, False otherwise
+        """
+        return os.path.isfile(self._get_loose_path(hashkey)) or self._get_packed_location(hashkey) is not None
+
+    def add_object_from_filelike(self, handle, encoding=None):
+        """Add an object to the store with the content of a filelike object.
+
+        If an object with the same content already exists in the store, it is not written again.
+
+        :param handle: filelike object with the content to be stored, which should be opened in binary mode unless an
+            `encoding` is specified
+        :param encoding: if specified, the handle is expected to return strings which are encoded with this encoding
+        :return: the key of the object
+        """
+        os.makedirs(self._sandbox_path, exist_ok=True)
+        hasher = hashlib.new(self._hash_type)
+        descriptor, temppath = tempfile.mkstemp(dir=self._sandbox_path)
+
+        try:
+            with os.fdopen(descriptor, 'wb') as target:
+                while True:
+                    chunk = handle.read(DEFAULT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if encoding is not None:
+                        chunk = chunk.encode(encoding)
+                    hasher.update(chunk)
+                    target.write(chunk)
+
+            hashkey = hasher.hexdigest()
+            filepath = self._get_loose_path(hashkey)
+
+            if not self.has_object(hashkey):
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                os.chmod(temppath, self.mode_file)
+                os.replace(temppath, filepath)
+        finally:
+            if os.path.exists(temppath):
+                os.remove(temppath)
+
+        return hashkey
+
+    def add_object_from_file(self, path):
+        """Add an object to the store with the content of the file located at `path` on this file system.
+
+        :param path: absolute path of the file whose content to store
+        :return: the key of the object
+        """
+        with open(path, 'rb') as handle:
+            return self.add_object_from_filelike(handle)
+
+    def open(self, hashkey):
+        """Open a binary read-only file handle to the object with the given key.
+
+        :param hashkey: the key of the object
+        :return: a filelike object opened in binary mode
+        :raises IOError: if the object does not exist
+        """
+        try:
+            return open(self._get_loose_path(hashkey), 'rb')
+        except FileNotFoundError:
+            pass
+
+        location = self._get_packed_location(hashkey)
+
+        if location is None:
+            raise IOError('object {} does not exist in the object store'.format(hashkey))
+
+        pack_id, offset, length = location
+
+        return io.BufferedReader(PackedObjectReader(self._get_pack_handle(pack_id), offset, length))
+
+    def get_object_location(self, hashkey):
+        """Return the file on this file system that contains the object and the offset at which its content starts.
+
+        This allows to map the content of an object into memory without reading it first.
+
+        .. note:: a loose object can be moved into a pack file by a concurrent `repack`, so the location should not be
+            retained by the caller.
+
+        :param hashkey: the key of the object
+        :return: tuple of the absolute path of the file and the offset in bytes
+        :raises IOError: if the object does not exist
+        """
+        filepath = self._get_loose_path(hashkey)
+
+        if os.path.isfile(filepath):
+            return filepath, 0
+
+        location = self._get_packed_location(hashkey)
+
+        if location is None:
+            raise IOError('object {} does not exist in the object store'.format(hashkey))
+
+        pack_id, offset, _ = location
+
+        return self._get_pack_path(pack_id), offset
+
+    def get_object_content(self, hashkey):
+        """Return the content of the object with the given key.
+
+        :param hashkey: the key of the object
+        :return: the content of the object as a bytes string
+        :raises IOError: if the object does not exist
+        """
+        with self.open(hashkey) as handle:
+            return handle.read()
+
+    def copy_object(self, hashkey, path):
+        """Copy the content of the object with the given key to a file at `path` on this file system.
+
+        :param hashkey: the key of the object
+        :param path: absolute path of the target file
+        :raises IOError: if the object does not exist
+        """
+        with self.open(hashkey) as source, open(path, 'wb') as target:
+            shutil.copyfileobj(source, target)
+
+    def delete_object(self, hashkey):
+        """Delete the object with the given key from the store.
+
+        .. warning:: the store does not keep track of who references the objects it contains, so the caller should make
+            sure that the object is no longer referenced by any repository before deleting it, see `lock`.
+
+        .. note:: for a packed object only its entry in the index is removed, the space it occupies in the pack file is
+            not reclaimed.
+
+        :param hashkey: the key of the object
+        :raises IOError: if the object does not exist
+        """
+        deleted = False
+
+        try:
+            os.remove(self._get_loose_path(hashkey))
+        except FileNotFoundError:
+            pass
+        else:
+            deleted = True
+
+        # The object can also be packed, if a concurrent repack has already added it to the index and the loose file
+        # is about to be removed, so the entry in the index is always removed as well
+        connection = self._get_index_connection()
+
+        if connection is not None:
+            with connection:
+                deleted = connection.execute('DELETE FROM packed WHERE hashkey = ?', (hashkey,)).rowcount > 0 or deleted
+
+        if not deleted:
+            raise IOError('object {} does not exist in the object store'.format(hashkey))
+
+    @contextlib.contextmanager
+    def lock(self, exclusive=False):
+        """Context manager that holds a lock on the objects of the store for the duration of the context.
+
+        The store does not keep track of who references its objects. Writers that add objects and then record their keys
+        elsewhere, like the manifests of repositories, should therefore hold a shared lock until the keys are recorded,
+        while `delete_unreferenced_objects` should be called under an exclusive lock, such that objects that were just
+        added but are not yet referenced cannot be deleted. Any number of shared locks can be held at the same time.
+
+        :param exclusive: boolean, if True, wait until no other lock is held and acquire an exclusive lock
+        """
+        os.makedirs(self._basepath, exist_ok=True)
+
+        with open(os.path.join(self._basepath, '.lock'), 'w') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def delete_unreferenced_objects(self, referenced):
+        """Delete all objects of the store whose key is not in the given set of referenced keys.
+
+        .. warning:: the referenced keys should be collected and this method should be called while holding the lock of
+            the store with `lock(exclusive=True)`, otherwise objects that are added concurrently can be deleted.
+
+        :param referenced: set of the keys of the objects that should be kept
+        :return: the number of objects that were deleted
+        """
+        count = 0
+
+        for hashkey in set(self.iter_object_keys()) - set(referenced):
+            try:
+                self.delete_object(hashkey)
+            except IOError:
+                # The object can have been listed both as loose and packed object by a concurrent repack
+                continue
+
+            count += 1
+
+        return count
+
+    def iter_object_keys(self):
+        """Return an iterator over the keys of all objects contained in the store.
+
+        :return: iterator of object keys
+        """
+        for hashkey in self._iter_loose_object_keys():
+            yield hashkey
+
+        connection = self._get_index_connection()
+
+        if connection is None:
+            return
+
+        for row in connection.execute('SELECT hashkey FROM packed ORDER BY hashkey'):
+            yield row[0]
+
+    def _iter_loose_object_keys(self):
+        """Return an iterator over the keys of all loose objects.
+
+        :return: iterator of object keys
+        """
+        if not os.path.isdir(self._loose_path):
+            return
+
+        for prefix in sorted(os.listdir(self._loose_path)):
+            for suffix in sorted(os.listdir(os.path.join(self._loose_path, prefix))):
+                yield prefix + suffix
+
+    def count_objects(self):
+        """Return the number of loose and packed objects.
+
+        :return: tuple of the number of loose objects and the number of packed objects
+        """
+        loose = sum(1 for _ in self._iter_loose_object_keys())
+        connection = self._get_index_connection()
+
+        if connection is None:
+            return loose, 0
+
+        return loose, connection.execute('SELECT COUNT(*) FROM packed').fetchone()[0]
+
+    @contextlib.contextmanager
+    def _lock_packs(self):
+        """Context manager that acquires an exclusive lock on the pack files for the duration of the context.
+
+        :raises aiida.common.exceptions.InvalidOperation: if the lock is already held by another process
+        """
+        os.makedirs(self._packs_path, exist_ok=True)
+
+        with open(os.path.join(self._packs_path, '.lock'), 'w') as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise InvalidOperation('the packs of the object store are locked by another process')
+
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def repack(
+        self,
+        max_object_size=DEFAULT_PACK_MAX_OBJECT_SIZE,
+        pack_size_target=DEFAULT_PACK_SIZE_TARGET,
+        batch_size=DEFAULT_PACK_BATCH_SIZE
+    ):
+        """Move loose objects into pack files.
+
+        Objects are appended to the last pack file, until it exceeds the target size, after which a new pack is started.
+        After each batch of objects, the pack file is flushed to disk and the objects are committed to the index, after
+        which the corresponding loose files are removed. If the operation is interrupted, at most the objects of the
+        last batch remain loose and the bytes appended for them remain unreferenced at the end of the pack file.
+
+        The store can be read from and written to while it is being repacked, but only one repack can run at a time.
+
+        :param max_object_size: only loose objects up to this size in bytes are packed
+        :param pack_size_target: size in bytes beyond which a new pack file is started
+        :param batch_size: number of objects to append to a pack file before committing them to the index
+        :return: the number of objects that were packed
+        :raises aiida.common.exceptions.InvalidOperation: if another process is already repacking the store
+        """
+        count = 0
+
+        with self._lock_packs(), contextlib.closing(self._connect_index()) as connection:
+            pack_ids = [int(name) for name in os.listdir(self._packs_path) if name.isdigit()]
+            pack_id = max(pack_ids) if pack_ids else 0
+            handle = open(self._get_pack_path(pack_id), 'ab')
+            batch = []
+
+            def commit_batch():
+                """Flush the pack file, add the objects of the batch to the index and remove their loose files."""
+                handle.flush()
+                os.fsync(handle.fileno())
+
+                with connection:
+                    connection.executemany('INSERT OR IGNORE INTO packed VALUES (?, ?, ?, ?)', batch)
+
+                deleted = []
+
+                for hashkey, _, _, _ in batch:
+                    try:
+                        os.remove(self._get_loose_path(hashkey))
+                    except FileNotFoundError:
+                        # The object was deleted after it was read, so it should not be resurrected by the index
+                        deleted.append((hashkey,))
+
+                with connection:
+                    connection.executemany('DELETE FROM packed WHERE hashkey = ?', deleted)
+
+                batch.clear()
+
+            try:
+                for hashkey in list(self._iter_loose_object_keys()):
+                    filepath = self._get_loose_path(hashkey)
+
+                    try:
+                        size = os.path.getsize(filepath)
+                    except FileNotFoundError:
+                        continue
+
+                    if size > max_object_size:
+                        continue
+
+                    if handle.tell() > 0 and handle.tell() + size > pack_size_target:
+                        commit_batch()
+                        handle.close()
+                        pack_id += 1
+                        handle = open(self._get_pack_path(pack_id), 'ab')
+
+                    offset = handle.tell()
+
+                    with open(filepath, 'rb') as source:
+                        content = source.read()
+
+                    if hashlib.new(self._hash_type, content).hexdigest() != hashkey:
+                        # The loose object is corrupt, so it should not end up in a pack where it can no longer be
+                        # distinguished from valid objects
+                        continue
+
+                    handle.write(content)
+                    batch.append((hashkey, pack_id, offset, size))
+                    count += 1
+
+                    if len(batch) >= batch_size:
+                        commit_batch()
+
+                commit_batch()
+            finally:
+                handle.close()
+
+        return count
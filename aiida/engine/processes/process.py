@@ -582,18 +582,24 @@ class Process(plumpy.Process):
         outputs_flat = self._flat_outputs()
         outputs_stored = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
         outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
+        outputs = []
+        links = []
 
         for link_label, output in outputs_flat.items():
 
             if link_label not in outputs_new:
                 continue
 
+            outputs.append(output)
+
             if isinstance(self.node, orm.CalculationNode):
-                output.add_incoming(self.node, LinkType.CREATE, link_label)
+                links.append((self.node, output, LinkType.CREATE, link_label))
             elif isinstance(self.node, orm.WorkflowNode):
-                output.add_incoming(self.node, LinkType.RETURN, link_label)
+                links.append((self.node, output, LinkType.RETURN, link_label))
 
-            output.store()
+        # Validate and add all links at once and store the new outputs together with their links in one transaction
+        orm.Node.objects.add_links(links)
+        orm.Node.objects.bulk_store(outputs)
 
     def _setup_db_record(self):
         """
@@ -655,6 +661,8 @@ class Process(plumpy.Process):
 
     def _setup_inputs(self):
         """Create the links between the input nodes and the ProcessNode that represents this process."""
+        links = []
+
         for name, node in self._flat_inputs().items():
 
             # Certain processes allow to specify ports with `None` as acceptable values
@@ -667,10 +675,12 @@ class Process(plumpy.Process):
 
             # Need this special case for tests that use ProcessNodes as classes
             if isinstance(self.node, orm.CalculationNode):
-                self.node.add_incoming(node, LinkType.INPUT_CALC, name)
+                links.append((node, self.node, LinkType.INPUT_CALC, name))
 
             elif isinstance(self.node, orm.WorkflowNode):
-                self.node.add_incoming(node, LinkType.INPUT_WORK, name)
+                links.append((node, self.node, LinkType.INPUT_WORK, name))
+
+        orm.Node.objects.add_links(links)
 
     def _flat_inputs(self):
         """
@@ -11,7 +11,12 @@
 import os
 import re
 import copy
+import json
+import time
+import uuid
+import atexit
 import keyword
+import threading
 from enum import Enum
 from collections import namedtuple
 from contextlib import contextmanager, suppress
@@ -24,7 +29,7 @@ from aiida.common.lang import type_check
 
 from aiida.plugins.entry_point import ENTRY_POINT_STRING_SEPARATOR, ENTRY_POINT_GROUP_TO_MODULE_PATH_MAP
 
-__all__ = ('get_use_cache', 'enable_caching', 'disable_caching')
+__all__ = ('get_use_cache', 'enable_caching', 'disable_caching', 'get_caching_statistics')
 
 
 class ConfigKeys(Enum):
@@ -309,3 +314,309 @@ def _validate_identifier_pattern(*, identifier):
                 raise ValueError(common_error_msg + "'{}' is not a valid Python identifier.".format(identifier_part))
             if keyword.iskeyword(identifier_part):
                 raise ValueError(common_error_msg + "'{}' is a reserved Python keyword.".format(identifier_part))
+
+
+CACHING_STATISTICS_FIELDS = ('attempts', 'hits', 'misses', 'invalid', 'hash_time', 'lookup_time')
+
+_STATISTICS_DIR_NAME = 'caching_statistics'
+_STATISTICS_FLUSH_INTERVAL = 10
+_STATISTICS_AGGREGATE_FILENAME = 'aggregate.json'
+_STATISTICS_LOCK_FILENAME = '.lock'
+_STATISTICS_FILENAME_REGEX = re.compile(r'^(\d+)-[0-9a-f]+\.json$')
+
+
+class CachingStatistics:
+    """Counters and timings of the cache lookups performed in this interpreter, per node type and process type.
+
+    For each combination of node type and process type the following is recorded:
+
+        * `attempts`: the number of cache source lookups
+        * `hits`: the number of lookups that found a valid cache source
+        * `misses`: the number of lookups that did not find a valid cache source
+        * `invalid`: the number of nodes with a matching hash that were rejected because they are not a valid cache
+        * `hash_time`: the total time in seconds spent computing the hash of the nodes
+        * `lookup_time`: the total time in seconds spent querying for and validating the cache sources
+
+    If the `caching.statistics` option is enabled, the statistics are periodically written to a file in the
+    configuration directory, such that those of all processes, including the daemon workers, can be inspected with
+    ``verdi caching stats``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._pid = os.getpid()
+        self._filepath = None
+        self._last_flush = 0.
+        atexit.register(self.flush)
+
+    def _check_fork(self):
+        """Discard the statistics that were inherited from the parent if the interpreter was forked."""
+        if os.getpid() != self._pid:
+            self._entries = {}
+            self._pid = os.getpid()
+            self._filepath = None
+
+    def record(self, node_type, process_type, hit, invalid=0, hash_time=0., lookup_time=0.):
+        """Record a single cache source lookup.
+
+        :param node_type: the node type of the node for which a cache source was looked up
+        :param process_type: the process type of the node for which a cache source was looked up
+        :param hit: boolean, True if a valid cache source was found
+        :param invalid: the number of nodes with a matching hash that were rejected because they are not a valid cache
+        :param hash_time: the time in seconds spent computing the hash of the node
+        :param lookup_time: the time in seconds spent querying for and validating the cache source
+        """
+        with self._lock:
+            self._check_fork()
+            entry = self._entries.setdefault((node_type, process_type), dict.fromkeys(CACHING_STATISTICS_FIELDS, 0))
+            entry['attempts'] += 1
+            entry['hits' if hit else 'misses'] += 1
+            entry['invalid'] += invalid
+            entry['hash_time'] += hash_time
+            entry['lookup_time'] += lookup_time
+
+        self.flush(force=False)
+
+    def get_entries(self):
+        """Return the statistics recorded in this interpreter.
+
+        :return: list of dictionaries with the `node_type`, the `process_type` and the recorded fields
+        """
+        with self._lock:
+            self._check_fork()
+            return _format_entries(self._entries)
+
+    def reset(self):
+        """Discard the statistics recorded in this interpreter."""
+        with self._lock:
+            self._entries = {}
+
+    def flush(self, force=True):
+        """Write the statistics to the statistics directory of the current profile if enabled by the configuration.
+
+        :param force: if False, the statistics are only written if the last write is older than the flush interval
+        """
+        from aiida.manage.configuration import get_config_option
+
+        now = time.monotonic()
+
+        if not force and now - self._last_flush < _STATISTICS_FLUSH_INTERVAL:
+            return
+
+        try:
+            if not get_config_option('caching.statistics'):
+                return
+            dirpath = get_statistics_directory()
+        except exceptions.AiidaException:
+            return
+
+        with self._lock:
+            self._check_fork()
+
+            if not self._entries:
+                return
+
+            if self._filepath is None:
+                # The pid alone is not unique, because it can be reused after the process has terminated
+                self._filepath = os.path.join(dirpath, '{}-{}.json'.format(self._pid, uuid.uuid4().hex[:8]))
+
+            os.makedirs(dirpath, exist_ok=True)
+            tmp_filepath = '{}.tmp'.format(self._filepath)
+
+            with open(tmp_filepath, 'w', encoding='utf8') as handle:
+                json.dump(_format_entries(self._entries), handle)
+
+            os.replace(tmp_filepath, self._filepath)
+            self._last_flush = now
+
+
+def _format_entries(entries):
+    """Convert a dictionary of statistics keyed on node type and process type into a sorted list of dictionaries.
+
+    :param entries: dictionary with tuples of node type and process type as keys and the recorded fields as values
+    :return: list of dictionaries with the `node_type`, the `process_type` and the recorded fields
+    """
+    return [
+        dict(node_type=node_type, process_type=process_type, **fields)
+        for (node_type, process_type), fields in sorted(entries.items(), key=lambda item: tuple(map(str, item[0])))
+    ]
+
+
+_STATISTICS = None
+
+
+def get_caching_statistics():
+    """Return the statistics of the cache lookups performed in this interpreter.
+
+    :return: the `CachingStatistics` instance of this interpreter
+    """
+    global _STATISTICS  # pylint: disable=global-statement
+
+    if _STATISTICS is None:
+        _STATISTICS = CachingStatistics()
+
+    return _STATISTICS
+
+
+def get_statistics_directory():
+    """Return the directory where the caching statistics of the processes of the current profile are written.
+
+    :return: absolute path of the directory, which is not guaranteed to exist
+    :raises `~aiida.common.exceptions.ConfigurationError`: if no profile has been loaded
+    """
+    from aiida.manage.configuration import get_config, get_profile
+
+    profile = get_profile()
+
+    if profile is None:
+        raise exceptions.ConfigurationError('no profile has been loaded')
+
+    return os.path.join(get_config().dirpath, _STATISTICS_DIR_NAME, profile.name)
+
+
+def load_caching_statistics():
+    """Return the caching statistics written by all processes of the current profile, summed per node and process type.
+
+    The files that were written by processes that have terminated are merged into a single aggregate file, such that
+    the number of files, which all have to be read here, does not grow with every process that has ever been run.
+
+    :return: list of dictionaries with the `node_type`, the `process_type` and the recorded fields
+    """
+    import fcntl
+
+    dirpath = get_statistics_directory()
+
+    if not os.path.isdir(dirpath):
+        return []
+
+    with open(os.path.join(dirpath, _STATISTICS_LOCK_FILENAME), 'w') as lock:
+        # Concurrent loads would otherwise both merge the files of the same terminated processes into the aggregate
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        try:
+            return _load_statistics_directory(dirpath)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _load_statistics_directory(dirpath):
+    """Load and sum the statistics of the given directory and merge the files of terminated processes.
+
+    The aggregate file also records the names of the files that were merged into it, such that they are not counted
+    twice if they could not be removed after the aggregate was written, for example because the load was interrupted.
+
+    :param dirpath: absolute path of the statistics directory, whose lock should be held by the caller
+    :return: list of dictionaries with the `node_type`, the `process_type` and the recorded fields
+    """
+    aggregate_filepath = os.path.join(dirpath, _STATISTICS_AGGREGATE_FILENAME)
+    aggregate = _read_statistics_file(aggregate_filepath) or {}
+    previously_merged = set(aggregate.get('merged', []))
+
+    aggregated = {}
+    running = {}
+    merged = []
+
+    _add_entries(aggregated, aggregate.get('entries', []))
+
+    for filename in sorted(os.listdir(dirpath)):
+        match = _STATISTICS_FILENAME_REGEX.match(filename)
+
+        if match is None:
+            continue
+
+        filepath = os.path.join(dirpath, filename)
+
+        if filename in previously_merged:
+            with suppress(FileNotFoundError):
+                os.remove(filepath)
+            continue
+
+        entries = _read_statistics_file(filepath)
+
+        if entries is None:
+            continue
+
+        if _is_process_running(int(match.group(1))):
+            _add_entries(running, entries)
+        else:
+            _add_entries(aggregated, entries)
+            merged.append(filename)
+
+    if merged:
+        tmp_filepath = '{}.tmp'.format(aggregate_filepath)
+
+        with open(tmp_filepath, 'w', encoding='utf8') as handle:
+            json.dump({'entries': _format_entries(aggregated), 'merged': merged}, handle)
+
+        os.replace(tmp_filepath, aggregate_filepath)
+
+        for filename in merged:
+            with suppress(FileNotFoundError):
+                os.remove(os.path.join(dirpath, filename))
+
+    _add_entries(aggregated, _format_entries(running))
+
+    return _format_entries(aggregated)
+
+
+def _read_statistics_file(filepath):
+    """Return the content of a statistics file or None if it does not exist or cannot be read.
+
+    :param filepath: absolute path of the file
+    :return: the deserialized content of the file or None
+    """
+    try:
+        with open(filepath, 'r', encoding='utf8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _add_entries(merged, entries):
+    """Add the fields of a list of statistics entries to a dictionary of statistics keyed on node and process type.
+
+    :param merged: dictionary with tuples of node type and process type as keys and the recorded fields as values
+    :param entries: list of dictionaries with the `node_type`, the `process_type` and the recorded fields
+    """
+    for entry in entries:
+        fields = merged.setdefault((entry['node_type'], entry['process_type']),
+                                   dict.fromkeys(CACHING_STATISTICS_FIELDS, 0))
+        for field in CACHING_STATISTICS_FIELDS:
+            fields[field] += entry.get(field, 0)
+
+
+def _is_process_running(pid):
+    """Return whether a process with the given pid is running on this machine.
+
+    :param pid: the process id
+    :return: boolean, True if the process is running, False otherwise
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists, but belongs to another user
+        return True
+
+    return True
+
+
+def reset_caching_statistics():
+    """Delete the caching statistics written by the processes of the current profile and those of this interpreter.
+
+    .. note:: processes that are still running keep their statistics in memory, which are written again on next flush.
+    """
+    dirpath = get_statistics_directory()
+
+    try:
+        filenames = os.listdir(dirpath)
+    except FileNotFoundError:
+        filenames = []
+
+    for filename in filenames:
+        with suppress(FileNotFoundError):
+            os.remove(os.path.join(dirpath, filename))
+
+    get_caching_statistics().reset()
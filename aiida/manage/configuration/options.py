@@ -17,6 +17,7 @@ DEFAULT_DAEMON_WORKERS = 1
 DEFAULT_DAEMON_TIMEOUT = 20  # Default timeout in seconds for circus client calls
 DEFAULT_DAEMON_WORKER_PROCESS_SLOTS = 200
 VALID_LOG_LEVELS = ['CRITICAL', 'ERROR', 'WARNING', 'REPORT', 'INFO', 'DEBUG']
+VALID_REPOSITORY_BACKENDS = ['folder', 'objectstore']
 
 Option = collections.namedtuple(
     'Option', ['name', 'key', 'valid_type', 'valid_values', 'default', 'description', 'global_only']
@@ -65,6 +66,140 @@ CONFIG_OPTIONS = {
         '(1GB) when creating large numbers of database records in one go.',
         'global_only': False,
     },
+    'autogroup.buffer_size': {
+        'key': 'autogroup_buffer_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Number of stored nodes that are collected before they are added to the autogroup of '
+        '`verdi run` with a single statement, set to 0 to add each node as soon as it is stored',
+        'global_only': False,
+    },
+    'autogroup.buffer_max_age': {
+        'key': 'autogroup_buffer_max_age',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 60,
+        'description': 'Age in seconds of the oldest collected node beyond which the collected nodes are added to the '
+        'autogroup, if `autogroup.buffer_size` is set. It is only checked when another node is stored',
+        'global_only': False,
+    },
+    'repository.backend': {
+        'key': 'repository_backend',
+        'valid_type': 'string',
+        'valid_values': VALID_REPOSITORY_BACKENDS,
+        'default': 'folder',
+        'description':
+        'Backend used to write the repository of nodes when they are stored: `folder` writes a directory per node, '
+        '`objectstore` writes deduplicated objects to a content-addressable store with a manifest per node.',
+        'global_only': False,
+    },
+    'arraydata.mmap': {
+        'key': 'arraydata_mmap',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether `ArrayData.get_array` returns read-only memory-mapped arrays by default',
+        'global_only': False,
+    },
+    'arraydata.cache_size': {
+        'key': 'arraydata_cache_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 2**30,
+        'description': 'Maximum size in bytes of the arrays of stored `ArrayData` nodes that are cached in memory',
+        'global_only': False,
+    },
+    'hashing.digest_cache': {
+        'key': 'hashing_digest_cache',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Whether to cache the digests of repository files on disk, such that unchanged files are not '
+        'read again when nodes are rehashed',
+        'global_only': False,
+    },
+    'orm.identity_map_size': {
+        'key': 'orm_identity_map_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Maximum number of stored nodes loaded by `load_node` that are kept in memory per database '
+        'session, such that loading the same pk or UUID again returns the same instance, set to 0 to disable',
+        'global_only': False,
+    },
+    'querybuilder.cache_size': {
+        'key': 'querybuilder_cache_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 256,
+        'description': 'Maximum number of queries built by the `QueryBuilder` that are cached in memory to be reused '
+        'by queries with the same structure, set to 0 to disable the cache',
+        'global_only': False,
+    },
+    'querybuilder.result_cache_size': {
+        'key': 'querybuilder_result_cache_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Maximum total number of rows of the results of `QueryBuilder.all`, `dict` and `count` that are '
+        'cached in memory to be returned again for identical queries, set to 0 to disable the cache',
+        'global_only': False,
+    },
+    'querybuilder.result_cache_ttl': {
+        'key': 'querybuilder_result_cache_ttl',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 60,
+        'description': 'Time in seconds after which a cached result of the `QueryBuilder` expires, which bounds how '
+        'long changes made to the database by other processes can go unnoticed',
+        'global_only': False,
+    },
+    'querybuilder.profile': {
+        'key': 'querybuilder_profile',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Whether to time the queries executed by the `QueryBuilder` and aggregate their statistics per '
+        'call site, which are logged when the interpreter exits',
+        'global_only': False,
+    },
+    'querybuilder.slow_query_threshold': {
+        'key': 'querybuilder_slow_query_threshold',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1000,
+        'description': 'Duration in milliseconds above which a query executed by the `QueryBuilder` is logged with its '
+        'SQL, bind parameters and query plan if `querybuilder.profile` is enabled, set to 0 to disable',
+        'global_only': False,
+    },
+    'querybuilder.slow_query_explain': {
+        'key': 'querybuilder_slow_query_explain',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': True,
+        'description': 'Whether to include the output of `EXPLAIN (ANALYZE, BUFFERS)` when logging a slow query, which '
+        'executes the query once more on a separate connection (PostgreSQL only)',
+        'global_only': False,
+    },
+    'graph.traversal_engine': {
+        'key': 'graph_traversal_engine',
+        'valid_type': 'string',
+        'valid_values': ['age', 'sql'],
+        'default': 'age',
+        'description': 'Engine that traverses the provenance graph to find the nodes to delete or export: `age` runs '
+        'one query per rule and iteration, `sql` a single recursive query inside the database',
+        'global_only': False,
+    },
+    'caching.statistics': {
+        'key': 'caching_statistics',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Whether to write the statistics of the cache lookups of each process to disk, such that they '
+        'can be inspected with `verdi caching stats`',
+        'global_only': False,
+    },
     'verdi.shell.auto_import': {
         'key': 'verdi_shell_auto_import',
         'valid_type': 'string',
@@ -53,6 +53,7 @@ def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
     from aiida.backends.utils import delete_nodes_and_connections
     from aiida.common import exceptions
     from aiida.orm import Node, QueryBuilder, load_node
+    from aiida.orm.utils.loaders import evict_from_identity_map
     from aiida.tools.graph.graph_traversers import get_nodes_delete
 
     starting_pks = []
@@ -113,6 +114,7 @@ def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
     if verbosity > 0:
         echo.echo('Starting node deletion...')
     delete_nodes_and_connections(pks_set_to_delete)
+    evict_from_identity_map(pks_set_to_delete)
 
     if verbosity > 0:
         echo.echo('Nodes deleted from database, deleting files from the repository now...')
@@ -8,7 +8,9 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Module to manage the autogrouping functionality by ``verdi run``."""
+import atexit
 import re
+import time
 import warnings
 
 from aiida.common import exceptions, timezone
@@ -51,6 +53,11 @@ class Autogroup:
         self._group_label_prefix = default_label_prefix
         self._group_label = None  # Actual group label, set by `get_or_create_group`
 
+        # Pks of stored nodes that still have to be added to the group, see `add_nodes`
+        self._buffer = []
+        self._buffer_time = None
+        self._flush_at_exit = False
+
     @staticmethod
     def validate(strings):
         """Validate the list of strings passed to set_include and set_exclude."""
@@ -188,11 +195,54 @@ class Autogroup:
         return not any(self._matches(entry_point_string, filter_string) for filter_string in exclude)
 
     def clear_group_cache(self):
-        """Clear the cache of the group name.
+        """Clear the cache of the group name and drop the buffered nodes without adding them to the group.
 
-        This is mostly used by tests when they reset the database.
+        This is mostly used by tests when they reset the database, after which the buffered nodes no longer exist. To
+        add the buffered nodes to the group instead, call `flush` first.
         """
         self._group_label = None
+        self._buffer = []
+
+    def add_nodes(self, nodes):
+        """Add stored nodes to the autogroup, or buffer them to be added later in bulk.
+
+        If the `autogroup.buffer_size` option is set, the pks of the nodes are buffered and added to the group with a
+        single statement once the buffer contains that many nodes, or when `verdi run` ends or the interpreter exits.
+        There is no timer: the age of the oldest node in the buffer is only compared to `autogroup.buffer_max_age` when
+        this method is called, so nodes stored before a long period without storing wait until the end of the script.
+
+        :param nodes: list of stored nodes that are to be grouped
+        """
+        from aiida.manage.configuration import get_config_option
+
+        buffer_size = get_config_option('autogroup.buffer_size')
+
+        if not buffer_size:
+            self.flush()
+            self.get_or_create_group().add_nodes(nodes)
+            return
+
+        if not self._flush_at_exit:
+            atexit.register(self.flush)
+            self._flush_at_exit = True
+
+        if not self._buffer:
+            self._buffer_time = time.monotonic()
+
+        self._buffer.extend(node.pk for node in nodes)
+
+        buffer_max_age = get_config_option('autogroup.buffer_max_age')
+
+        if len(self._buffer) >= buffer_size or time.monotonic() - self._buffer_time >= buffer_max_age:
+            self.flush()
+
+    def flush(self):
+        """Add the buffered nodes to the autogroup."""
+        if not self._buffer:
+            return
+
+        pks, self._buffer = self._buffer, []
+        self.get_or_create_group().add_nodes_by_pk(pks)
 
     def get_or_create_group(self):
         """Return the current `AutoGroup`, or create one if None has been set yet.
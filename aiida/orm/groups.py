@@ -282,7 +282,7 @@ class Group(entities.Entity, metaclass=GroupMeta):
 
     def clear(self):
         """Remove all the nodes from this group."""
-        return self._backend_entity.clear()
+        self._backend_entity.clear()
 
     def add_nodes(self, nodes):
         """Add a node or a set of nodes to the group.
@@ -328,6 +328,81 @@ class Group(entities.Entity, metaclass=GroupMeta):
 
         self._backend_entity.remove_nodes([node.backend_entity for node in nodes])
 
+    def add_nodes_by_pk(self, pks):
+        """Add the nodes with the given pks to the group with a single statement, without loading the nodes.
+
+        :note: the group has to be stored.
+
+        :param pks: an iterable of node pks, where pks that do not correspond to a node are ignored
+        :return: the number of nodes that were added, excluding those that were already in the group
+        """
+        return self._modify_nodes_by_id(self._backend_entity.add_nodes_by_id, pks)
+
+    def add_nodes_from_query(self, builder):
+        """Add the nodes matched by a query to the group with a single ``INSERT ... SELECT`` statement.
+
+        The query is not executed separately, so the nodes are never loaded into memory.
+
+        :note: the group has to be stored.
+
+        :param builder: a `QueryBuilder` that projects only the ids of the nodes, e.g.
+            ``QueryBuilder().append(Data, project='id')``
+        :return: the number of nodes that were added, excluding those that were already in the group
+        """
+        return self._modify_nodes_by_id(self._backend_entity.add_nodes_by_id, builder)
+
+    def remove_nodes_by_pk(self, pks):
+        """Remove the nodes with the given pks from the group with a single statement, without loading the nodes.
+
+        :note: the group has to be stored.
+
+        :param pks: an iterable of node pks
+        :return: the number of nodes that were removed
+        """
+        return self._modify_nodes_by_id(self._backend_entity.remove_nodes_by_id, pks)
+
+    def remove_nodes_from_query(self, builder):
+        """Remove the nodes matched by a query from the group with a single ``DELETE`` statement.
+
+        :note: the group has to be stored.
+
+        :param builder: a `QueryBuilder` that projects only the ids of the nodes
+        :return: the number of nodes that were removed
+        """
+        return self._modify_nodes_by_id(self._backend_entity.remove_nodes_by_id, builder)
+
+    def sync(self, nodes):
+        """Make the given nodes the only nodes of the group, adding and removing nodes in a single transaction.
+
+        Only the nodes that are not yet in the group are added and only those that are not among the given nodes are
+        removed, so the memberships of the other nodes are left untouched.
+
+        :note: the group has to be stored.
+
+        :param nodes: an iterable of node pks or a `QueryBuilder` that projects only the ids of the nodes
+        :return: tuple of the number of nodes that were added and the number of nodes that were removed
+        """
+        return self._modify_nodes_by_id(self._backend_entity.sync_nodes_by_id, nodes)
+
+    def _modify_nodes_by_id(self, method, nodes):
+        """Call a method of the backend group that modifies its nodes by their ids.
+
+        :param method: the method of the backend group
+        :param nodes: an iterable of node pks or a `QueryBuilder` that projects only the ids of the nodes
+        :return: the return value of the method
+        """
+        from .querybuilder import QueryBuilder
+
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot modify the nodes of an unstored group')
+
+        if isinstance(nodes, QueryBuilder):
+            node_ids = nodes.get_query()
+        else:
+            node_ids = list(nodes)
+
+        return method(node_ids)
+
     @classmethod
     def get(cls, **kwargs):
         """
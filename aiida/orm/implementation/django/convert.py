@@ -152,6 +152,12 @@ def _(dbmodel, backend):
     get_backend_entity for DummyModel DbNode.
     DummyModel instances are created when QueryBuilder queries the Django backend.
     """
+    from django.db.models import DEFERRED
+    from sqlalchemy import inspect
+
+    # The JSON columns are not loaded by the QueryBuilder, so they are deferred on the Django model as well
+    unloaded = inspect(dbmodel).unloaded
+
     djnode_instance = djmodels.DbNode(
         id=dbmodel.id,
         node_type=dbmodel.node_type,
@@ -163,8 +169,8 @@ def _(dbmodel, backend):
         description=dbmodel.description,
         dbcomputer_id=dbmodel.dbcomputer_id,
         user_id=dbmodel.user_id,
-        attributes=dbmodel.attributes,
-        extras=dbmodel.extras
+        attributes=DEFERRED if 'attributes' in unloaded else dbmodel.attributes,
+        extras=DEFERRED if 'extras' in unloaded else dbmodel.extras
     )
 
     from . import nodes
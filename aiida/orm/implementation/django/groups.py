@@ -12,12 +12,14 @@
 from collections.abc import Iterable, Iterator, Sized
 
 # pylint: disable=no-name-in-module,import-error
+from aldjemy import core
 from django.db import transaction
 from django.db.models import Q
 
 from aiida.backends.djsite.db import models
 from aiida.common.lang import type_check
-from aiida.orm.implementation.groups import BackendGroup, BackendGroupCollection
+from aiida.orm.implementation.groups import BackendGroupCollection
+from aiida.orm.implementation.sql.groups import SqlBackendGroup
 
 from . import entities
 from . import users
@@ -26,7 +28,7 @@ from . import utils
 __all__ = ('DjangoGroup', 'DjangoGroupCollection')
 
 
-class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  # pylint: disable=abstract-method
+class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], SqlBackendGroup):  # pylint: disable=abstract-method
     """The Django group object"""
     MODEL_CLASS = models.DbGroup
 
@@ -186,6 +188,53 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
 
         self._dbmodel.dbnodes.remove(*node_pks)
 
+    def _select_node_ids(self, node_ids):
+        """Return a selectable with a single column with the given node ids.
+
+        The expanding bind parameters of a query, which the `QueryBuilder` uses for ``in`` filters, are only expanded by
+        SQLAlchemy when it executes the statement, so they are replaced by their values.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: the selectable
+        :raises ValueError: if the query selects more than one column
+        """
+        from aiida.orm.querybuilder import _render_bound_params
+        return _render_bound_params(super()._select_node_ids(node_ids), {})
+
+    def _get_tables(self):
+        """Return the SQLAlchemy tables of the nodes and of the nodes of the groups.
+
+        :return: tuple of the table of the nodes and the table of the nodes of the groups
+        """
+        return core.Cache.meta.tables['db_dbnode'], core.Cache.meta.tables['db_dbgroup_dbnodes']
+
+    def _execute_statements(self, *statements):
+        """Execute the given statements in a single transaction through the Django connection.
+
+        The statements are compiled with the dialect of the `QueryBuilder` and executed with the cursor of the Django
+        connection instead of the session of the `QueryBuilder`, such that they are part of any ongoing transaction.
+
+        :param statements: SQLAlchemy Core statements
+        :return: list with the number of rows affected by each statement
+        """
+        dialect = self._backend.get_session().get_bind().dialect
+        rowcounts = []
+
+        with transaction.atomic(), self._backend.get_connection().cursor() as cursor:
+            for statement in statements:
+                compiled = statement.compile(dialect=dialect)
+                parameters = compiled.construct_params()
+
+                for name, value in parameters.items():
+                    processor = compiled.binds[name].type.bind_processor(dialect)
+                    if processor is not None:
+                        parameters[name] = processor(value)
+
+                cursor.execute(str(compiled), parameters)
+                rowcounts.append(cursor.rowcount)
+
+        return rowcounts
+
 
 class DjangoGroupCollection(BackendGroupCollection):
     """The Django Group collection"""
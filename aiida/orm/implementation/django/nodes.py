@@ -176,7 +176,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the attribute does not exist
         """
         try:
-            return self._dbmodel.attributes[key]
+            return self._dbmodel.get_json_value('attributes', key)
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
 
@@ -321,7 +321,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the extra does not exist
         """
         try:
-            return self._dbmodel.extras[key]
+            return self._dbmodel.get_json_value('extras', key)
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
 
@@ -437,7 +437,9 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
 
     def _flush_if_stored(self, fields=None):
         if self._dbmodel.is_saved():
+            from aiida.orm.utils.loaders import evict_from_identity_map
             self._dbmodel._flush(fields)  # pylint: disable=protected-access
+            evict_from_identity_map([self.id])
 
     def add_incoming(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
@@ -521,7 +523,9 @@ class DjangoNodeCollection(BackendNodeCollection):
         :param pk: id of the node
         """
         try:
-            return self.ENTITY_CLASS.from_dbmodel(models.DbNode.objects.get(pk=pk), self.backend)
+            # The attributes and extras are only loaded once they are accessed
+            dbmodel = models.DbNode.objects.defer('attributes', 'extras').get(pk=pk)
+            return self.ENTITY_CLASS.from_dbmodel(dbmodel, self.backend)
         except ObjectDoesNotExist:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
 
@@ -534,3 +538,62 @@ class DjangoNodeCollection(BackendNodeCollection):
             models.DbNode.objects.filter(pk=pk).delete()  # pylint: disable=no-member
         except ObjectDoesNotExist:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def bulk_store(self, nodes, links=(), with_transaction=True):
+        """Store multiple new nodes and links with multi-row inserts in a single transaction.
+
+        :param nodes: list of unstored `BackendNode` instances, whose values should already be cleaned
+        :param links: iterable of tuples of the source node, the target node, the link type and the link label, where
+            each node is either stored already or one of `nodes`
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :raise aiida.common.IntegrityError: if the nodes or links violate a constraint of the database, in which case
+            none of them is stored
+        """
+        from aiida.manage.configuration import get_config_option
+
+        batch_size = get_config_option('db.batch_size')
+        dbmodels = [node.dbmodel for node in nodes]
+
+        try:
+            with self._transaction(with_transaction):
+                # The primary keys are assigned to the models by the insert, which is needed for the links
+                models.DbNode.objects.bulk_create(dbmodels, batch_size=batch_size)
+
+                dblinks = [
+                    models.DbLink(input_id=source.id, output_id=target.id, type=link_type.value, label=label)
+                    for source, target, link_type, label in links
+                ]
+                models.DbLink.objects.bulk_create(dblinks, batch_size=batch_size)
+        except Exception as exception:
+            # The insert was rolled back, so the models have to be marked as unsaved again
+            for dbmodel in dbmodels:
+                dbmodel.pk = None
+                dbmodel._state.adding = True  # pylint: disable=protected-access
+
+            if isinstance(exception, IntegrityError):
+                raise exceptions.IntegrityError('failed to store the nodes: {}'.format(exception))
+
+            raise
+
+    def bulk_set_extra(self, key, values):
+        """Set an extra of multiple stored nodes with a single query, leaving their other extras untouched.
+
+        :param key: the key of the extra
+        :param values: dictionary mapping the id of each node onto the value of the extra, which should already be
+            cleaned with `clean_value`
+        """
+        from aiida.common import json
+
+        type_check(key, str)
+
+        if not values:
+            return
+
+        with transaction.atomic():
+            with self.backend.cursor() as cursor:
+                cursor.execute(
+                    'UPDATE db_dbnode SET extras = jsonb_set(COALESCE(extras, CAST(%s AS jsonb)), %s, data.value) '
+                    'FROM jsonb_each(CAST(%s AS jsonb)) AS data (id, value) '
+                    'WHERE db_dbnode.id = CAST(data.id AS INTEGER)',
+                    ['{}', [key], json.dumps(values)]
+                )
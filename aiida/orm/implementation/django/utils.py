@@ -69,6 +69,36 @@ class ModelWrapper:
             fields = set((key,) + self._auto_flush)
             self._flush(fields=fields)
 
+    def get_json_value(self, field, key):
+        """Return the value of a key of a JSON field of the model instance.
+
+        If the model is saved and the field is mutable, only the value of the key is fetched from the database, instead
+        of the entire field as for `getattr`.
+
+        :param field: the name of the JSON model field
+        :param key: the key in the JSON field
+        :return: the value of the key
+        :raises KeyError: if the key does not exist
+        """
+        from django.contrib.postgres.fields import JSONField
+        from django.db.models import F, Func, TextField, Value
+        from django.db.models.functions import Cast
+
+        if not self.is_saved() or not self._is_mutable_model_field(field):
+            return getattr(self._model, field)[key]
+
+        # The key is passed as text explicitly, since `KeyTransform` would turn a key of only digits into an array index
+        json_value = Func(
+            F(field), Cast(Value(key), TextField()), function='', arg_joiner=' -> ', output_field=JSONField()
+        )
+        queryset = self._model.__class__.objects.filter(pk=self._model.pk, **{'{}__has_key'.format(field): key})
+        values = list(queryset.annotate(json_value=json_value).values_list('json_value', flat=True))
+
+        if not values:
+            raise KeyError(key)
+
+        return values[0]
+
     def is_saved(self):
         """Retun whether the wrapped model instance is saved in the database.
 
@@ -183,6 +183,39 @@ class BackendGroup(backends.BackendEntity):
         if any([not isinstance(node, BackendNode) for node in nodes]):
             raise TypeError('nodes have to be of type {}'.format(BackendNode))
 
+    def add_nodes_by_id(self, node_ids):
+        """Add the nodes with the given ids to the group with a single statement.
+
+        :note: the group has to be stored.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: the number of nodes that were added, excluding those that were already in the group
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+    def remove_nodes_by_id(self, node_ids):
+        """Remove the nodes with the given ids from the group with a single statement.
+
+        :note: the group has to be stored.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: the number of nodes that were removed
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+    def sync_nodes_by_id(self, node_ids):
+        """Make the nodes with the given ids the only nodes of the group, in a single transaction.
+
+        :note: the group has to be stored.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: tuple of the number of nodes that were added and the number of nodes that were removed
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before its nodes can be set')
+
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__.__name__, str(self))
 
@@ -10,6 +10,7 @@
 """Abstract BackendNode and BackendNodeCollection implementation."""
 
 import abc
+import contextlib
 
 from . import backends
 
@@ -387,6 +388,18 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
     ENTITY_CLASS = BackendNode
 
+    def _transaction(self, with_transaction=True):
+        """Return a context manager that opens a transaction of the backend, or an empty context if not requested.
+
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+        if with_transaction:
+            return self.backend.transaction()
+
+        # `contextlib.suppress` provides an empty context and can be replaced with `contextlib.nullcontext` after we
+        # drop support for python 3.6
+        return contextlib.suppress()
+
     @abc.abstractmethod
     def get(self, pk):
         """Return a Node entry from the collection with the given id
@@ -400,3 +413,24 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    @abc.abstractmethod
+    def bulk_store(self, nodes, links=(), with_transaction=True):
+        """Store multiple new nodes and links with multi-row inserts in a single transaction.
+
+        :param nodes: list of unstored `BackendNode` instances, whose values should already be cleaned
+        :param links: iterable of tuples of the source node, the target node, the link type and the link label, where
+            each node is either stored already or one of `nodes`
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :raise aiida.common.IntegrityError: if the nodes or links violate a constraint of the database, in which case
+            none of them is stored
+        """
+
+    @abc.abstractmethod
+    def bulk_set_extra(self, key, values):
+        """Set an extra of multiple stored nodes with a single query, leaving their other extras untouched.
+
+        :param key: the key of the extra
+        :param values: dictionary mapping the id of each node onto the value of the extra, which should already be
+            cleaned with `clean_value`
+        """
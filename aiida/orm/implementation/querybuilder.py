@@ -38,6 +38,9 @@ class BackendQueryBuilder:
     outer_to_inner_schema = None
     inner_to_outer_schema = None
 
+    # The number of rows fetched per batch when streaming results if no batch size is specified
+    DEFAULT_STREAM_BATCH_SIZE = 1000
+
     def __init__(self, backend):
         """
         :param backend: the backend
@@ -304,15 +307,60 @@ class BackendQueryBuilder:
             self.get_session().close()
             raise
 
-    def iterall(self, query, batch_size, tag_to_index_dict):
+    def iter_results(self, query, batch_size, stream=False):
+        """Return an iterator over the rows of the query, fetching them from the database in batches.
+
+        By default the query is executed in the session that is shared by all queries of the current thread, which
+        means that the results can no longer be fetched once that session commits its transaction, for example because
+        a node is stored while iterating. In streaming mode, the query is instead executed in a dedicated session with a
+        server-side cursor, such that at most `batch_size` rows are held in memory at any time and the session is not
+        affected by what happens in the shared session. Entity instances are merged into the shared session before they
+        are returned, such that they can be used as usual. The dedicated session is closed as soon as the iterator is
+        exhausted or closed.
+
+        .. note:: the dedicated session only sees the data that was committed when the query was executed.
+
+        :param query: the query to execute
+        :param batch_size: the number of rows to fetch per batch
+        :param stream: if True, execute the query in a dedicated session with a server-side cursor
+        :return: an iterator over the rows of the query
         """
+        if not stream:
+            yield from query.yield_per(batch_size)
+            return
+
+        from sqlalchemy.orm import Session
+
+        session = self.get_session()
+        stream_session = Session(bind=session.get_bind(), autoflush=False)
+
+        def merge(value):
+            """Merge an entity instance of the dedicated session into the shared session."""
+            if hasattr(value, '_sa_instance_state'):
+                return session.merge(value, load=False)
+            return value
+
+        try:
+            results = query.with_session(stream_session).yield_per(batch_size or self.DEFAULT_STREAM_BATCH_SIZE)
+            for row in results:
+                if isinstance(row, tuple):
+                    yield tuple(merge(value) for value in row)
+                else:
+                    yield merge(row)
+        finally:
+            stream_session.close()
+
+    def iterall(self, query, batch_size, tag_to_index_dict, stream=False):
+        """
+        :param stream: if True, stream the results through a server-side cursor of a dedicated session, see
+            :meth:`BackendQueryBuilder.iter_results`
         :return: An iterator over all the results of a list of lists.
         """
         try:
             if not tag_to_index_dict:
                 raise Exception('Got an empty dictionary: {}'.format(tag_to_index_dict))
 
-            results = query.yield_per(batch_size)
+            results = self.iter_results(query, batch_size, stream)
 
             if len(tag_to_index_dict) == 1:
                 # Sqlalchemy, for some strange reason, does not return a list of lsits
@@ -333,8 +381,30 @@ class BackendQueryBuilder:
             self.get_session().close()
             raise
 
-    def iterdict(self, query, batch_size, tag_to_projected_properties_dict, tag_to_alias_map):
+    def iterrows(self, query, batch_size, stream=False):
+        """Return an iterator over the rows of a query that only projects columns, as tuples of plain values.
+
+        Contrary to :meth:`iterall`, the values are not converted to backend entities, but only UUIDs are converted to
+        strings and choices to their value.
+
+        :param stream: if True, stream the results through a server-side cursor of a dedicated session, see
+            :meth:`BackendQueryBuilder.iter_results`
+        :return: an iterator over tuples of the values of the projected columns
+        """
+        try:
+            for row in self.iter_results(query, batch_size, stream):
+                yield tuple(
+                    str(value) if isinstance(value, uuid.UUID) else value.value if isinstance(value, Choice) else value
+                    for value in row
+                )
+        except Exception:
+            self.get_session().close()
+            raise
+
+    def iterdict(self, query, batch_size, tag_to_projected_properties_dict, tag_to_alias_map, stream=False):
         """
+        :param stream: if True, stream the results through a server-side cursor of a dedicated session, see
+            :meth:`BackendQueryBuilder.iter_results`
         :returns: An iterator over all the results of a list of dictionaries.
         """
         try:
@@ -343,7 +413,7 @@ class BackendQueryBuilder:
             if not nr_items:
                 raise ValueError('Got an empty dictionary')
 
-            results = query.yield_per(batch_size)
+            results = self.iter_results(query, batch_size, stream)
             if nr_items > 1:
                 for this_result in results:
                     yield {
@@ -16,5 +16,6 @@ All SQL backends with an ORM should subclass from the classes in this module
 # pylint: disable=wildcard-import
 
 from .backends import *
+from .groups import *
 
-__all__ = (backends.__all__)
+__all__ = (backends.__all__ + groups.__all__)
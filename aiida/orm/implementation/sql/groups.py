@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Generic backend group for SQL based backends"""
+
+import abc
+
+from .. import groups
+
+__all__ = ('SqlBackendGroup',)
+
+
+class SqlBackendGroup(groups.BackendGroup):
+    """Backend group of an SQL based backend, whose nodes can be modified in bulk with single statements.
+
+    The statements are built with SQLAlchemy Core on the tables returned by :meth:`_get_tables` and are executed by the
+    backend in :meth:`_execute_statements`.
+    """
+
+    @abc.abstractmethod
+    def _get_tables(self):
+        """Return the SQLAlchemy tables of the nodes and of the nodes of the groups.
+
+        :return: tuple of the table of the nodes and the table of the nodes of the groups
+        """
+
+    @abc.abstractmethod
+    def _execute_statements(self, *statements):
+        """Execute the given statements in a single transaction.
+
+        :param statements: SQLAlchemy Core statements
+        :return: list with the number of rows affected by each statement
+        """
+
+    def add_nodes_by_id(self, node_ids):
+        """Add the nodes with the given ids to the group with a single ``INSERT ... SELECT`` statement.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids, where ids
+            that do not correspond to a node are ignored
+        :return: the number of nodes that were added, excluding those that were already in the group
+        """
+        super().add_nodes_by_id(node_ids)
+        return self._execute_statements(self._insert_node_ids(node_ids))[0]
+
+    def remove_nodes_by_id(self, node_ids):
+        """Remove the nodes with the given ids from the group with a single ``DELETE`` statement.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: the number of nodes that were removed
+        """
+        super().remove_nodes_by_id(node_ids)
+        return self._execute_statements(self._delete_node_ids(node_ids))[0]
+
+    def sync_nodes_by_id(self, node_ids):
+        """Make the nodes with the given ids the only nodes of the group, with one ``DELETE`` and one ``INSERT``.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids, where ids
+            that do not correspond to a node are ignored
+        :return: tuple of the number of nodes that were added and the number of nodes that were removed
+        """
+        super().sync_nodes_by_id(node_ids)
+        removed, added = self._execute_statements(
+            self._delete_node_ids(node_ids, complement=True), self._insert_node_ids(node_ids)
+        )
+        return added, removed
+
+    def _select_node_ids(self, node_ids):
+        """Return a selectable with a single column with the given node ids.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: the selectable
+        :raises ValueError: if the query selects more than one column
+        """
+        # pylint: disable=import-error,no-name-in-module
+        from sqlalchemy import Integer, any_, bindparam, select
+        from sqlalchemy.dialects.postgresql import ARRAY
+        from sqlalchemy.orm import Query
+
+        if isinstance(node_ids, Query):
+            selectable = node_ids.subquery()
+        else:
+            table_nodes, _ = self._get_tables()
+            node_ids = bindparam('node_ids', [int(node_id) for node_id in node_ids], type_=ARRAY(Integer))
+            selectable = select([table_nodes.c.id]).where(table_nodes.c.id == any_(node_ids)).alias()
+
+        if len(selectable.c) != 1:
+            raise ValueError('the query should select a single column of node ids')
+
+        return selectable
+
+    def _insert_node_ids(self, node_ids):
+        """Return the statement that inserts the rows of the nodes with the given ids into the table of the group nodes.
+
+        Rows that already exist are skipped.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :return: the statement
+        """
+        # pylint: disable=import-error,no-name-in-module
+        from sqlalchemy import literal, select
+        from sqlalchemy.dialects.postgresql import insert
+
+        _, table_groups_nodes = self._get_tables()
+        column = list(self._select_node_ids(node_ids).c)[0]
+        rows = select([literal(self.id), column]).distinct()
+        statement = insert(table_groups_nodes).from_select(['dbgroup_id', 'dbnode_id'], rows)
+        return statement.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id'])
+
+    def _delete_node_ids(self, node_ids, complement=False):
+        """Return the statement that deletes the rows of the nodes with the given ids from the table of the group nodes.
+
+        :param node_ids: a list of node ids or an SQLAlchemy query that selects a single column of node ids
+        :param complement: if True, delete the rows of all the other nodes of the group instead
+        :return: the statement
+        """
+        # pylint: disable=import-error,no-name-in-module
+        from sqlalchemy import and_, not_, select
+
+        _, table_groups_nodes = self._get_tables()
+        column = list(self._select_node_ids(node_ids).c)[0]
+        condition = table_groups_nodes.c.dbnode_id.in_(select([column]))
+
+        if complement:
+            condition = not_(condition)
+
+        return table_groups_nodes.delete().where(and_(table_groups_nodes.c.dbgroup_id == self.id, condition))
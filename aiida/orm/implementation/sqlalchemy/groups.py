@@ -17,7 +17,8 @@ from aiida.backends.sqlalchemy.models.group import DbGroup, table_groups_nodes
 from aiida.backends.sqlalchemy.models.node import DbNode
 from aiida.common.exceptions import UniquenessError
 from aiida.common.lang import type_check
-from aiida.orm.implementation.groups import BackendGroup, BackendGroupCollection
+from aiida.orm.implementation.groups import BackendGroupCollection
+from aiida.orm.implementation.sql.groups import SqlBackendGroup
 from . import entities
 from . import users
 from . import utils
@@ -29,7 +30,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # Unfortunately the linter doesn't seem to be able to pick up on the fact that the abstract property 'id'
 # of BackendGroup is actually implemented in SqlaModelEntity so disable the abstract check
-class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: disable=abstract-method
+class SqlaGroup(entities.SqlaModelEntity[DbGroup], SqlBackendGroup):  # pylint: disable=abstract-method
     """The SQLAlchemy Group object"""
 
     MODEL_CLASS = DbGroup
@@ -260,6 +261,31 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
 
         sa.get_scoped_session().commit()
 
+    def _get_tables(self):
+        """Return the SQLAlchemy tables of the nodes and of the nodes of the groups.
+
+        :return: tuple of the table of the nodes and the table of the nodes of the groups
+        """
+        return DbNode.__table__, table_groups_nodes
+
+    def _execute_statements(self, *statements):
+        """Execute the given statements in a single transaction through the scoped session.
+
+        :param statements: SQLAlchemy Core statements
+        :return: list with the number of rows affected by each statement
+        """
+        session = sa.get_scoped_session()
+
+        try:
+            rowcounts = [session.execute(statement).rowcount for statement in statements]
+        except Exception:
+            session.rollback()
+            raise
+        else:
+            session.commit()
+
+        return rowcounts
+
 
 class SqlaGroupCollection(BackendGroupCollection):
     """The SLQA collection of groups"""
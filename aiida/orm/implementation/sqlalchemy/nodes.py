@@ -11,6 +11,7 @@
 
 # pylint: disable=no-name-in-module,import-error
 from datetime import datetime
+from sqlalchemy.orm import defer
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -178,7 +179,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the attribute does not exist
         """
         try:
-            return self._dbmodel.attributes[key]
+            return self._dbmodel.get_json_value('attributes', key)
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
 
@@ -326,7 +327,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the extra does not exist
         """
         try:
-            return self._dbmodel.extras[key]
+            return self._dbmodel.get_json_value('extras', key)
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
 
@@ -447,7 +448,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
 
     def _flush_if_stored(self):
         if self._dbmodel.is_saved():
+            from aiida.orm.utils.loaders import evict_from_identity_map
             self._dbmodel.save()
+            evict_from_identity_map([self.id])
 
     def add_incoming(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
@@ -532,9 +535,11 @@ class SqlaNodeCollection(BackendNodeCollection):
         :param pk: id of the node
         """
         session = get_scoped_session()
+        # The attributes and extras are only loaded once they are accessed
+        query = session.query(models.DbNode).options(defer(models.DbNode.attributes), defer(models.DbNode.extras))
 
         try:
-            return self.ENTITY_CLASS.from_dbmodel(session.query(models.DbNode).filter_by(id=pk).one(), self.backend)
+            return self.ENTITY_CLASS.from_dbmodel(query.filter_by(id=pk).one(), self.backend)
         except NoResultFound:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
 
@@ -550,3 +555,93 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def bulk_store(self, nodes, links=(), with_transaction=True):
+        """Store multiple new nodes and links with multi-row inserts in a single transaction.
+
+        The session would insert the nodes one by one, since it needs the primary key of each, so the rows are inserted
+        directly with a multi-row insert instead, after which the models are added to the session as persistent models.
+
+        :param nodes: list of unstored `BackendNode` instances, whose values should already be cleaned
+        :param links: iterable of tuples of the source node, the target node, the link type and the link label, where
+            each node is either stored already or one of `nodes`
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :raise aiida.common.IntegrityError: if the nodes or links violate a constraint of the database, in which case
+            none of them is stored
+        """
+        from sqlalchemy.exc import IntegrityError
+        from sqlalchemy.orm import make_transient_to_detached
+        from aiida.manage.configuration import get_config_option
+
+        batch_size = get_config_option('db.batch_size')
+        table = models.DbNode.__table__
+        columns = [column for column in table.columns if not column.primary_key]
+        dbmodels = [node.dbmodel for node in nodes]
+        rows = []
+
+        for dbmodel in dbmodels:
+            # Set the defaults and foreign keys that would otherwise be set by the session when flushing the model
+            for column in columns:
+                if getattr(dbmodel, column.key) is None and column.default is not None:
+                    default = column.default
+                    setattr(dbmodel, column.key, default.arg(None) if default.is_callable else default.arg)
+
+            dbmodel.user_id = dbmodel.user.id
+            dbmodel.dbcomputer_id = dbmodel.dbcomputer.id if dbmodel.dbcomputer is not None else None
+            rows.append({column.key: getattr(dbmodel, column.key) for column in columns})
+
+        # The models are only marked as stored once the transaction has been committed, so they can be stored again if
+        # it fails, therefore the primary keys are tracked separately until then
+        pks = {}
+
+        def get_id(node):
+            return pks.get(str(node.dbmodel.uuid), node.id)
+
+        session = get_scoped_session()
+
+        try:
+            with self._transaction(with_transaction):
+                for start in range(0, len(rows), batch_size):
+                    statement = table.insert().values(rows[start:start + batch_size])
+                    result = session.execute(statement.returning(table.c.id, table.c.uuid))
+                    pks.update((str(uuid), pk) for pk, uuid in result)
+
+                link_rows = [{
+                    'input_id': get_id(source),
+                    'output_id': get_id(target),
+                    'type': link_type.value,
+                    'label': label,
+                } for source, target, link_type, label in links]
+
+                for start in range(0, len(link_rows), batch_size):
+                    session.execute(models.DbLink.__table__.insert().values(link_rows[start:start + batch_size]))
+        except IntegrityError as exception:
+            raise exceptions.IntegrityError('failed to store the nodes: {}'.format(exception))
+
+        for dbmodel in dbmodels:
+            dbmodel.id = pks[str(dbmodel.uuid)]
+            make_transient_to_detached(dbmodel)
+            session.add(dbmodel)
+
+    def bulk_set_extra(self, key, values):
+        """Set an extra of multiple stored nodes with a single query, leaving their other extras untouched.
+
+        :param key: the key of the extra
+        :param values: dictionary mapping the id of each node onto the value of the extra, which should already be
+            cleaned with `clean_value`
+        """
+        from sqlalchemy.sql import text
+        from aiida.common import json
+
+        type_check(key, str)
+
+        if not values:
+            return
+
+        statement = text(
+            'UPDATE db_dbnode SET extras = jsonb_set(COALESCE(extras, CAST(:empty AS jsonb)), :path, data.value) '
+            'FROM jsonb_each(CAST(:values AS jsonb)) AS data (id, value) WHERE db_dbnode.id = CAST(data.id AS INTEGER)'
+        )
+
+        with self.backend.transaction() as session:
+            session.execute(statement, {'empty': '{}', 'path': [key], 'values': json.dumps(values)})
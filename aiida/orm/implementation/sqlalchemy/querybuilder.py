@@ -307,8 +307,18 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if column is None:
             column = self.get_column(column_name, alias)
 
-        database_entity = column[tuple(attr_key)]
-        if operator == '==':
+        # Top-level keys are addressed with the `->` operator, such that expression indexes on `column ->> 'key'`, like
+        # the one on the `_aiida_hash` extra, can be used for the comparison of string values
+        if len(attr_key) == 1:
+            database_entity = column[attr_key[0]]
+        else:
+            database_entity = column[tuple(attr_key)]
+
+        if operator == '==' and isinstance(value, str):
+            # The redundant comparison outside of the `CASE` is what allows the query planner to use an index
+            type_filter, casted_entity = cast_according_to_type(database_entity, value)
+            expr = and_(casted_entity == value, case([(type_filter, casted_entity == value)], else_=False))
+        elif operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity == value)], else_=False)
         elif operator == '>':
@@ -339,6 +349,10 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         elif operator == 'ilike':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity.ilike(value))], else_=False)
+        elif operator == 'in' and isinstance(value[0], str):
+            # The redundant comparison outside of the `CASE` is what allows the query planner to use an index
+            type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
+            expr = and_(casted_entity.in_(value), case([(type_filter, casted_entity.in_(value))], else_=False))
         elif operator == 'in':
             type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
             expr = case([(type_filter, casted_entity.in_(value))], else_=False)
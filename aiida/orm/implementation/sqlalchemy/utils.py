@@ -79,6 +79,30 @@ class ModelWrapper:
             fields = set((key,) + self._auto_flush)
             self._flush(fields=fields)
 
+    def get_json_value(self, field, key):
+        """Return the value of a key of a JSON field of the model instance.
+
+        If the model is saved, the field is mutable and the current scope is not in an open database transaction, only
+        the value of the key is fetched from the database, instead of the entire field as for `getattr`.
+
+        :param field: the name of the JSON model field
+        :param key: the key in the JSON field
+        :return: the value of the key
+        :raises KeyError: if the key does not exist
+        """
+        if not self.is_saved() or not self._is_mutable_model_field(field) or self._in_transaction():
+            return getattr(self._model, field)[key]
+
+        model_class = self._model.__class__
+        column = getattr(model_class, field)
+        query = self._model.session.query(column.has_key(key), column[key]).filter(model_class.id == self._model.id)
+        exists, value = query.one()
+
+        if not exists:
+            raise KeyError(key)
+
+        return value
+
     def is_saved(self):
         """Retun whether the wrapped model instance is saved in the database.
 
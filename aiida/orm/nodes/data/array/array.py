@@ -11,8 +11,44 @@
 AiiDA ORM data class storing (numpy) arrays
 """
 
+from collections import namedtuple
+
+from aiida.common.datastructures import LRUCache
+
 from ..data import Data
 
+# Process-wide cache of the arrays of stored nodes, which is created upon first use such that its size is determined
+# by the configuration of the profile that is loaded at that point
+_ARRAY_CACHE = None
+
+
+def get_array_cache():
+    """Return the process-wide cache of the arrays of stored `ArrayData` nodes.
+
+    The cache is keyed on the UUID of the node and the name of the array, followed by ``'chunks'`` for the last range of
+    chunks that was read from an array in the chunked format, and its total size in bytes is bounded by the
+    `arraydata.cache_size` configuration option.
+
+    :return: the array cache
+    :rtype: :class:`aiida.common.datastructures.LRUCache`
+    """
+    global _ARRAY_CACHE  # pylint: disable=global-statement
+
+    if _ARRAY_CACHE is None:
+        from aiida.manage.configuration import get_config_option
+        _ARRAY_CACHE = LRUCache(maxsize=get_config_option('arraydata.cache_size'), sizeof=lambda array: array.nbytes)
+
+    return _ARRAY_CACHE
+
+
+class CachedChunks(namedtuple('CachedChunks', ['first', 'last', 'array'])):
+    """Range of chunks of an array in the chunked format, which is kept in the array cache after being decompressed."""
+
+    @property
+    def nbytes(self):
+        """Return the number of bytes of the decompressed chunks, which is their size in the array cache."""
+        return self.array.nbytes
+
 
 class ArrayData(Data):
     """
@@ -21,21 +57,51 @@ class ArrayData(Data):
     installed).
 
     Each array is stored within the Node folder as a different .npy file.
+    Large arrays can optionally be stored in a chunked format, by passing
+    ``chunk_size`` to :py:meth:`.set_array`: the array is split in chunks along
+    its first axis, that are compressed independently in a single .npz file,
+    such that a slice of the array can be read with :py:meth:`.get_array_slice`
+    by decompressing only the chunks that contain it.
 
     :note: Before storing, no caching is done: if you perform a
       :py:meth:`.get_array` call, the array will be re-read from disk.
       If instead the ArrayData node has already been stored,
-      the array is cached in memory after the first read, and the cached array
-      is used thereafter.
-      If too much RAM memory is used, you can clear the
+      the array is cached in memory after the first read, in a cache that
+      is shared by all nodes in the process and whose size is bounded by the
+      ``arraydata.cache_size`` configuration option. Cached arrays are
+      therefore read-only. The arrays of a node can be removed from the
       cache with the :py:meth:`.clear_internal_cache` method.
+      Alternatively, arrays can be memory-mapped, by passing ``mmap=True``
+      to :py:meth:`.get_array`, in which case they are never cached.
     """
     array_prefix = 'array|'
-    _cached_arrays = None
+    chunk_size_prefix = 'array_chunk_size|'
+    _array_extensions = ('.npy', '.npz')
+
+    def _get_array_filename(self, name):
+        """
+        Return the name of the file in the repository in which an array is stored.
+
+        :param name: The name of the array.
+        :raises KeyError: if no array with the given name exists.
+        """
+        object_names = self.list_object_names()
 
-    def initialize(self):
-        super().initialize()
-        self._cached_arrays = {}
+        for extension in self._array_extensions:
+            filename = '{}{}'.format(name, extension)
+            if filename in object_names:
+                return filename
+
+        raise KeyError('Array with name `{}` not found in ArrayData<{}>'.format(name, self.pk))
+
+    def get_chunk_size(self, name):
+        """
+        Return the number of rows per chunk of an array stored in the chunked
+        format, or None if the array is not chunked.
+
+        :param name: The name of the array.
+        """
+        return self.get_attribute('{}{}'.format(self.chunk_size_prefix, name), None)
 
     def delete_array(self, name):
         """
@@ -43,17 +109,19 @@ class ArrayData(Data):
 
         :param name: The name of the array to delete from the node.
         """
-        fname = '{}.npy'.format(name)
-        if fname not in self.list_object_names():
+        try:
+            fname = self._get_array_filename(name)
+        except KeyError:
             raise KeyError("Array with name '{}' not found in node pk= {}".format(name, self.pk))
 
-        # remove both file and attribute
+        # remove both file and attributes
         self.delete_object(fname)
-        try:
-            self.delete_attribute('{}{}'.format(self.array_prefix, name))
-        except (KeyError, AttributeError):
-            # Should not happen, but do not crash if for some reason the property was not set.
-            pass
+        for prefix in [self.array_prefix, self.chunk_size_prefix]:
+            try:
+                self.delete_attribute('{}{}'.format(prefix, name))
+            except (KeyError, AttributeError):
+                # Should not happen, but do not crash if for some reason the property was not set.
+                pass
 
     def get_arraynames(self):
         """
@@ -70,7 +138,7 @@ class ArrayData(Data):
         Return a list of all arrays stored in the node, listing the files (and
         not relying on the properties).
         """
-        return [i[:-4] for i in self.list_object_names() if i.endswith('.npy')]
+        return [i[:-4] for i in self.list_object_names() if i.endswith(self._array_extensions)]
 
     def _arraynames_from_properties(self):
         """
@@ -98,53 +166,218 @@ class ArrayData(Data):
         for name in self.get_arraynames():
             yield (name, self.get_array(name))
 
-    def get_array(self, name):
+    def get_array(self, name, mmap=None):
         """
         Return an array stored in the node
 
         :param name: The name of the array to return.
+        :param mmap: if True, return a read-only memory-mapped view of the array
+            in the repository instead of reading it into memory. If not
+            specified, the ``arraydata.mmap`` configuration option is used.
         """
         import numpy
+        from aiida.manage.configuration import get_config_option
 
         def get_array_from_file(self, name):
-            """Return the array stored in a .npy file"""
-            filename = '{}.npy'.format(name)
+            """Return the array stored in a .npy file, or the concatenated chunks stored in a .npz file"""
+            filename = self._get_array_filename(name)
 
-            if filename not in self.list_object_names():
-                raise KeyError('Array with name `{}` not found in ArrayData<{}>'.format(name, self.pk))
+            if filename.endswith('.npz'):
+                return self._get_array_chunks(name, 0, self._get_num_chunks(name))
 
             # Open a handle in binary read mode as the arrays are written as binary files as well
             with self.open(filename, mode='rb') as handle:
                 return numpy.load(handle, allow_pickle=False)  # pylint: disable=unexpected-keyword-arg
 
+        if mmap is None:
+            mmap = get_config_option('arraydata.mmap')
+
+        # Chunked arrays are compressed and so cannot be memory-mapped
+        if mmap and self.get_chunk_size(name) is None:
+            return self._get_array_memmap(name)
+
         # Return with proper caching if the node is stored, otherwise always re-read from disk
         if not self.is_stored:
             return get_array_from_file(self, name)
 
-        if name not in self._cached_arrays:
-            self._cached_arrays[name] = get_array_from_file(self, name)
+        cache = get_array_cache()
+        array = cache.get((self.uuid, name))
+
+        if array is None:
+            array = get_array_from_file(self, name)
+            array.flags.writeable = False
+            cache.set((self.uuid, name), array)
+
+        return array
+
+    def get_array_slice(self, name, start=None, stop=None):
+        """
+        Return the rows ``start`` to ``stop`` along the first axis of an array
+        stored in the node, reading only the necessary data from disk.
+
+        For an array stored in the chunked format, only the chunks containing
+        the requested rows are decompressed, otherwise the rows are read from a
+        memory-mapped view of the array. If the whole array is already in the
+        memory cache, the slice is taken from there. For stored nodes, the
+        last range of chunks that was decompressed is kept in the memory cache
+        as well, such that reading consecutive rows decompresses each chunk
+        only once.
 
-        return self._cached_arrays[name]
+        :param name: The name of the array.
+        :param start: The index of the first row, following the semantics of a
+            Python slice.
+        :param stop: The index after the last row, following the semantics of
+            a Python slice.
+        :return: a copy of the requested rows as a numpy array.
+        """
+        import numpy
+
+        if self.is_stored:
+            array = get_array_cache().get((self.uuid, name))
+            if array is not None:
+                return numpy.array(array[start:stop])
+
+        chunk_size = self.get_chunk_size(name)
+
+        if chunk_size is None:
+            return numpy.array(self._get_array_memmap(name)[start:stop])
+
+        start, stop, _ = slice(start, stop).indices(self.get_shape(name)[0])
+        stop = max(start, stop)
+        first_chunk = start // chunk_size
+        last_chunk = max(first_chunk, (stop - 1) // chunk_size)
+
+        chunks = self._get_cached_chunks(name, first_chunk, last_chunk + 1)
+        offset = chunks.first * chunk_size
+
+        return numpy.array(chunks.array[start - offset:stop - offset])
+
+    def _get_num_chunks(self, name):
+        """
+        Return the number of chunks of an array stored in the chunked format.
+
+        :param name: The name of the array.
+        """
+        num_rows = self.get_shape(name)[0]
+        chunk_size = self.get_chunk_size(name)
+
+        return max(1, -(-num_rows // chunk_size))
+
+    def _get_array_chunks(self, name, first, last):
+        """
+        Return the concatenation of a range of chunks of an array stored in the chunked format.
+
+        :param name: The name of the array.
+        :param first: The index of the first chunk.
+        :param last: The index after the last chunk.
+        """
+        import numpy
+
+        with self.open('{}.npz'.format(name), mode='rb') as handle:
+            with numpy.load(handle, allow_pickle=False) as chunks:
+                return numpy.concatenate([chunks[self._get_chunk_key(index)] for index in range(first, last)])
+
+    def _get_cached_chunks(self, name, first, last):
+        """
+        Return a range of chunks of an array stored in the chunked format,
+        from the memory cache if it contains the last range of chunks of the
+        array that was read and that range includes the requested one.
+
+        :param name: The name of the array.
+        :param first: The index of the first chunk.
+        :param last: The index after the last chunk.
+        :return: a :py:class:`CachedChunks` tuple, whose chunks include the
+            requested range, but may start before it.
+        """
+        key = (self.uuid, name, 'chunks')
+
+        if self.is_stored:
+            chunks = get_array_cache().get(key)
+            if chunks is not None and chunks.first <= first and last <= chunks.last:
+                return chunks
+
+        chunks = CachedChunks(first, last, self._get_array_chunks(name, first, last))
+
+        if self.is_stored:
+            chunks.array.flags.writeable = False
+            get_array_cache().set(key, chunks)
+
+        return chunks
+
+    @staticmethod
+    def _get_chunk_key(index):
+        """Return the name of the member of the .npz file that contains the chunk with the given index."""
+        return 'chunk_{:08d}'.format(index)
+
+    def _get_array_memmap(self, name):
+        """
+        Return a read-only memory-mapped view of an array stored in the node.
+
+        :param name: The name of the array to return.
+        """
+        import numpy
+        import numpy.lib.format
+
+        filename = self._get_array_filename(name)
+
+        if filename.endswith('.npz'):
+            raise ValueError(
+                'Array with name `{}` is stored in the chunked format and cannot be memory-mapped'.format(name)
+            )
+
+        filepath, offset = self._repository.get_object_location(filename)  # pylint: disable=protected-access
+
+        with open(filepath, 'rb') as handle:
+            handle.seek(offset)
+            version = numpy.lib.format.read_magic(handle)
+
+            if version == (1, 0):
+                shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(handle)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(handle)
+            else:
+                # There is no public reader for later versions, such as 3.0, whose header is encoded in utf-8
+                read_array_header = numpy.lib.format._read_array_header  # pylint: disable=protected-access
+                shape, fortran_order, dtype = read_array_header(handle, version)
+
+            data_offset = handle.tell()
+
+        # A file region of zero bytes cannot be memory-mapped
+        if numpy.prod(shape, dtype=numpy.int64) == 0:
+            array = numpy.empty(shape, dtype=dtype)
+            array.flags.writeable = False
+            return array
+
+        order = 'F' if fortran_order else 'C'
+        return numpy.memmap(filepath, dtype=dtype, mode='r', offset=data_offset, shape=shape, order=order)
 
     def clear_internal_cache(self):
         """
-        Clear the internal memory cache where the arrays are stored after being
-        read from disk (used in order to reduce at minimum the readings from
-        disk).
+        Remove the arrays of this node from the memory cache where the arrays
+        are stored after being read from disk (used in order to reduce at
+        minimum the readings from disk).
         This function is useful if you want to keep the node in memory, but you
         do not want to waste memory to cache the arrays in RAM.
         """
-        self._cached_arrays = {}
+        cache = get_array_cache()
+
+        for name in self.get_arraynames():
+            cache.pop((self.uuid, name))
+            cache.pop((self.uuid, name, 'chunks'))
 
-    def set_array(self, name, array):
+    def set_array(self, name, array, chunk_size=None):
         """
         Store a new numpy array inside the node. Possibly overwrite the array
         if it already existed.
 
-        Internally, it stores a name.npy file in numpy format.
+        Internally, it stores a name.npy file in numpy format, or, if
+        ``chunk_size`` is specified, a name.npz file in which each chunk of
+        ``chunk_size`` rows along the first axis is compressed independently.
 
         :param name: The name of the array.
         :param array: The numpy array to store.
+        :param chunk_size: optional number of rows per chunk, to store the array
+            in the chunked format.
         """
         import re
         import tempfile
@@ -160,20 +393,43 @@ class ArrayData(Data):
                 'it can only contain digits, letters and underscores'
             )
 
+        if chunk_size is not None and (not array.shape or int(chunk_size) < 1):
+            raise ValueError('Only arrays with at least one dimension can be chunked, with a positive chunk size')
+
+        # Remove the array first, since it may be stored in the other format, in which case it would not be overwritten
+        try:
+            self.delete_array(name)
+        except KeyError:
+            pass
+
         # Write the array to a temporary file, and then add it to the repository of the node
         with tempfile.NamedTemporaryFile() as handle:
-            numpy.save(handle, array, allow_pickle=False)
+            if chunk_size is None:
+                filename = '{}.npy'.format(name)
+                numpy.save(handle, array, allow_pickle=False)
+            else:
+                filename = '{}.npz'.format(name)
+                chunk_size = int(chunk_size)
+                numpy.savez_compressed(
+                    handle, **{
+                        self._get_chunk_key(index): array[start:start + chunk_size]
+                        for index, start in enumerate(range(0, max(1, array.shape[0]), chunk_size))
+                    }
+                )
 
             # Flush and rewind the handle, otherwise the command to store it in the repo will write an empty file
             handle.flush()
             handle.seek(0)
 
             # Write the numpy array to the repository, keeping the byte representation
-            self.put_object_from_filelike(handle, '{}.npy'.format(name), mode='wb', encoding=None)
+            self.put_object_from_filelike(handle, filename, mode='wb', encoding=None)
 
         # Store the array name and shape for querying purposes
         self.set_attribute('{}{}'.format(self.array_prefix, name), list(array.shape))
 
+        if chunk_size is not None:
+            self.set_attribute('{}{}'.format(self.chunk_size_prefix, name), chunk_size)
+
     def _validate(self):
         """
         Check if the list of .npy files stored inside the node and the
@@ -79,7 +79,16 @@ class TrajectoryData(ArrayData):
                     'with s=number of steps and n=number of symbols'
                 )
 
-    def set_trajectory(self, symbols, positions, stepids=None, cells=None, times=None, velocities=None):  # pylint: disable=too-many-arguments
+    def set_trajectory(
+        self,
+        symbols,
+        positions,
+        stepids=None,
+        cells=None,
+        times=None,
+        velocities=None,
+        chunk_size=None
+    ):  # pylint: disable=too-many-arguments
         r"""
         Store the whole trajectory, after checking that types and dimensions
         are correct.
@@ -128,6 +137,11 @@ class TrajectoryData(ArrayData):
         :param velocities: if specified, must be a float array with the same
                       dimensions of the ``positions`` array.
                       The array contains the velocities in the atoms.
+        :param chunk_size: if specified, the ``positions``, ``cells`` and
+                      ``velocities`` arrays are stored in the chunked format
+                      with ``chunk_size`` steps per chunk, such that single
+                      steps can be read without loading the whole trajectory
+                      (see :py:meth:`~aiida.orm.ArrayData.set_array`).
 
         .. todo :: Choose suitable units for velocities
         """
@@ -137,13 +151,13 @@ class TrajectoryData(ArrayData):
         self._internal_validate(stepids, cells, symbols, positions, times, velocities)
         # set symbols as attribute for easier querying
         self.set_attribute('symbols', list(symbols))
-        self.set_array('positions', positions)
+        self.set_array('positions', positions, chunk_size=chunk_size)
         if stepids is not None:  # use input stepids
             self.set_array('steps', stepids)
         else:  # use consecutive sequence if not given
             self.set_array('steps', numpy.arange(positions.shape[0]))
         if cells is not None:
-            self.set_array('cells', cells)
+            self.set_array('cells', cells, chunk_size=chunk_size)
         else:
             # Delete cells array, if it was present
             try:
@@ -159,7 +173,7 @@ class TrajectoryData(ArrayData):
             except KeyError:
                 pass
         if velocities is not None:
-            self.set_array('velocities', velocities)
+            self.set_array('velocities', velocities, chunk_size=chunk_size)
         else:
             # Delete velocities array, if it was present
             try:
@@ -327,6 +341,9 @@ class TrajectoryData(ArrayData):
 
         If no velocities were specified, None is returned as the last element.
 
+        Only the data of the requested step is read from the repository, see
+        :py:meth:`~aiida.orm.ArrayData.get_array_slice`.
+
         :return: A tuple in the format
           ``(stepid, time, cell, symbols, positions, velocities)``,
           where ``stepid`` is an integer, ``time`` is a float, ``cell`` is a
@@ -339,22 +356,26 @@ class TrajectoryData(ArrayData):
         :raises IndexError: if you require an index beyond the limits.
         :raises KeyError: if you did not store the trajectory yet.
         """
-        if index >= self.numsteps:
-            raise IndexError(
-                'You have only {} steps, but you are looking beyond'
-                ' (index={})'.format(self.numsteps, index)
-            )
+        numsteps = self.numsteps
 
-        vel = self.get_velocities()
-        if vel is not None:
-            vel = vel[index, :, :]
-        time = self.get_times()
-        if time is not None:
-            time = time[index]
-        cells = self.get_cells()
-        if cells is not None:
-            cell = cells[index, :, :]
-        return (self.get_stepids()[index], time, cell, self.symbols, self.get_positions()[index, :, :], vel)
+        if index >= numsteps or index < -numsteps:
+            raise IndexError('You have only {} steps, but you are looking beyond (index={})'.format(numsteps, index))
+
+        if index < 0:
+            index += numsteps
+
+        arraynames = self.get_arraynames()
+
+        def get_step(name):
+            """Return the data of the array with the given name at the current step, or None if it is not set."""
+            if name not in arraynames:
+                return None
+            return self.get_array_slice(name, index, index + 1)[0]
+
+        return (
+            get_step('steps'), get_step('times'), get_step('cells'), self.symbols, get_step('positions'),
+            get_step('velocities')
+        )
 
     def get_step_structure(self, index, custom_kinds=None):
         """
@@ -379,11 +400,23 @@ class TrajectoryData(ArrayData):
           meaning that the strings in the ``symbols`` array must be valid
           chemical symbols.
         """
-        from aiida.orm.nodes.data.structure import StructureData, Kind, Site
-
         # ignore step, time, and velocities
         _, _, cell, symbols, positions, _ = self.get_step_data(index)
 
+        return self._get_structure(cell, symbols, positions, custom_kinds)
+
+    @staticmethod
+    def _get_structure(cell, symbols, positions, custom_kinds=None):
+        """
+        Return an unstored :py:class:`aiida.orm.nodes.data.structure.StructureData`
+        node with the given cell, symbols and positions of a step.
+
+        :param custom_kinds: (Optional) list of
+          :py:class:`aiida.orm.nodes.data.structure.Kind` objects, see
+          :py:meth:`.get_step_structure`.
+        """
+        from aiida.orm.nodes.data.structure import StructureData, Kind, Site
+
         if custom_kinds is not None:
             kind_names = []
             for k in custom_kinds:
@@ -463,11 +496,20 @@ class TrajectoryData(ArrayData):
         from aiida.common.utils import Capturing
 
         cif = ''
-        indices = list(range(self.numsteps))
+
         if trajectory_index is not None:
-            indices = [trajectory_index]
-        for idx in indices:
-            structure = self.get_step_structure(idx)
+            structures = [self.get_step_structure(trajectory_index)]
+        else:
+            # Read the arrays of the whole trajectory once, instead of the data of each step separately
+            cells = self.get_cells()
+            positions = self.get_positions()
+            symbols = self.symbols
+            structures = (
+                self._get_structure(None if cells is None else cells[idx], symbols, positions[idx])
+                for idx in range(self.numsteps)
+            )
+
+        for structure in structures:
             ciffile = pycifrw_from_cif(cif_from_ase(structure.get_ase()), ase_loops)
             with Capturing():
                 cif = cif + ciffile.WriteOut()
@@ -11,6 +11,7 @@
 """Package for node ORM classes."""
 import copy
 import importlib
+import time
 import warnings
 
 from aiida.common import exceptions
@@ -19,9 +20,11 @@ from aiida.common.hashing import make_hash, _HASH_EXTRA_KEY
 from aiida.common.lang import classproperty, type_check
 from aiida.common.links import LinkType
 from aiida.common.warnings import AiidaDeprecationWarning
+from aiida.manage.configuration import get_config_option
 from aiida.manage.manager import get_manager
 from aiida.orm.utils.links import LinkManager, LinkTriple
-from aiida.orm.utils.repository import Repository
+from aiida.orm.utils.loaders import evict_from_identity_map
+from aiida.orm.utils.repository import Repository, get_digest_cache
 from aiida.orm.utils.node import AbstractNodeMeta, validate_attribute_extra_key
 from aiida.orm import autogroup
 
@@ -80,8 +83,201 @@ class Node(Entity, metaclass=AbstractNodeMeta):
 
             repository = node._repository  # pylint: disable=protected-access
             self._backend.nodes.delete(node_id)
+            evict_from_identity_map([node_id])
             repository.erase(force=True)
 
+        def bulk_store(self, nodes, with_transaction=True):
+            """Store multiple new nodes and the links in their incoming link caches in a single transaction.
+
+            Storing a node with its ``store`` method inserts it and each of its links with separate queries and commits.
+            Instead, the nodes are validated and their repository folders are written as by ``store``, after which all
+            nodes and links are inserted with multi-row inserts. This is much faster for many small nodes, like the many
+            outputs of a parser. The source node of each link either has to be stored already or be one of the nodes.
+
+            Nodes that have a valid cache source, and nodes whose class overrides ``store``, are stored afterwards by
+            calling their ``store`` method, which means other nodes can have links from them only if these are stored.
+
+            :param nodes: list of nodes, of which those that are already stored are ignored
+            :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+            :return: the list of nodes
+            :raise aiida.common.ModificationNotAllowed: if the source node of a link is not stored and not in the list
+            :raise aiida.common.IntegrityError: if the nodes or links violate a constraint of the database, in which
+                case none of them is stored
+            """
+            # pylint: disable=protected-access
+            nodes = list(nodes)
+            unstored = list({id(node): node for node in nodes if not node.is_stored}.values())
+            sources = self.find_cache_sources(unstored)
+            bulk = [
+                node for node, source in zip(unstored, sources)
+                if source is None and type(node).store is Node.store  # pylint: disable=comparison-with-callable
+            ]
+            pending = {id(node) for node in bulk}
+
+            for node in bulk:
+                node.validate_storability()
+                node._validate()
+
+                for link_triple in node._incoming_cache:
+                    if not link_triple.node.is_stored and id(link_triple.node) not in pending:
+                        raise exceptions.ModificationNotAllowed(
+                            'Cannot store because source node of link triple {} is not stored'.format(link_triple)
+                        )
+
+                node._backend_entity.clean_values()
+
+            stored_repositories = []
+
+            try:
+                for node in bulk:
+                    node._repository.store()
+                    stored_repositories.append(node._repository)
+                    # The node is not stored yet, so the hash is set before the insert instead of with a separate query
+                    node._backend_entity.set_extra(_HASH_EXTRA_KEY, node._get_hash())
+
+                links = [
+                    (triple.node.backend_entity, node.backend_entity, triple.link_type, triple.link_label)
+                    for node in bulk
+                    for triple in node._incoming_cache
+                ]
+                self._backend.nodes.bulk_store([node.backend_entity for node in bulk], links, with_transaction)
+            except Exception:
+                # Put back the files in the sandbox folders since the nodes were not stored
+                for repository in stored_repositories:
+                    repository.restore()
+                raise
+
+            for node in bulk:
+                node._incoming_cache = list()
+
+            if autogroup.CURRENT_AUTOGROUP is not None:
+                grouped = [node for node in bulk if autogroup.CURRENT_AUTOGROUP.is_to_be_grouped(node)]
+                if grouped:
+                    autogroup.CURRENT_AUTOGROUP.add_nodes(grouped)
+
+            for node in unstored:
+                if not node.is_stored:
+                    node.store(with_transaction)
+
+            return nodes
+
+        def add_links(self, links):
+            """Add multiple links between nodes, validating all of them at once.
+
+            Adding the links one by one with ``add_incoming`` queries the database multiple times for each link to
+            validate it and inserts each link separately. Instead, the checks of ``validate_incoming`` of each target
+            and ``validate_outgoing`` of each source are first performed for the links by themselves, after which the
+            links are validated against the existing links and each other with a few queries in total. Links between
+            stored nodes are then inserted with a single statement, while the others are added to the incoming link
+            cache of their target, as by ``add_incoming``.
+
+            :param links: list of tuples of the source node, the target node, the link type and the link label
+            :raise TypeError: if a source or target is not a Node instance, or a link type is not a `LinkType` enum
+            :raise ValueError: if any of the proposed links is invalid, in which case none of them is added
+            """
+            from aiida.orm.utils.links import defer_validation, validate_links
+
+            links = [tuple(link) for link in links]
+
+            with defer_validation():
+                for source, target, link_type, link_label in links:
+                    target.validate_incoming(source, link_type, link_label)
+                    source.validate_outgoing(target, link_type, link_label)
+
+            validate_links(links)
+
+            stored = []
+
+            for source, target, link_type, link_label in links:
+                if source.is_stored and target.is_stored:
+                    stored.append((source.backend_entity, target.backend_entity, link_type, link_label))
+                else:
+                    target._add_incoming_cache(source, link_type, link_label)  # pylint: disable=protected-access
+
+            if stored:
+                self._backend.nodes.bulk_store([], stored)
+
+        def rehash(self, nodes):
+            """Recompute the hashes of the given stored nodes and store them with a single query.
+
+            :param nodes: iterable of stored nodes
+            :return: the number of nodes that were rehashed
+            """
+            hashes = {node.pk: node.get_hash() for node in nodes}
+            self._backend.nodes.bulk_set_extra(_HASH_EXTRA_KEY, hashes)
+
+            return len(hashes)
+
+        def find_cache_sources(self, nodes):
+            """Resolve the cache sources of multiple unstored nodes with a single query.
+
+            The values of the nodes are cleaned and their hashes are computed, after which all nodes with any of these
+            hashes are retrieved at once. A node for which caching is disabled through the caching configuration gets no
+            cache source. The result is also recorded on each node, such that a subsequent call to its ``store`` method
+            does not need to query the database again, as long as the hash of the node did not change in the meantime.
+
+            :param nodes: list of unstored nodes
+            :return: list with for each node a stored node with the same hash that is a valid cache, or None
+            """
+            from aiida.manage.caching import get_caching_statistics, get_use_cache
+
+            hashes = []
+            hash_times = []
+
+            for node in nodes:
+                node_hash = None
+                start = time.perf_counter()
+                if not node.is_stored and node._cachable and get_use_cache(identifier=node.process_type):  # pylint: disable=protected-access
+                    node._backend_entity.clean_values()  # pylint: disable=protected-access
+                    node_hash = node._get_hash()  # pylint: disable=protected-access
+                hashes.append(node_hash)
+                hash_times.append(time.perf_counter() - start)
+
+            candidates = {}
+            unique_hashes = sorted({node_hash for node_hash in hashes if node_hash})
+            start = time.perf_counter()
+
+            if unique_hashes:
+                builder = QueryBuilder().append(
+                    self.entity_type, filters={'extras.{}'.format(_HASH_EXTRA_KEY): {'in': unique_hashes}}, project='*'
+                )
+                for candidate, in builder.iterall():
+                    candidates.setdefault(candidate.get_extra(_HASH_EXTRA_KEY), []).append(candidate)
+
+            # The time of the single query is attributed in equal parts to all nodes that were looked up
+            query_time = (time.perf_counter() - start) / max(sum(1 for node_hash in hashes if node_hash), 1)
+            statistics = get_caching_statistics()
+            sources = []
+
+            for node, node_hash, hash_time in zip(nodes, hashes, hash_times):
+                source = None
+                invalid = 0
+                start = time.perf_counter()
+
+                for candidate in candidates.get(node_hash, []):
+                    # The node type has to match exactly, consistent with the query in `Node._iter_all_same_nodes`
+                    if candidate.node_type != node.node_type:
+                        continue
+                    if candidate.is_valid_cache:
+                        source = candidate
+                        break
+                    invalid += 1
+
+                if node_hash:
+                    node._cache_lookup = (node_hash, source)  # pylint: disable=protected-access
+                    statistics.record(
+                        node.node_type,
+                        node.process_type,
+                        hit=source is not None,
+                        invalid=invalid,
+                        hash_time=hash_time,
+                        lookup_time=query_time + time.perf_counter() - start
+                    )
+
+                sources.append(source)
+
+            return sources
+
     # This will be set by the metaclass call
     _logger = None
 
@@ -106,6 +302,9 @@ class Node(Entity, metaclass=AbstractNodeMeta):
     _incoming_cache = None
     _repository = None
 
+    # Tuple of the hash and the cache source that were resolved for this unstored node by `find_cache_sources`
+    _cache_lookup = None
+
     @classmethod
     def from_backend_entity(cls, backend_entity):
         entity = super().from_backend_entity(backend_entity)
@@ -817,7 +1016,12 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         :raise TypeError: if `source` is not a Node instance or `link_type` is not a `LinkType` enum
         :raise ValueError: if the proposed link is invalid
         """
-        from aiida.orm.utils.links import validate_link
+        from aiida.orm.utils.links import is_validation_deferred, validate_link, validate_link_rules
+
+        # The checks against the other links and for cycles are then done by `validate_links` for all links at once
+        if is_validation_deferred():
+            validate_link_rules(source, self, link_type, link_label)
+            return
 
         validate_link(source, self, link_type, link_label)
 
@@ -997,9 +1201,10 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         for link_triple in self._incoming_cache:
             link_triple.node.verify_are_parents_stored()
 
-        for link_triple in self._incoming_cache:
-            if not link_triple.node.is_stored:
-                link_triple.node.store(with_transaction=with_transaction)
+        unstored = [link_triple.node for link_triple in self._incoming_cache if not link_triple.node.is_stored]
+
+        # Store all unstored incoming nodes at once, instead of one by one
+        Node.objects.bulk_store(unstored, with_transaction)
 
         return self.store(with_transaction)
 
@@ -1047,8 +1252,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
 
             # Set up autogrouping used by verdi run
             if autogroup.CURRENT_AUTOGROUP is not None and autogroup.CURRENT_AUTOGROUP.is_to_be_grouped(self):
-                group = autogroup.CURRENT_AUTOGROUP.get_or_create_group()
-                group.add_nodes(self)
+                autogroup.CURRENT_AUTOGROUP.add_nodes([self])
 
         return self
 
@@ -1132,8 +1336,12 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         """
         Return the hash for this node based on its attributes.
 
-        This will always work, even before storing.
+        This will always work, even before storing. For stored nodes, the content digests of the files in the
+        repository are cached on disk if the `hashing.digest_cache` option is enabled.
         """
+        if self.is_stored and 'digest_cache' not in kwargs and get_config_option('hashing.digest_cache'):
+            kwargs['digest_cache'] = get_digest_cache()
+
         try:
             return make_hash(self._get_objects_to_hash(), **kwargs)
         except Exception:  # pylint: disable=broad-except
@@ -1149,7 +1357,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
                 for key, val in self.attributes_items()
                 if key not in self._hash_ignored_attributes and key not in self._updatable_attributes  # pylint: disable=unsupported-membership-test
             },
-            self._repository._get_base_folder(),  # pylint: disable=protected-access
+            self._repository,
             self.computer.uuid if self.computer is not None else None
         ]
         return objects
@@ -1189,11 +1397,45 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         Note: this should be only called on stored nodes, or internally from .store() since it first calls
         clean_value() on the attributes to normalise them.
         """
-        try:
-            return next(self._iter_all_same_nodes(allow_before_store=True))
-        except StopIteration:
+        from aiida.manage.caching import get_caching_statistics
+
+        if self._cache_lookup is not None:
+            node_hash, source = self._cache_lookup
+            self._cache_lookup = None
+
+            # The result of a lookup by `find_cache_sources` can only be reused if the node was not changed since
+            if node_hash == self._get_hash():
+                return source
+
+        if not self._cachable:
             return None
 
+        start = time.perf_counter()
+        node_hash = self._get_hash()
+        hash_time = time.perf_counter() - start
+
+        source = None
+        invalid = 0
+
+        if node_hash:
+            for node in self._iter_nodes_with_hash(node_hash):
+                if node.is_valid_cache:
+                    source = node
+                    break
+                invalid += 1
+
+        lookup_time = time.perf_counter() - start - hash_time
+        get_caching_statistics().record(
+            self.node_type,
+            self.process_type,
+            hit=source is not None,
+            invalid=invalid,
+            hash_time=hash_time,
+            lookup_time=lookup_time
+        )
+
+        return source
+
     def get_all_same_nodes(self):
         """Return a list of stored nodes which match the type and hash of the current node.
 
@@ -1218,11 +1460,19 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         if not node_hash or not self._cachable:
             return iter(())
 
-        builder = QueryBuilder()
-        builder.append(self.__class__, filters={'extras._aiida_hash': node_hash}, project='*', subclassing=False)
-        nodes_identical = (n[0] for n in builder.iterall())
+        return (node for node in self._iter_nodes_with_hash(node_hash) if node.is_valid_cache)
+
+    def _iter_nodes_with_hash(self, node_hash):
+        """Return an iterator over the stored nodes of exactly the same class as this node with the given hash.
 
-        return (node for node in nodes_identical if node.is_valid_cache)
+        :param node_hash: the hash to match
+        """
+        # The equality filter on the string value of a top-level extra can use the database index on the hash extra
+        builder = QueryBuilder()
+        builder.append(
+            self.__class__, filters={'extras.{}'.format(_HASH_EXTRA_KEY): node_hash}, project='*', subclassing=False
+        )
+        return (entry[0] for entry in builder.iterall())
 
     @property
     def is_valid_cache(self):
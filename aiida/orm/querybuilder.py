@@ -19,17 +19,26 @@ an interface classes which enforces the implementation of its defined methods.
 An instance of one of the implementation classes becomes a member of the :func:`QueryBuilder` instance
 when instantiated by the user.
 """
+from collections import namedtuple
 from inspect import isclass as inspect_isclass
+import atexit
 import copy
+import json
 import logging
+import sys
+import threading
+import time
 import warnings
 
-from sqlalchemy import and_, or_, not_, func as sa_func, select, join
+from sqlalchemy import and_, or_, not_, func as sa_func, inspect as sa_inspect, select, join, bindparam, tuple_
 from sqlalchemy.types import Integer
-from sqlalchemy.orm import aliased
-from sqlalchemy.sql.expression import cast as type_cast
+from sqlalchemy.orm import aliased, defer
+from sqlalchemy.sql.expression import cast as type_cast, ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.exc import SQLAlchemyError
 
+from aiida.common.datastructures import LRUCache
 from aiida.common.exceptions import InputValidationError
 from aiida.common.links import LinkType
 from aiida.manage.manager import get_manager
@@ -312,6 +321,541 @@ def get_group_type_filter(classifiers, subclassing):
     return filters
 
 
+# Process-wide cache of the queries built by `QueryBuilder` instances, keyed on the structure of their queryhelp. It is
+# created upon first use such that its size is determined by the configuration of the profile that is loaded then.
+_QUERY_CACHE = None
+
+# The filter operators whose value is passed unaltered to SQLAlchemy and can therefore be replaced by a bind parameter
+_BINDABLE_OPERATORS = ('==', '>', '<', '>=', '<=', '=>', '=<', 'like', 'ilike')
+
+CachedQuery = namedtuple(
+    'CachedQuery', [
+        'query', 'tag_to_alias_map', 'aliased_path', 'tag_to_projected_property_dict', 'attrkeys_as_in_sql_result',
+        'nr_of_projections'
+    ]
+)
+
+
+def get_query_cache():
+    """Return the process-wide cache of the queries built by `QueryBuilder` instances.
+
+    The cache is keyed on the structure of the queryhelp, where the values of the filters are replaced by bind
+    parameters, such that queries that only differ in the values they filter on share the same entry. Its number of
+    entries is bounded by the `querybuilder.cache_size` configuration option and the `hits` and `misses` attributes
+    count how often a query could be reused.
+
+    :return: the query cache
+    :rtype: :class:`aiida.common.datastructures.LRUCache`
+    """
+    global _QUERY_CACHE  # pylint: disable=global-statement
+
+    if _QUERY_CACHE is None:
+        from aiida.manage.configuration import get_config_option
+        _QUERY_CACHE = LRUCache(maxsize=get_config_option('querybuilder.cache_size'))
+
+    return _QUERY_CACHE
+
+
+# Process-wide cache of the results of `QueryBuilder` instances, keyed on their queryhelp, and the counter of the writes
+# made to the database by this process. A cached result is only valid as long as the counter has not changed since.
+_RESULT_CACHE = None
+_WRITE_COUNTER = 0
+
+CachedResult = namedtuple('CachedResult', ['result', 'write_counter', 'expires'])
+
+
+def get_result_cache():
+    """Return the process-wide cache of the results of `QueryBuilder` instances.
+
+    The cache is keyed on the queryhelp and its total size, counted in rows, is bounded by the
+    `querybuilder.result_cache_size` configuration option, which is zero by default, disabling the cache. The entries
+    expire after `querybuilder.result_cache_ttl` seconds and are invalidated by :func:`invalidate_result_cache`.
+
+    :return: the result cache
+    :rtype: :class:`aiida.common.datastructures.LRUCache`
+    """
+    global _RESULT_CACHE  # pylint: disable=global-statement
+
+    if _RESULT_CACHE is None:
+        from aiida.manage.configuration import get_config_option
+        _RESULT_CACHE = LRUCache(
+            maxsize=get_config_option('querybuilder.result_cache_size'),
+            sizeof=lambda entry: len(entry.result) if isinstance(entry.result, list) else 1
+        )
+
+    return _RESULT_CACHE
+
+
+def is_result_cache_enabled():
+    """Return whether the result cache of the `QueryBuilder` is enabled by the `querybuilder.result_cache_size` option.
+
+    The listeners on the database connections check this first, such that statements are not inspected for writes if
+    there are no results that could be invalidated.
+
+    :return: boolean, True if the result cache is enabled, False otherwise
+    """
+    maxsize = get_result_cache().maxsize
+    return maxsize is None or maxsize > 0
+
+
+def invalidate_result_cache():
+    """Invalidate all results in the result cache of the `QueryBuilder`.
+
+    This is called by listeners on the database connections of this process whenever they execute a statement that
+    writes to the database, and when such a transaction is committed or rolled back, see
+    :func:`aiida.backends.utils.create_sqlalchemy_engine` and :func:`aiida.backends.djsite.utils.watch_connection`.
+    Writes by other processes are not noticed, so results can be outdated by at most the
+    `querybuilder.result_cache_ttl` configuration option.
+    """
+    global _WRITE_COUNTER  # pylint: disable=global-statement
+    _WRITE_COUNTER += 1
+
+
+class _BoundValue:
+    """Mixin for a filter value that SQLAlchemy renders as a named bind parameter instead of a literal value.
+
+    The mixin is combined with the type of the original value, such that the code that builds the filter expressions
+    can still inspect the value as usual, while SQLAlchemy uses the clause element returned by `__clause_element__`.
+    """
+
+    bind_name = None
+    bind_value = None
+    expanding = False
+
+    def __clause_element__(self):
+        return bindparam(self.bind_name, self.bind_value, expanding=self.expanding)
+
+
+class _BoundStr(_BoundValue, str):
+    """String filter value that is rendered as a named bind parameter."""
+
+
+class _BoundInt(_BoundValue, int):
+    """Integer filter value that is rendered as a named bind parameter."""
+
+
+class _BoundFloat(_BoundValue, float):
+    """Float filter value that is rendered as a named bind parameter."""
+
+
+class _BoundList(_BoundValue, list):
+    """List of filter values for the `in` operator that is rendered as a single expanding bind parameter."""
+
+    expanding = True
+
+
+_BOUND_VALUE_CLASSES = {str: _BoundStr, int: _BoundInt, float: _BoundFloat}
+
+
+def _bind_value(value, bound_class, params):
+    """Return the value as an instance of the given bound class with a new bind parameter name.
+
+    :param value: the filter value
+    :param bound_class: subclass of `_BoundValue` to convert the value to
+    :param params: dictionary to which the name of the bind parameter and the value are added
+    :return: the bound value
+    """
+    bound_value = bound_class(value)
+    bound_value.bind_name = 'qb_filter_{}'.format(len(params))
+    bound_value.bind_value = value
+    params[bound_value.bind_name] = value
+
+    return bound_value
+
+
+def _render_bound_params(statement, params):
+    """Return a copy of the statement where the named bind parameters have the given values, such as to render it.
+
+    The values of the bind parameters of a query that was taken from the query cache are those of the query that was
+    originally built, while the actual values are passed as parameters upon execution. To render the statement with
+    literal values, the actual values are substituted and the expanding bind parameters are converted into lists of
+    literals, since those cannot be rendered as literals by SQLAlchemy.
+
+    :param statement: the SQL statement
+    :param params: dictionary of the names of the bind parameters and their values
+    :return: the statement with the values substituted
+    """
+    from sqlalchemy.sql.elements import BindParameter, ClauseList, Grouping, literal
+    from sqlalchemy.sql.visitors import replacement_traverse
+
+    def replace(element):
+        if isinstance(element, BindParameter) and element.expanding:
+            return Grouping(ClauseList(*[literal(value, type_=element.type) for value in element.value]))
+        return None
+
+    return replacement_traverse(statement.params(params), {}, replace)
+
+
+def _freeze(value):
+    """Return a hashable representation of a queryhelp value that also distinguishes equal values of different types.
+
+    :param value: a value of the queryhelp
+    :return: a nested tuple
+    :raises TypeError: if the value contains objects that are not hashable
+    """
+    if isinstance(value, dict):
+        return (dict,) + tuple((key, _freeze(val)) for key, val in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_freeze(val) for val in value)
+
+    hash(value)
+
+    return (type(value), value)
+
+
+def _parametrize_filter_operations(operations, params):
+    """Replace the values of the filter operations that can be bound to a parameter by bound values.
+
+    :param operations: dictionary of operators and values for a single column or attribute
+    :param params: dictionary to which the names of the bind parameters and the values are added
+    :return: tuple of the operations with bound values and the hashable key of their structure
+    """
+    bound = {}
+    key = []
+
+    for operator, value in operations.items():
+        base_operator = operator.lstrip('~!')
+
+        if base_operator in ('and', 'or') and isinstance(value, (list, tuple)):
+            results = [_parametrize_filter_operations(sub_operations, params) for sub_operations in value]
+            bound[operator] = [result[0] for result in results]
+            key.append((operator, tuple(result[1] for result in results)))
+        elif base_operator in _BINDABLE_OPERATORS and type(value) in _BOUND_VALUE_CLASSES:
+            bound[operator] = _bind_value(value, _BOUND_VALUE_CLASSES[type(value)], params)
+            key.append((operator, _BoundValue, type(value)))
+        elif (
+            base_operator == 'in' and isinstance(value, (list, tuple)) and value and
+            len({type(item) for item in value}) == 1 and type(value[0]) in _BOUND_VALUE_CLASSES
+        ):
+            bound[operator] = _bind_value(list(value), _BoundList, params)
+            key.append((operator, _BoundList, type(value[0])))
+        else:
+            bound[operator] = value
+            key.append((operator, _freeze(value)))
+
+    return bound, tuple(key)
+
+
+def _parametrize_filter_spec(filter_spec, params):
+    """Replace the values of a filter specification that can be bound to a parameter by bound values.
+
+    :param filter_spec: the filter specification of a single vertex or edge
+    :param params: dictionary to which the names of the bind parameters and the values are added
+    :return: tuple of the filter specification with bound values and the hashable key of its structure
+    """
+    bound = {}
+    key = []
+
+    for path_spec, filter_operation_dict in filter_spec.items():
+        if path_spec in ('and', 'or', '~or', '~and', '!and', '!or'):
+            results = [_parametrize_filter_spec(sub_filter_spec, params) for sub_filter_spec in filter_operation_dict]
+            bound[path_spec] = [result[0] for result in results]
+            key.append((path_spec, tuple(result[1] for result in results)))
+        else:
+            if not isinstance(filter_operation_dict, dict):
+                filter_operation_dict = {'==': filter_operation_dict}
+            bound[path_spec], operations_key = _parametrize_filter_operations(filter_operation_dict, params)
+            key.append((path_spec, operations_key))
+
+    return bound, tuple(key)
+
+
+def _parametrize_filters(filters, params):
+    """Replace the values of the filters of all vertices and edges that can be bound to a parameter by bound values.
+
+    :param filters: dictionary of tags and their filter specifications
+    :param params: dictionary to which the names of the bind parameters and the values are added
+    :return: tuple of the filters with bound values and the hashable key of their structure
+    """
+    bound = {}
+    key = []
+
+    for tag, filter_spec in filters.items():
+        bound[tag], filter_spec_key = _parametrize_filter_spec(filter_spec, params)
+        key.append((tag, filter_spec_key))
+
+    return bound, tuple(key)
+
+
+class EntityRow:
+    """Mixin for the lightweight records that :meth:`QueryBuilder.iterrows` returns for entities projected with ``'*'``.
+
+    The records are namedtuples with a field for each column of the table of the entity, for example ``id``, ``uuid``,
+    ``node_type``, ``label``, ``ctime`` and ``attributes`` for nodes, such that no ORM entity has to be instantiated.
+    """
+
+    __slots__ = ()
+
+    _entity_class = None
+
+    def load(self):
+        """Load the ORM entity that corresponds to this record.
+
+        :return: the entity with the `id` of this record
+        :raises TypeError: if the entity of the record cannot be loaded, as is the case for links
+        """
+        if self._entity_class is None:
+            raise TypeError('the entity of a `{}` cannot be loaded'.format(type(self).__name__))
+
+        return self._entity_class.objects.get(id=self.id)  # pylint: disable=no-member
+
+
+_ROW_CLASSES = {}
+
+
+def get_row_class(table_name, fields):
+    """Return the namedtuple class of the records of entities of the given table with the given fields.
+
+    :param table_name: the name of the database table of the entity
+    :param fields: tuple of the names of the fields of the record
+    :return: a subclass of :class:`EntityRow`
+    """
+    try:
+        return _ROW_CLASSES[(table_name, fields)]
+    except KeyError:
+        pass
+
+    from aiida.orm import nodes
+
+    entity_classes = {
+        'db_dbnode': nodes.Node,
+        'db_dbgroup': groups.Group,
+        'db_dbcomputer': computers.Computer,
+        'db_dbuser': users.User,
+        'db_dbauthinfo': authinfos.AuthInfo,
+        'db_dbcomment': comments.Comment,
+        'db_dblog': logs.Log,
+    }
+
+    entity_class = entity_classes.get(table_name, None)
+
+    if entity_class is not None:
+        name = '{}Row'.format(entity_class.__name__)
+    else:
+        name = '{}Row'.format(table_name.replace('db_db', '').title())
+
+    row_class = type(name, (namedtuple(name, fields), EntityRow), {'__slots__': (), '_entity_class': entity_class})
+    _ROW_CLASSES[(table_name, fields)] = row_class
+
+    return row_class
+
+
+class QueryStatistics:
+    """Timings of the queries executed by `QueryBuilder` instances in this interpreter, per call site.
+
+    The call site of a query is the first frame outside of the query builder modules from which it was executed. For
+    each call site the following is recorded:
+
+        * `count`: the number of executed queries
+        * `rows`: the total number of rows that were returned
+        * `total_time`: the total time in seconds spent executing the queries and fetching their rows
+        * `max_time`: the longest time in seconds spent on a single query
+
+    Queries are only timed if the `querybuilder.profile` option is enabled, in which case a summary of the call sites
+    with the largest total time is logged when the interpreter exits, including those of the daemon workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        atexit.register(self.log_summary)
+
+    def record(self, call_site, duration, rows):
+        """Record a single executed query.
+
+        :param call_site: string that identifies the call site of the query
+        :param duration: the time in seconds spent executing the query and fetching its rows
+        :param rows: the number of rows that were returned
+        """
+        with self._lock:
+            entry = self._entries.setdefault(call_site, {'count': 0, 'rows': 0, 'total_time': 0., 'max_time': 0.})
+            entry['count'] += 1
+            entry['rows'] += rows
+            entry['total_time'] += duration
+            entry['max_time'] = max(entry['max_time'], duration)
+
+    def get_entries(self, limit=None):
+        """Return the statistics recorded in this interpreter, sorted by decreasing total time.
+
+        :param limit: optional maximum number of call sites to return
+        :return: list of dictionaries with the `call_site` and the recorded fields
+        """
+        with self._lock:
+            entries = [dict(call_site=call_site, **fields) for call_site, fields in self._entries.items()]
+
+        entries.sort(key=lambda entry: entry['total_time'], reverse=True)
+
+        return entries[:limit] if limit is not None else entries
+
+    def reset(self):
+        """Discard the statistics recorded in this interpreter."""
+        with self._lock:
+            self._entries = {}
+
+    def log_summary(self, limit=10):
+        """Log the call sites with the largest total time, if any queries were recorded.
+
+        :param limit: the maximum number of call sites to log
+        """
+        from aiida.common.log import LOG_LEVEL_REPORT
+
+        entries = self.get_entries(limit)
+
+        if not entries:
+            return
+
+        lines = ['QueryBuilder call sites with the largest total query time:']
+        for entry in entries:
+            lines.append(
+                '{total_time:10.3f} s {count:8d} queries {rows:10d} rows {max_time:8.3f} s max  {call_site}'.format(
+                    **entry
+                )
+            )
+
+        _LOGGER.log(LOG_LEVEL_REPORT, '\n'.join(lines))
+
+
+_QUERY_STATISTICS = None
+
+
+def get_query_statistics():
+    """Return the statistics of the queries executed by `QueryBuilder` instances in this interpreter.
+
+    :return: the `QueryStatistics` instance of this interpreter
+    """
+    global _QUERY_STATISTICS  # pylint: disable=global-statement
+
+    if _QUERY_STATISTICS is None:
+        _QUERY_STATISTICS = QueryStatistics()
+
+    return _QUERY_STATISTICS
+
+
+def _get_call_site():
+    """Return a string that identifies the first frame of the call stack outside of the query builder modules.
+
+    :return: string with the filename, the line number and the function name of the frame
+    """
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module != __name__ and not (module.startswith('aiida.orm.implementation') and
+                                       module.endswith('querybuilder')):
+            break
+        frame = frame.f_back
+
+    if frame is None:
+        return '<unknown>'
+
+    return '{}:{} in {}'.format(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+
+
+class _Explain(Executable, ClauseElement):
+    """Statement that returns the query plan of the wrapped statement, by default including the actual timings and
+    buffer usage."""
+
+    def __init__(self, statement, options='ANALYZE, BUFFERS'):
+        self.statement = statement
+        self.options = options
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element, compiler, **kwargs):
+    return 'EXPLAIN ({}) {}'.format(element.options, compiler.process(element.statement, **kwargs))
+
+
+def _explain_query(query):
+    """Return the query plan of the query as obtained by executing it with ``EXPLAIN (ANALYZE, BUFFERS)``.
+
+    The statement is executed on a separate connection, such that a failure does not affect the transaction of the
+    session of the query. As a consequence, data that has not yet been committed by that session is not seen.
+
+    :param query: the query
+    :return: the query plan or None if the database is not PostgreSQL
+    """
+    bind = query.session.get_bind()
+
+    if bind.dialect.name != 'postgresql':
+        return None
+
+    with bind.connect() as connection:
+        rows = connection.execute(_Explain(query.statement), query._params)  # pylint: disable=protected-access
+        return '\n'.join(row[0] for row in rows)
+
+
+def _estimate_count(query):
+    """Return the number of rows of the query as estimated by the query planner, without executing the query.
+
+    The statement is executed on a separate connection, like in `_explain_query`, such that a failure does not affect
+    the transaction of the session of the query.
+
+    :param query: the query
+    :return: the estimated number of rows or None if the database is not PostgreSQL
+    """
+    bind = query.session.get_bind()
+
+    if bind.dialect.name != 'postgresql':
+        return None
+
+    with bind.connect() as connection:
+        params = query._params  # pylint: disable=protected-access
+        plan = connection.execute(_Explain(query.statement, 'FORMAT JSON'), params).scalar()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _log_slow_query(query, call_site, duration, rows):
+    """Log the SQL, bind parameters and, if enabled, the query plan of a query that exceeded the slow query threshold.
+
+    :param query: the query
+    :param call_site: string that identifies the call site of the query
+    :param duration: the time in seconds spent executing the query and fetching its rows
+    :param rows: the number of rows that were returned
+    """
+    from aiida.manage.configuration import get_config_option
+
+    compiled = query.statement.compile(dialect=query.session.get_bind().dialect)
+    params = dict(compiled.params)
+    params.update(query._params)  # pylint: disable=protected-access
+    message = 'slow query of {:.0f} ms returning {} rows at {}:\n{}\nparameters: {}'.format(
+        duration * 1000, rows, call_site, compiled, params
+    )
+
+    if get_config_option('querybuilder.slow_query_explain'):
+        try:
+            plan = _explain_query(query)
+        except Exception as exception:  # pylint: disable=broad-except
+            plan = 'query plan could not be obtained: {}'.format(exception)
+
+        if plan is not None:
+            message = '{}\n{}'.format(message, plan)
+
+    _LOGGER.warning(message)
+
+
+def _record_query(query, call_site, duration, rows):
+    """Record the executed query in the query statistics and log it if it exceeded the slow query threshold.
+
+    :param query: the query
+    :param call_site: string that identifies the call site of the query
+    :param duration: the time in seconds spent executing the query and fetching its rows
+    :param rows: the number of rows that were returned
+    """
+    from aiida.manage.configuration import get_config_option
+
+    get_query_statistics().record(call_site, duration, rows)
+
+    threshold = get_config_option('querybuilder.slow_query_threshold')
+
+    if threshold and threshold > 0 and duration * 1000 >= threshold:
+        _log_slow_query(query, call_site, duration, rows)
+
+
 class QueryBuilder:
     """
     The class to query the AiiDA database.
@@ -334,6 +878,10 @@ class QueryBuilder:
     _EDGE_TAG_DELIM = '--'
     _VALID_PROJECTION_KEYS = ('func', 'cast')
 
+    # Estimated row counts below this number are replaced by an exact count in `count(approximate=True)`, since an exact
+    # count is cheap for such queries, whereas the planner estimates at least one row even for empty results
+    APPROXIMATE_COUNT_MINIMUM = 1000
+
     def __init__(self, backend=None, **kwargs):
         """
         Instantiates a QueryBuilder instance.
@@ -414,6 +962,9 @@ class QueryBuilder:
         # Check QueryBuilder.inject_query
         self._injected = False
 
+        # The hash of the queryhelp for which the query was made distinct, see QueryBuilder.distinct
+        self._distinct_hash = None
+
         # Setting debug levels:
         self.set_debug(kwargs.pop('debug', False))
 
@@ -460,10 +1011,13 @@ class QueryBuilder:
         if order_spec:
             self.order_by(order_spec)
 
+        # The values of the ordered columns of the row after which to return results, see QueryBuilder.after
+        self.after(kwargs.pop('after', None))
+
         # I've gone through all the keywords, popping each item
         # If kwargs is not empty, there is a problem:
         if kwargs:
-            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by')
+            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by', 'after')
             raise InputValidationError(
                 'Received additional keywords: {}'
                 '\nwhich I cannot process'
@@ -489,7 +1043,8 @@ class QueryBuilder:
             raise ConfigurationError('Unknown DB engine: {}'.format(engine))
 
         que = self.get_query()
-        return str(que.statement.compile(compile_kwargs={'literal_binds': True}, dialect=mydialect.dialect()))
+        statement = _render_bound_params(que.statement, que._params)  # pylint: disable=protected-access
+        return str(statement.compile(compile_kwargs={'literal_binds': True}, dialect=mydialect.dialect()))
 
     def _get_ormclass(self, cls, ormclass_type_string):
         """
@@ -1233,6 +1788,10 @@ class QueryBuilder:
                     "I suggest you apply functions on a column, e.g. ('id')\n"
                 )
             self._query = self._query.add_entity(alias)
+
+            # The attributes and extras of a node can be large, so they are only loaded once they are accessed
+            if sa_inspect(alias).mapper.class_ is self._impl.Node:
+                self._query = self._query.options(defer(alias.attributes), defer(alias.extras))
         else:
             entity_to_project = self._get_projectable_entity(alias, column_name, attr_key, cast=cast)
             if func is None:
@@ -1342,6 +1901,32 @@ class QueryBuilder:
         self._offset = offset
         return self
 
+    def after(self, after):
+        """
+        Set the values of the ordered columns of the row after which to return results, for keyset pagination.
+
+        Only the rows that come after that row in the order set with :meth:`.order_by` are returned. Contrary to
+        :meth:`.offset`, the database does not have to scan the rows that are skipped, such that fetching a page takes
+        the same time no matter how far into the results it is, as long as the order can be resolved with an index. The
+        order should be unique, so it should end with a unique column such as the ``id``::
+
+            qb = QueryBuilder().append(Node, tag='node', project=['ctime', 'id', 'uuid'])
+            qb.order_by({'node': ['ctime', 'id']}).limit(100)
+            page = qb.all()
+            while page:
+                ctime, pk, _ = page[-1]
+                page = qb.after((ctime, pk)).all()
+
+        :param after: a list or tuple with a value for each item of the order, in the same order, typically those of
+            the last row of the previous page, or None to return all rows.
+        """
+        if after is not None:
+            if not isinstance(after, (list, tuple)):
+                raise InputValidationError('after has to be a list or tuple, or None')
+            after = list(after)
+        self._after = after
+        return self
+
     def _build_filters(self, alias, filter_spec):
         """
         Recurse through the filter specification and apply filter operations.
@@ -1467,15 +2052,41 @@ class QueryBuilder:
         ).join(entity_to_join, aliased_edge.input_id == entity_to_join.id, isouter=isouterjoin)
         return aliased_edge
 
+    def _join_closure(self, joined_entity, joined_column, column_to_join, entity_to_join, isouterjoin):
+        """Join an entity through the closure table of the provenance graph, if it exists.
+
+        :param joined_entity: the (aliased) ORMclass of the entity that is already joined
+        :param joined_column: the name of the column of the closure table to join on the joined entity
+        :param column_to_join: the name of the column of the closure table to join on the entity to join
+        :param entity_to_join: the (aliased) ORMclass of the entity to join
+        :param isouterjoin: boolean, whether to use an outer join for the entity to join
+        :return: the columns of the closure table or None if it does not exist
+        """
+        from aiida.backends.general.closure import closure_table, closure_table_exists
+
+        if not closure_table_exists():
+            return None
+
+        closure = closure_table.alias()
+        self._query = self._query.join(closure, closure.c[joined_column] == joined_entity.id).join(
+            entity_to_join, closure.c[column_to_join] == entity_to_join.id, isouter=isouterjoin
+        )
+        return closure.c
+
     def _join_descendants_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
         """
-        joining descendants using the recursive functionality
+        joining descendants using the recursive functionality, or the closure table if it exists and no path is needed
         :TODO: Move the filters to be done inside the recursive query (for example on depth)
         :TODO: Pass an option to also show the path, if this is wanted.
         """
 
         self._check_dbentities((joined_entity, self._impl.Node), (entity_to_join, self._impl.Node), 'with_ancestors')
 
+        if not expand_path:
+            closure = self._join_closure(joined_entity, 'ancestor_id', 'descendant_id', entity_to_join, isouterjoin)
+            if closure is not None:
+                return closure
+
         link1 = aliased(self._impl.Link)
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
@@ -1528,13 +2139,18 @@ class QueryBuilder:
 
     def _join_ancestors_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
         """
-        joining ancestors using the recursive functionality
+        joining ancestors using the recursive functionality, or the closure table if it exists and no path is needed
         :TODO: Move the filters to be done inside the recursive query (for example on depth)
         :TODO: Pass an option to also show the path, if this is wanted.
 
         """
         self._check_dbentities((joined_entity, self._impl.Node), (entity_to_join, self._impl.Node), 'with_ancestors')
 
+        if not expand_path:
+            closure = self._join_closure(joined_entity, 'descendant_id', 'ancestor_id', entity_to_join, isouterjoin)
+            if closure is not None:
+                return closure
+
         link1 = aliased(self._impl.Link)
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
@@ -1874,6 +2490,7 @@ class QueryBuilder:
             'order_by': self._order_by,
             'limit': self._limit,
             'offset': self._offset,
+            'after': self._after,
         })
 
     def __deepcopy__(self, memo):
@@ -1896,14 +2513,65 @@ class QueryBuilder:
         entity = self._get_projectable_entity(alias, column_name, attrpath, **entityspec)
         order = entityspec.get('order', 'asc')
         if order == 'desc':
-            entity = entity.desc()
-        self._query = self._query.order_by(entity)
+            self._query = self._query.order_by(entity.desc())
+        else:
+            self._query = self._query.order_by(entity)
+
+        return entity, order
 
-    def _build(self):
+    @staticmethod
+    def _build_keyset_filter(order_entities, after):
+        """
+        Build the filter that selects the rows that come after the row with the given values of the ordered entities.
+
+        :param order_entities: list of tuples of each ordered entity and its order, either 'asc' or 'desc'
+        :param after: list of the values of the ordered entities of the row after which to return results
+        :return: the filter expression
+        """
+        if not order_entities:
+            raise InputValidationError('an order has to be set with order_by to use after')
+
+        if len(after) != len(order_entities):
+            raise InputValidationError(
+                'after requires a value for each of the {} items of the order, got {}'.format(
+                    len(order_entities), len(after)
+                )
+            )
+
+        entities = [entity for entity, _ in order_entities]
+        params = [
+            bindparam('qb_after_{}'.format(index), value, type_=entity.type)
+            for index, (entity, value) in enumerate(zip(entities, after))
+        ]
+        orders = {order for _, order in order_entities}
+
+        if orders == {'asc'}:
+            return tuple_(*entities) > tuple_(*params)
+
+        if orders == {'desc'}:
+            return tuple_(*entities) < tuple_(*params)
+
+        # A row value comparison does not work for mixed orders, so it has to be expanded column by column. The bound on
+        # the first entity is redundant, but allows the database to start from the right row when it uses an index.
+        clauses = []
+        for index, (entity, order) in enumerate(order_entities):
+            comparison = entity > params[index] if order == 'asc' else entity < params[index]
+            clauses.append(and_(*[entities[i] == params[i] for i in range(index)], comparison))
+
+        first = entities[0] >= params[0] if order_entities[0][1] == 'asc' else entities[0] <= params[0]
+
+        return and_(first, or_(*clauses))
+
+    def _build(self, filters=None):
         """
         build the query and return a sqlalchemy.Query instance
+
+        :param filters: optional filter specifications to use instead of those of this instance, for example with bound
+            values as created by :meth:`QueryBuilder._build_cached`
         """
         # pylint: disable=too-many-branches
+        if filters is None:
+            filters = self._filters
 
         # Starting the query by receiving a session
         # Every subclass needs to have _get_session and give me the right session
@@ -1924,11 +2592,11 @@ class QueryBuilder:
                 # I treat those two cases in a special way.
                 # I give them a filter_dict, to help the recursive function find a good
                 # starting point. TODO: document this!
-                filter_dict = self._filters.get(verticespec['joining_value'], {})
+                filter_dict = filters.get(verticespec['joining_value'], {})
                 # I also find out whether the path is used in a filter or a project
                 # if so, I instruct the recursive function to build the path on the fly!
                 # The default is False, cause it's super expensive
-                expand_path = ((self._filters[edge_tag].get('path', None) is not None) or
+                expand_path = ((filters[edge_tag].get('path', None) is not None) or
                                any(['path' in d.keys() for d in self._projections[edge_tag]]))
                 aliased_edge = connection_func(
                     toconnectwith, alias, isouterjoin=isouterjoin, filter_dict=filter_dict, expand_path=expand_path
@@ -1940,7 +2608,7 @@ class QueryBuilder:
 
         ######################### FILTERS ##############################
 
-        for tag, filter_specs in self._filters.items():
+        for tag, filter_specs in filters.items():
             try:
                 alias = self.tag_to_alias_map[tag]
             except KeyError:
@@ -1990,12 +2658,17 @@ class QueryBuilder:
                     self._build_projections(edge_tag)
 
         # ORDER ################################
+        order_entities = []
         for order_spec in self._order_by:
             for tag, entity_list in order_spec.items():
                 alias = self.tag_to_alias_map[tag]
                 for entitydict in entity_list:
                     for entitytag, entityspec in entitydict.items():
-                        self._build_order(alias, entitytag, entityspec)
+                        order_entities.append(self._build_order(alias, entitytag, entityspec))
+
+        # KEYSET ###############################
+        if self._after is not None:
+            self._query = self._query.filter(self._build_keyset_filter(order_entities, self._after))
 
         # LIMIT ################################
         if self._limit is not None:
@@ -2032,6 +2705,70 @@ class QueryBuilder:
 
         return self._query
 
+    def _build_cached(self):
+        """Build the query, reusing the query that was built before for a queryhelp with the same structure if possible.
+
+        The values of the filters are replaced by named bind parameters, such that the query that is built can be reused
+        through the query cache by any queryhelp that only differs in these values, which skips the construction of the
+        SQLAlchemy query in :meth:`QueryBuilder._build` altogether.
+
+        :return: an instance of sqlalchemy.orm.Query with the values of the filters of this instance as parameters
+        """
+        cache = get_query_cache()
+
+        if cache.maxsize == 0:
+            return self._build()
+
+        params = {}
+
+        # Whether ancestors and descendants are joined through the closure table depends on whether it exists, which can
+        # change at any time, so it is part of the key, but only checked for queries that actually use it
+        closure = None
+        relationships = ('with_ancestors', 'with_descendants', 'ancestor_of', 'descendant_of')
+        if any(vertex.get('joining_keyword') in relationships for vertex in self._path):
+            from aiida.backends.general.closure import closure_table_exists
+            closure = closure_table_exists()
+
+        try:
+            filters, filters_key = _parametrize_filters(self._filters, params)
+            key = (
+                type(self._impl), _freeze(self._path), filters_key, _freeze(self._projections), _freeze(self._order_by),
+                self._limit, self._offset, None if self._after is None else len(self._after), closure
+            )
+        except TypeError:
+            # The queryhelp contains values that are not hashable, so it cannot be cached
+            return self._build()
+
+        cached = cache.get(key)
+
+        if cached is None:
+            query = self._build(filters)
+            cached = CachedQuery(
+                query=query.with_session(None),
+                tag_to_alias_map=dict(self.tag_to_alias_map),
+                aliased_path=list(self._aliased_path),
+                tag_to_projected_property_dict=self.tag_to_projected_property_dict,
+                attrkeys_as_in_sql_result=self._attrkeys_as_in_sql_result,
+                nr_of_projections=self.nr_of_projections,
+            )
+            cache.set(key, cached)
+        else:
+            # The cached query refers to the aliases of the instance that built it, so those have to be used from now on
+            self.tag_to_alias_map = dict(cached.tag_to_alias_map)
+            self._aliased_path = list(cached.aliased_path)
+            self.tag_to_projected_property_dict = {
+                tag: dict(properties) for tag, properties in cached.tag_to_projected_property_dict.items()
+            }
+            self._attrkeys_as_in_sql_result = dict(cached.attrkeys_as_in_sql_result)
+            self.nr_of_projections = cached.nr_of_projections
+
+        if self._after is not None:
+            params.update(('qb_after_{}'.format(index), value) for index, value in enumerate(self._after))
+
+        self._query = cached.query.with_session(self._impl.get_session()).params(**params)
+
+        return self._query
+
     def get_aliases(self):
         """
         :returns: the list of aliases
@@ -2098,7 +2835,7 @@ class QueryBuilder:
             need_to_build = True
 
         if need_to_build:
-            query = self._build()
+            query = self._build_cached()
             self._hash = queryhelp_hash
         else:
             try:
@@ -2154,8 +2891,103 @@ class QueryBuilder:
         :returns: self
         """
         self._query = self.get_query().distinct()
+        self._distinct_hash = self._hash
         return self
 
+    def _get_cached_result(self, method, compute, copy_result=None):
+        """Return the result of the query from the result cache or compute it and add it to the cache.
+
+        The result is cached on the queryhelp, so queries that were modified with :meth:`.inject_query` are not cached.
+        A cached result is returned only if it has not expired and if this process has not written to the database
+        since it was computed, see :func:`invalidate_result_cache`.
+
+        :param method: a hashable that identifies the method computing the result and its arguments
+        :param compute: callable that takes no arguments and returns the result
+        :param copy_result: optional callable that returns a copy of a result, such that the result that is returned can
+            be modified by the caller without affecting the cached result
+        :return: the result
+        """
+        from aiida.manage.configuration import get_config_option
+
+        cache = get_result_cache()
+
+        if cache.maxsize == 0:
+            return compute()
+
+        self.get_query()
+
+        if self._injected:
+            return compute()
+
+        key = (type(self._impl), self._hash, self._distinct_hash == self._hash, method)
+        cached = cache.get(key)
+
+        if cached is not None and cached.write_counter == _WRITE_COUNTER and cached.expires > time.monotonic():
+            result = cached.result
+        else:
+            # The counter is read before executing the query, such that the result is discarded by the next lookup if
+            # there is a write in the meantime, for example by another thread
+            write_counter = _WRITE_COUNTER
+            result = compute()
+            expires = time.monotonic() + get_config_option('querybuilder.result_cache_ttl')
+            cache.set(key, CachedResult(result, write_counter, expires))
+
+        return result if copy_result is None else copy_result(result)
+
+    @staticmethod
+    def _execute(query, execute):
+        """Execute the query with the given function, timing it if the `querybuilder.profile` option is enabled.
+
+        :param query: the query
+        :param execute: callable that takes the query and returns its result
+        :return: the result of the callable
+        """
+        from aiida.manage.configuration import get_config_option
+
+        if not get_config_option('querybuilder.profile'):
+            return execute(query)
+
+        call_site = _get_call_site()
+        start = time.perf_counter()
+        result = execute(query)
+        _record_query(query, call_site, time.perf_counter() - start, int(result is not None))
+
+        return result
+
+    @staticmethod
+    def _iter_timed(query, iterator):
+        """Yield the rows of the iterator, timing their retrieval if the `querybuilder.profile` option is enabled.
+
+        Only the time spent retrieving the rows is taken into account, not the time spent by the caller in between. The
+        query is recorded once the iterator is exhausted or the generator is closed.
+
+        :param query: the query
+        :param iterator: iterator over the rows of the query
+        """
+        from aiida.manage.configuration import get_config_option
+
+        if not get_config_option('querybuilder.profile'):
+            yield from iterator
+            return
+
+        call_site = _get_call_site()
+        duration = 0.
+        rows = 0
+
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    row = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    duration += time.perf_counter() - start
+                rows += 1
+                yield row
+        finally:
+            _record_query(query, call_site, duration, rows)
+
     def first(self):
         """
         Executes query asking for one instance.
@@ -2168,7 +3000,7 @@ class QueryBuilder:
             One row of results as a list
         """
         query = self.get_query()
-        result = self._impl.first(query)
+        result = self._execute(query, self._impl.first)
 
         if result is None:
             return None
@@ -2196,60 +3028,186 @@ class QueryBuilder:
             raise NotExistent('No result was found')
         return res[0]
 
-    def count(self):
+    def count(self, approximate=False):
         """
         Counts the number of rows returned by the backend.
 
+        :param approximate: if True, return the number of rows estimated by the query planner of the database instead,
+            which does not require executing the query and is therefore much faster for large result sets. The estimate
+            is based on the statistics of the tables and can deviate considerably from the exact number, for example
+            for filters on attributes. If the estimate is below `APPROXIMATE_COUNT_MINIMUM`, or if the database does
+            not provide estimates or the estimate fails, the exact number is returned.
         :returns: the number of rows as an integer
         """
+        return self._get_cached_result(('count', approximate), lambda: self._count(approximate))
+
+    def _count(self, approximate):
+        """Count the number of rows returned by the backend, see :meth:`.count`."""
         query = self.get_query()
-        return self._impl.count(query)
 
-    def iterall(self, batch_size=100):
+        if approximate:
+            try:
+                estimate = _estimate_count(query)
+            except SQLAlchemyError:
+                # The estimate is only an optimization, so fall back to the exact count if it cannot be obtained
+                estimate = None
+
+            if estimate is not None and estimate >= self.APPROXIMATE_COUNT_MINIMUM:
+                return estimate
+
+        return self._execute(query, self._impl.count)
+
+    def iterall(self, batch_size=100, stream=False):
         """
         Same as :meth:`.all`, but returns a generator.
         Be aware that this is only safe if no commit will take place during this
-        transaction. You might also want to read the SQLAlchemy documentation on
+        transaction, unless the results are streamed. You might also want to read the SQLAlchemy documentation on
         http://docs.sqlalchemy.org/en/latest/orm/query.html#sqlalchemy.orm.query.Query.yield_per
 
 
         :param int batch_size:
             The size of the batches to ask the backend to batch results in subcollections.
             You can optimize the speed of the query by tuning this parameter.
+        :param bool stream:
+            If True, the results are streamed through a server-side cursor of a dedicated database session, such that
+            at most `batch_size` rows are held in memory and it is safe to commit while iterating, for example to store
+            nodes. Only data that was committed before the iteration started is returned. The dedicated session is
+            closed once the generator is exhausted or closed.
 
         :returns: a generator of lists
         """
         query = self.get_query()
 
-        for item in self._impl.iterall(query, batch_size, self._attrkeys_as_in_sql_result):
+        iterator = self._impl.iterall(query, batch_size, self._attrkeys_as_in_sql_result, stream=stream)
+
+        for item in self._iter_timed(query, iterator):
             # Convert to AiiDA frontend entities (if they are such)
             for i, item_entry in enumerate(item):
                 item[i] = self.get_aiida_entity_res(item_entry)
 
             yield item
 
-    def iterdict(self, batch_size=100):
+    def iterdict(self, batch_size=100, stream=False):
         """
         Same as :meth:`.dict`, but returns a generator.
         Be aware that this is only safe if no commit will take place during this
-        transaction. You might also want to read the SQLAlchemy documentation on
+        transaction, unless the results are streamed. You might also want to read the SQLAlchemy documentation on
         http://docs.sqlalchemy.org/en/latest/orm/query.html#sqlalchemy.orm.query.Query.yield_per
 
 
         :param int batch_size:
             The size of the batches to ask the backend to batch results in subcollections.
             You can optimize the speed of the query by tuning this parameter.
+        :param bool stream:
+            If True, the results are streamed through a server-side cursor of a dedicated database session, see
+            :meth:`.iterall`.
 
         :returns: a generator of dictionaries
         """
         query = self.get_query()
 
-        for item in self._impl.iterdict(query, batch_size, self.tag_to_projected_property_dict, self.tag_to_alias_map):
+        iterator = self._impl.iterdict(
+            query, batch_size, self.tag_to_projected_property_dict, self.tag_to_alias_map, stream=stream
+        )
+
+        for item in self._iter_timed(query, iterator):
             for key, value in item.items():
                 item[key] = self.get_aiida_entity_res(value)
 
             yield item
 
+    def iterrows(self, batch_size=100, stream=False):
+        """
+        Same as :meth:`.iterall`, but returns lightweight records instead of ORM entities for projections of ``'*'``.
+
+        Instantiating an ORM entity for every row is often much more expensive than the query itself. Instead, for every
+        vertex that is projected with ``'*'``, or the last vertex if nothing is projected, all the columns of its table
+        are projected and returned as a namedtuple with a field for each column, which is a subclass of
+        :class:`~aiida.orm.querybuilder.EntityRow`. The ORM entity can be loaded on demand with its ``load`` method.
+        All other projections are returned as by :meth:`.iterall`.
+
+        Usage::
+
+            qb = QueryBuilder().append(StructureData, project=['*', 'attributes.kinds'])
+            for row, kinds in qb.iterrows():
+                print(row.id, row.uuid, row.label, row.attributes['cell'], kinds)
+                structure = row.load()
+
+        .. note:: the rows are retrieved with a query that is built separately from the query of this instance, so any
+            changes made to the latter through :meth:`.distinct` or :meth:`.inject_query` are not taken into account.
+
+        :param int batch_size:
+            The size of the batches to ask the backend to batch results in subcollections.
+            You can optimize the speed of the query by tuning this parameter.
+        :param bool stream:
+            If True, the results are streamed through a server-side cursor of a dedicated database session, see
+            :meth:`.iterall`.
+
+        :returns: a generator of lists
+        """
+        if any(self._projections.values()):
+            projections = self._projections
+        else:
+            projections = {self._path[-1]['tag']: [{'*': {}}]}
+
+        row_projections = {}
+
+        for tag, items in projections.items():
+            if not any('*' in item for item in items):
+                row_projections[tag] = items
+                continue
+
+            # Project all columns instead of the entity, skipping the other projections of columns, which are included
+            alias = self.tag_to_alias_map[tag]
+            columns = self._impl.modify_expansions(alias, self._impl.get_column_names(alias))
+            row_projections[tag] = [{'**': {}}]
+            for item in items:
+                for key, spec in item.items():
+                    if key in ('*', '**') or (not spec and self._impl.modify_expansions(alias, [key])[0] in columns):
+                        continue
+                    row_projections[tag].append({key: spec})
+
+        # Build the query on a shallow copy, such that the query and the projections of this instance are not affected
+        builder = copy.copy(self)
+        builder._projections = row_projections  # pylint: disable=protected-access
+        builder._hash = None  # pylint: disable=protected-access
+        builder._injected = False  # pylint: disable=protected-access
+        builder.tag_to_alias_map = dict(self.tag_to_alias_map)
+        query = builder.get_query()
+
+        # For each projection of this instance, the record class, if any, and the indices of its values in the results
+        plan = []
+        tags = [vertex['tag'] for vertex in self._path]
+        tags.extend(vertex['edge_tag'] for vertex in self._path[1:] if vertex.get('edge_tag', None) is not None)
+
+        for tag in tags:
+            if not projections.get(tag, None):
+                continue
+
+            alias = builder.tag_to_alias_map[tag]
+            indices = builder.tag_to_projected_property_dict[tag]
+            columns = self._impl.modify_expansions(alias, self._impl.get_column_names(alias))
+
+            for item in projections[tag]:
+                for key in item:
+                    if key == '*':
+                        table_name = self._impl.get_table_name(alias)
+                        fields = tuple(
+                            self._impl.get_corresponding_property(table_name, column, self._impl.inner_to_outer_schema)
+                            for column in columns
+                        )
+                        plan.append((get_row_class(table_name, fields), [indices[column] for column in columns]))
+                    elif key == '**':
+                        plan.extend((None, indices[column]) for column in columns)
+                    else:
+                        plan.append((None, indices[self._impl.modify_expansions(alias, [key])[0]]))
+
+        for values in self._iter_timed(query, self._impl.iterrows(query, batch_size, stream=stream)):
+            yield [
+                values[index] if row_class is None else row_class._make([values[i] for i in index])
+                for row_class, index in plan
+            ]
+
     def all(self, batch_size=None, flat=False):
         """Executes the full query with the order of the rows as returned by the backend.
 
@@ -2262,7 +3220,9 @@ class QueryBuilder:
         :param bool flat: return the result as a flat list of projected entities without sub lists.
         :returns: a list of lists of all projected entities.
         """
-        matches = list(self.iterall(batch_size=batch_size))
+        matches = self._get_cached_result(
+            'all', lambda: list(self.iterall(batch_size=batch_size)), lambda rows: [list(row) for row in rows]
+        )
 
         if not flat:
             return matches
@@ -2321,7 +3281,11 @@ class QueryBuilder:
                 }
 
         """
-        return list(self.iterdict(batch_size=batch_size))
+        return self._get_cached_result(
+            'dict',
+            lambda: list(self.iterdict(batch_size=batch_size)),
+            lambda rows: [{tag: dict(projections) for tag, projections in row.items()} for row in rows],
+        )
 
     def inputs(self, **kwargs):
         """
@@ -8,19 +8,76 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Utilities for dealing with links between nodes."""
-from collections import namedtuple, OrderedDict
+from collections import defaultdict, namedtuple, OrderedDict
 from collections.abc import Mapping
+from contextlib import contextmanager
+import threading
 
 from aiida.common import exceptions
 from aiida.common.lang import type_check
 
-__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link')
+__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link', 'validate_links')
 
 LinkPair = namedtuple('LinkPair', ['link_type', 'link_label'])
 LinkTriple = namedtuple('LinkTriple', ['node', 'link_type', 'link_label'])
 LinkQuadruple = namedtuple('LinkQuadruple', ['source_id', 'target_id', 'link_type', 'link_label'])
 
 
+class _ThreadLocalVar:
+    """Minimal stand-in for `contextvars.ContextVar` for python versions before 3.7, with a value per thread.
+
+    The deferred validation never spans a point where a coroutine yields, so a value per thread is sufficient there.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, 'value', self._default)
+
+    def set(self, value):
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    ContextVar = _ThreadLocalVar
+
+# Whether validation is deferred is tracked per context, so deferring it does not affect other threads or coroutines
+_DEFER_VALIDATION = ContextVar('defer_validation', default=False)
+
+
+@contextmanager
+def defer_validation():
+    """Context manager to defer the checks of `Node.validate_incoming` that need the database.
+
+    Within this context, `Node.validate_incoming` only checks the proposed link itself, i.e. the types of the nodes,
+    the link type and the link label, such that the remaining checks can be done for many links at once with
+    `validate_links`. This only applies to the current thread or coroutine.
+    """
+    token = _DEFER_VALIDATION.set(True)
+    try:
+        yield
+    finally:
+        _DEFER_VALIDATION.reset(token)
+
+
+def is_validation_deferred():
+    """Return whether the checks of `Node.validate_incoming` that need the database are currently deferred.
+
+    :return: boolean, True if called within the `defer_validation` context manager, False otherwise
+    """
+    return _DEFER_VALIDATION.get()
+
+
 def link_triple_exists(source, target, link_type, link_label):
     """Return whether a link with the given type and label exists between the given source and target node.
 
@@ -50,6 +107,60 @@ def link_triple_exists(source, target, link_type, link_label):
     return builder.count() != 0
 
 
+def validate_link_rules(source, target, link_type, link_label):
+    """Validate the types of the nodes, the link type and the link label of a proposed link.
+
+    These are the checks of `validate_link` that do not concern any other links, so they do not need the database.
+
+    :param source: the node from which the link is coming
+    :param target: the node to which the link is going
+    :param link_type: the type of link
+    :param link_label: link label
+    :return: tuple of the outdegree and indegree character of the link type
+    :raise TypeError: if `source` or `target` is not a Node instance, or `link_type` is not a `LinkType` enum
+    :raise ValueError: if the proposed link is invalid
+    """
+    # yapf: disable
+    from aiida.common.links import LinkType, validate_link_label
+    from aiida.orm import Node, Data, CalculationNode, WorkflowNode
+
+    type_check(link_type, LinkType, 'link_type should be a LinkType enum but got: {}'.format(type(link_type)))
+    type_check(source, Node, 'source should be a `Node` but got: {}'.format(type(source)))
+    type_check(target, Node, 'target should be a `Node` but got: {}'.format(type(target)))
+
+    if source.uuid is None or target.uuid is None:
+        raise ValueError('source or target node does not have a UUID')
+
+    if source.uuid == target.uuid:
+        raise ValueError('cannot add a link to oneself')
+
+    try:
+        validate_link_label(link_label)
+    except ValueError as exception:
+        raise ValueError('invalid link label `{}`: {}'.format(link_label, exception))
+
+    # For each link type, define a tuple that defines the valid types for the source and target node, as well as
+    # the outdegree and indegree character. If the degree is `unique` that means that there can only be a single
+    # link of this type regardless of the label. If instead it is `unique_label`, an infinite amount of links of that
+    # type can be defined, as long as the link label is unique for the sub set of links of that type. Finally, for
+    # `unique_triple` the triple of node, link type and link label has to be unique.
+    link_mapping = {
+        LinkType.CALL_CALC: (WorkflowNode, CalculationNode, 'unique_triple', 'unique'),
+        LinkType.CALL_WORK: (WorkflowNode, WorkflowNode, 'unique_triple', 'unique'),
+        LinkType.CREATE: (CalculationNode, Data, 'unique_pair', 'unique'),
+        LinkType.INPUT_CALC: (Data, CalculationNode, 'unique_triple', 'unique_pair'),
+        LinkType.INPUT_WORK: (Data, WorkflowNode, 'unique_triple', 'unique_pair'),
+        LinkType.RETURN: (WorkflowNode, Data, 'unique_pair', 'unique_triple'),
+    }
+
+    type_source, type_target, outdegree, indegree = link_mapping[link_type]
+
+    if not isinstance(source, type_source) or not isinstance(target, type_target):
+        raise ValueError('cannot add a {} link from {} to {}'.format(link_type, type(source), type(target)))
+
+    return outdegree, indegree
+
+
 def validate_link(source, target, link_type, link_label):
     """
     Validate adding a link of the given type and label from a given node to ourself.
@@ -112,43 +223,7 @@ def validate_link(source, target, link_type, link_label):
     :raise TypeError: if `source` or `target` is not a Node instance, or `link_type` is not a `LinkType` enum
     :raise ValueError: if the proposed link is invalid
     """
-    # yapf: disable
-    from aiida.common.links import LinkType, validate_link_label
-    from aiida.orm import Node, Data, CalculationNode, WorkflowNode
-
-    type_check(link_type, LinkType, 'link_type should be a LinkType enum but got: {}'.format(type(link_type)))
-    type_check(source, Node, 'source should be a `Node` but got: {}'.format(type(source)))
-    type_check(target, Node, 'target should be a `Node` but got: {}'.format(type(target)))
-
-    if source.uuid is None or target.uuid is None:
-        raise ValueError('source or target node does not have a UUID')
-
-    if source.uuid == target.uuid:
-        raise ValueError('cannot add a link to oneself')
-
-    try:
-        validate_link_label(link_label)
-    except ValueError as exception:
-        raise ValueError('invalid link label `{}`: {}'.format(link_label, exception))
-
-    # For each link type, define a tuple that defines the valid types for the source and target node, as well as
-    # the outdegree and indegree character. If the degree is `unique` that means that there can only be a single
-    # link of this type regardless of the label. If instead it is `unique_label`, an infinite amount of links of that
-    # type can be defined, as long as the link label is unique for the sub set of links of that type. Finally, for
-    # `unique_triple` the triple of node, link type and link label has to be unique.
-    link_mapping = {
-        LinkType.CALL_CALC: (WorkflowNode, CalculationNode, 'unique_triple', 'unique'),
-        LinkType.CALL_WORK: (WorkflowNode, WorkflowNode, 'unique_triple', 'unique'),
-        LinkType.CREATE: (CalculationNode, Data, 'unique_pair', 'unique'),
-        LinkType.INPUT_CALC: (Data, CalculationNode, 'unique_triple', 'unique_pair'),
-        LinkType.INPUT_WORK: (Data, WorkflowNode, 'unique_triple', 'unique_pair'),
-        LinkType.RETURN: (WorkflowNode, Data, 'unique_pair', 'unique_triple'),
-    }
-
-    type_source, type_target, outdegree, indegree = link_mapping[link_type]
-
-    if not isinstance(source, type_source) or not isinstance(target, type_target):
-        raise ValueError('cannot add a {} link from {} to {}'.format(link_type, type(source), type(target)))
+    outdegree, indegree = validate_link_rules(source, target, link_type, link_label)
 
     if outdegree == 'unique_triple' or indegree == 'unique_triple':
         # For a `unique_triple` degree we just have to check if an identical triple already exist, either in the cache
@@ -186,6 +261,124 @@ def validate_link(source, target, link_type, link_label):
             target.uuid, link_type, link_label, source.uuid))
 
 
+def validate_links(links):
+    """Validate adding multiple links at once, counting each proposed link against the existing ones and the others.
+
+    This performs the checks of `validate_link` for each link, as well as the check of `Node.validate_incoming` that
+    the link would not introduce a cycle. Instead of querying the database for each link separately, the stored links
+    that are needed for the degree checks are retrieved with at most two queries, and at most one more query is needed
+    to check for cycles. Note that, unlike `validate_link`, the link labels are compared exactly and not as patterns.
+
+    :param links: list of tuples of the source node, the target node, the link type and the link label
+    :raise TypeError: if a source or target is not a Node instance, or a link type is not a `LinkType` enum
+    :raise ValueError: if any of the proposed links is invalid
+    """
+    # pylint: disable=too-many-locals,too-many-branches
+    from aiida.common.links import LinkType
+    from aiida.orm import Node, QueryBuilder
+
+    links = [tuple(link) for link in links]
+    degrees = [validate_link_rules(*link) for link in links]
+
+    # Only the stored links that can conflict are retrieved: those of the same type outgoing from a stored source or
+    # incoming into a stored target of which the degree is not `unique_triple`. An identical triple can only exist in
+    # the database if both nodes are stored, in which case it is found among the incoming links of the target.
+    source_ids, source_link_types = set(), set()
+    target_ids, target_link_types = set(), set()
+
+    for (source, target, link_type, _), (outdegree, indegree) in zip(links, degrees):
+        if source.is_stored and outdegree != 'unique_triple':
+            source_ids.add(source.pk)
+            source_link_types.add(link_type.value)
+        if target.is_stored and (source.is_stored or indegree != 'unique_triple'):
+            target_ids.add(target.pk)
+            target_link_types.add(link_type.value)
+
+    existing = []
+
+    if source_ids:
+        builder = QueryBuilder()
+        builder.append(Node, filters={'id': {'in': list(source_ids)}}, project=['uuid'], tag='source')
+        builder.append(
+            Node,
+            with_incoming='source',
+            project=['uuid'],
+            edge_filters={'type': {'in': list(source_link_types)}},
+            edge_project=['type', 'label']
+        )
+        existing.extend(builder.iterall())
+
+    if target_ids:
+        builder = QueryBuilder()
+        builder.append(Node, filters={'id': {'in': list(target_ids)}}, project=['uuid'], tag='target')
+        builder.append(
+            Node,
+            with_outgoing='target',
+            project=['uuid'],
+            edge_filters={'type': {'in': list(target_link_types)}},
+            edge_project=['type', 'label']
+        )
+        for target_uuid, source_uuid, value, label in builder.iterall():
+            existing.append((source_uuid, target_uuid, value, label))
+
+    for target in {id(target): target for _, target, _, _ in links}.values():
+        for link_triple in target._incoming_cache:  # pylint: disable=protected-access
+            existing.append((link_triple.node.uuid, target.uuid, link_triple.link_type.value, link_triple.link_label))
+
+    outgoing = defaultdict(set)
+    incoming = defaultdict(set)
+
+    for source_uuid, target_uuid, value, label in existing:
+        outgoing[(str(source_uuid), value)].add((str(target_uuid), label))
+        incoming[(str(target_uuid), value)].add((str(source_uuid), label))
+
+    for (source, target, link_type, link_label), (outdegree, indegree) in zip(links, degrees):
+        outgoing_links = outgoing[(source.uuid, link_type.value)]
+        incoming_links = incoming[(target.uuid, link_type.value)]
+
+        if outdegree == 'unique' and outgoing_links:
+            raise ValueError('node<{}> already has an outgoing {} link'.format(source.uuid, link_type))
+
+        if outdegree == 'unique_pair' and any(label == link_label for _, label in outgoing_links):
+            raise ValueError('node<{}> already has an outgoing {} link with label "{}"'.format(
+                source.uuid, link_type, link_label))
+
+        if outdegree == 'unique_triple' and (target.uuid, link_label) in outgoing_links:
+            raise ValueError('node<{}> already has an outgoing {} link with label "{}" from node<{}>'.format(
+                source.uuid, link_type, link_label, target.uuid))
+
+        if indegree == 'unique' and incoming_links:
+            raise ValueError('node<{}> already has an incoming {} link'.format(target.uuid, link_type))
+
+        if indegree == 'unique_pair' and any(label == link_label for _, label in incoming_links):
+            raise ValueError('node<{}> already has an incoming {} link with label "{}"'.format(
+                target.uuid, link_type, link_label))
+
+        if indegree == 'unique_triple' and (source.uuid, link_label) in incoming_links:
+            raise ValueError('node<{}> already has an incoming {} link with label "{}" from node<{}>'.format(
+                target.uuid, link_type, link_label, source.uuid))
+
+        outgoing_links.add((target.uuid, link_label))
+        incoming_links.add((source.uuid, link_label))
+
+    # A link would introduce a cycle if its source is a descendant of its target, which requires both to be stored
+    link_types_acyclic = (LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK)
+    pairs = [(target.pk, source.pk)
+             for source, target, link_type, _ in links
+             if link_type in link_types_acyclic and source.is_stored and target.is_stored]
+
+    if pairs:
+        builder = QueryBuilder()
+        builder.append(Node, filters={'id': {'in': [pair[0] for pair in pairs]}}, project=['id'], tag='parent')
+        builder.append(
+            Node, filters={'id': {'in': [pair[1] for pair in pairs]}}, project=['id'], with_ancestors='parent'
+        )
+        descendants = {tuple(pair) for pair in builder.iterall()}
+
+        if any(pair in descendants for pair in pairs):
+            raise ValueError('the link you are attempting to create would generate a cycle in the graph')
+
+
 class LinkManager:
     """
     Class to convert a list of LinkTriple tuples into an iterator.
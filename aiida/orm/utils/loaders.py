@@ -10,7 +10,10 @@
 """Module with `OrmEntityLoader` and its sub classes that simplify loading entities through their identifiers."""
 from abc import abstractclassmethod
 from enum import Enum
+import threading
+import uuid as uuid_module
 
+from aiida.common.datastructures import LRUCache
 from aiida.common.exceptions import MultipleObjectsError, NotExistent
 from aiida.common.lang import classproperty
 from aiida.orm.querybuilder import QueryBuilder
@@ -58,6 +61,137 @@ class IdentifierType(Enum):
     LABEL = 'LABEL'
 
 
+class IdentityMap:
+    """Bounded map of the stored nodes loaded in a database session, keyed on their pk and UUID.
+
+    The nodes are kept in an `LRUCache` keyed on their pk, such that the least recently used nodes are evicted once
+    the map is full. The UUIDs are mapped onto the pks, which never change for a stored node.
+    """
+
+    def __init__(self, session, maxsize):
+        """
+        :param session: the database session whose nodes are kept in the map
+        :param maxsize: the maximum number of nodes in the map
+        """
+        self.session = session
+        self._nodes = LRUCache(maxsize=maxsize)
+        self._pks = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    @property
+    def maxsize(self):
+        """Return the maximum number of nodes in the map."""
+        return self._nodes.maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        self._nodes.maxsize = maxsize
+
+    def get(self, pk=None, uuid=None):
+        """Return the node with the given pk or UUID, if it is in the map.
+
+        :param pk: the pk of the node
+        :param uuid: the full UUID of the node
+        :return: the node or None
+        """
+        if uuid is not None:
+            pk = self._pks.get(uuid)
+
+        if pk is None:
+            return None
+
+        node = self._nodes.get(pk)
+
+        if node is not None and uuid is not None and node.uuid != uuid:
+            return None
+
+        return node
+
+    def add(self, node):
+        """Add a stored node to the map.
+
+        :param node: the stored node
+        """
+        self._nodes.set(node.pk, node)
+        self._pks[node.uuid] = node.pk
+
+        # Drop the UUIDs of the nodes that have been evicted, once they outnumber the nodes in the map
+        if len(self._pks) > 2 * max(len(self._nodes), 1):
+            self._pks = {uuid: pk for uuid, pk in self._pks.items() if pk in self._nodes}
+
+    def evict(self, pks):
+        """Remove the nodes with the given pks from the map.
+
+        :param pks: the pks of the nodes
+        """
+        for pk in pks:
+            node = self._nodes.pop(pk)
+            if node is not None:
+                self._pks.pop(node.uuid, None)
+
+    def clear(self):
+        """Remove all nodes from the map."""
+        self._nodes.clear()
+        self._pks.clear()
+
+
+# The identity map of the nodes loaded by the current thread, whose database session is also local to the thread
+_IDENTITY_MAP = threading.local()
+
+
+def get_identity_map():
+    """Return the identity map of the nodes loaded through the `NodeEntityLoader` in the current database session.
+
+    The size of the map is set by the `orm.identity_map_size` configuration option, which is zero by default, disabling
+    the map. A new, empty map is returned whenever the database session changes, e.g. after it has been reset, such
+    that nodes whose models are bound to an old session are never returned.
+
+    :return: the identity map or None if it is disabled
+    :rtype: :class:`IdentityMap`
+    """
+    from aiida.manage.configuration import get_config_option
+    from aiida.manage.manager import get_manager
+
+    maxsize = get_config_option('orm.identity_map_size')
+
+    if not maxsize:
+        return None
+
+    session = get_manager().get_backend().get_session()
+    identity_map = getattr(_IDENTITY_MAP, 'identity_map', None)
+
+    if identity_map is None or identity_map.session is not session:
+        identity_map = IdentityMap(session, maxsize)
+        _IDENTITY_MAP.identity_map = identity_map
+    elif identity_map.maxsize != maxsize:
+        identity_map.maxsize = maxsize
+
+    return identity_map
+
+
+def evict_from_identity_map(pks):
+    """Remove the nodes with the given pks from the identity map of the current thread.
+
+    This is called whenever a stored node is modified or deleted, such that `load_node` queries it again.
+
+    :param pks: the pks of the nodes
+    """
+    identity_map = getattr(_IDENTITY_MAP, 'identity_map', None)
+
+    if identity_map is not None:
+        identity_map.evict(pks)
+
+
+def clear_identity_map():
+    """Remove all nodes from the identity map of the current thread."""
+    identity_map = getattr(_IDENTITY_MAP, 'identity_map', None)
+
+    if identity_map is not None:
+        identity_map.clear()
+
+
 class OrmEntityLoader:
     """Base class for entity loaders."""
 
@@ -611,6 +745,65 @@ class NodeEntityLoader(OrmEntityLoader):
         from aiida.orm import Node
         return Node
 
+    @classmethod
+    def load_entity(cls, identifier, identifier_type=None, sub_classes=None, query_with_dashes=True):
+        """
+        Load a node that uniquely corresponds to the provided identifier of the identifier type.
+
+        If the identity map is enabled, a node that was already loaded by its pk or UUID in the current database session
+        is returned without querying the database, as long as it has not been modified or deleted since.
+
+        :param identifier: the identifier
+        :param identifier_type: the type of the identifier
+        :param sub_classes: an optional tuple of orm classes, that should each be strict sub classes of the
+            base orm class of the loader, that will narrow the queryset
+        :returns: the loaded node
+        :raises aiida.common.MultipleObjectsError: if the identifier maps onto multiple entities
+        :raises aiida.common.NotExistent: if the identifier maps onto not a single entity
+        """
+        identity_map = get_identity_map()
+
+        if identity_map is not None:
+            node = cls._get_from_identity_map(identity_map, identifier, identifier_type)
+
+            if node is not None and isinstance(node, cls.get_query_classes(sub_classes)):
+                return node
+
+        node = super().load_entity(identifier, identifier_type, sub_classes, query_with_dashes)
+
+        if identity_map is not None:
+            identity_map.add(node)
+
+        return node
+
+    @classmethod
+    def _get_from_identity_map(cls, identity_map, identifier, identifier_type=None):
+        """
+        Return the node from the identity map that corresponds to the identifier, if it is a pk or a full UUID.
+
+        :param identity_map: the identity map
+        :param identifier: the identifier
+        :param identifier_type: the type of the identifier
+        :returns: the node or None
+        """
+        if identifier_type is None:
+            try:
+                identifier, identifier_type = cls.infer_identifier_type(identifier)
+            except ValueError:
+                return None
+
+        try:
+            if identifier_type == IdentifierType.ID:
+                return identity_map.get(pk=int(identifier))
+
+            if identifier_type == IdentifierType.UUID:
+                return identity_map.get(uuid=str(uuid_module.UUID(str(identifier))))
+        except ValueError:
+            # A partial UUID or an invalid pk, which can only be resolved by the query
+            pass
+
+        return None
+
     @classmethod
     def _get_query_builder_label_identifier(cls, identifier, classes, operator='==', project='*'):
         """
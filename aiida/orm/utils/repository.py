@@ -11,10 +11,19 @@
 
 import collections
 import enum
+import io
 import os
+import tempfile
+from operator import itemgetter
 
-from aiida.common import exceptions
+from aiida.common import exceptions, json
 from aiida.common.folders import RepositoryFolder, SandboxFolder
+from aiida.common.hashing import FileDigestCache, _make_hash, _single_digest, _stream_digest, _END_DIGEST
+from aiida.common.objectstore import ObjectStore
+from aiida.manage.configuration import get_config_option, get_profile
+
+# Value of the `repository.backend` configuration option that writes the repository of stored nodes to the object store
+REPOSITORY_BACKEND_OBJECTSTORE = 'objectstore'
 
 
 class FileType(enum.Enum):
@@ -25,18 +34,121 @@ class FileType(enum.Enum):
 
 File = collections.namedtuple('File', ['name', 'type'])
 
+# Instances of `FileDigestCache` per database file, such that connections to the database are reused
+_DIGEST_CACHES = {}
+
+# Instances of `ObjectStore` per base path, such that connections to the index and open pack files are reused
+_OBJECT_STORES = {}
+
+
+def get_object_store():
+    """Return the content-addressable object store of the repository of the currently loaded profile.
+
+    :return: the object store
+    :rtype: :class:`aiida.common.objectstore.ObjectStore`
+    """
+    basepath = os.path.join(get_profile().repository_path, 'repository', 'objects')
+
+    if basepath not in _OBJECT_STORES:
+        _OBJECT_STORES[basepath] = ObjectStore(basepath)
+
+    return _OBJECT_STORES[basepath]
+
+
+def get_digest_cache():
+    """Return the persistent cache of file content digests of the repository of the currently loaded profile.
+
+    :return: the digest cache
+    :rtype: :class:`aiida.common.hashing.FileDigestCache`
+    """
+    filepath = os.path.join(get_profile().repository_path, 'repository', 'digests.sqlite')
+
+    if filepath not in _DIGEST_CACHES:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        _DIGEST_CACHES[filepath] = FileDigestCache(filepath)
+
+    return _DIGEST_CACHES[filepath]
+
+
+def delete_unreferenced_objects():
+    """Delete the objects of the object store that are not referenced by the manifest of any repository.
+
+    The object store does not count references to its objects, so when the nodes that reference an object are deleted,
+    the object remains in the store. This walks all manifests and deletes the objects that none of them references,
+    while holding the exclusive lock of the store, such that it waits for and blocks the storing of repositories.
+
+    :return: the number of objects that were deleted
+    """
+    object_store = get_object_store()
+    dirpath = os.path.join(get_profile().repository_path, 'repository', 'manifest')
+
+    with object_store.lock(exclusive=True):
+        referenced = set()
+
+        for root, _, filenames in os.walk(dirpath):
+            for filename in filenames:
+                # Skip the temporary files that are left behind if writing a manifest was interrupted
+                if not filename.endswith('.json'):
+                    continue
+
+                with open(os.path.join(root, filename), 'r', encoding='utf8') as handle:
+                    referenced.update(_iter_manifest_object_keys(json.load(handle)))
+
+        return object_store.delete_unreferenced_objects(referenced)
+
+
+def _iter_manifest_object_keys(directory):
+    """Return an iterator over the keys of all objects in the given manifest directory entry, including sub directories.
+
+    :param directory: the manifest entry of the directory
+    :return: iterator of object keys
+    """
+    for entry in directory.values():
+        if isinstance(entry, dict):
+            for hashkey in _iter_manifest_object_keys(entry):
+                yield hashkey
+        else:
+            yield entry
+
+
+def is_object_store_enabled():
+    """Return whether the repository of nodes that are being stored is written to the object store.
+
+    This is determined by the `repository.backend` configuration option of the currently loaded profile.
+
+    :return: boolean, True if the object store is enabled, False otherwise
+    """
+    return get_config_option('repository.backend') == REPOSITORY_BACKEND_OBJECTSTORE
+
 
 class Repository:
-    """Class that represents the repository of a `Node` instance."""
+    """Class that represents the repository of a `Node` instance.
+
+    The content of the repository of an unstored node is written to a sandbox folder. When the node is stored, the
+    content is moved to its final location, which depends on the `repository.backend` option of the profile:
+
+     * `folder`: the sandbox folder is moved to a sharded repository folder of the node
+     * `objectstore`: each file is added to the content-addressable object store of the profile, where identical files
+       are stored only once, and a manifest is written that maps the keys of the repository to the keys of the objects.
+
+    The manifest is a nested dictionary, where directories are represented by dictionaries and files by the key of the
+    corresponding object in the object store. The backend is determined when reading from the repository of a stored
+    node by the existence of its manifest, such that profiles can switch backend without having to migrate existing
+    repositories. Objects are not deleted from the object store when a repository is erased, since they can be shared
+    with other repositories, instead they are removed by `delete_unreferenced_objects`.
+    """
 
     # Name to be used for the Repository section
     _section_name = 'node'
 
     def __init__(self, uuid, is_stored, base_path=None):
+        self._uuid = uuid
         self._is_stored = is_stored
         self._base_path = base_path
         self._temp_folder = None
         self._repo_folder = RepositoryFolder(section=self._section_name, uuid=uuid)
+        self._manifest = None
+        self._is_checked_out = False
 
     def __del__(self):
         """Clean the sandboxfolder if it was instantiated."""
@@ -68,13 +180,22 @@ class Repository:
         :param key: fully qualified identifier for the object within the repository
         :return: a list of `File` named tuples representing the objects present in directory with the given key
         """
+        objects = []
+
+        if self._get_manifest() is not None:
+            for filename, entry in self._get_manifest_directory(key).items():
+                if isinstance(entry, dict):
+                    objects.append(File(filename, FileType.DIRECTORY))
+                else:
+                    objects.append(File(filename, FileType.FILE))
+
+            return sorted(objects, key=lambda x: x.name)
+
         folder = self._get_base_folder()
 
         if key:
             folder = folder.get_subfolder(key)
 
-        objects = []
-
         for filename in folder.get_content_list():
             if os.path.isdir(os.path.join(folder.abspath, filename)):
                 objects.append(File(filename, FileType.DIRECTORY))
@@ -94,9 +215,29 @@ class Repository:
     def open(self, key, mode='r'):
         """Open a file handle to an object stored under the given key.
 
+        .. note:: objects in the object store are immutable, so for a repository whose content lives in the object
+            store, the handle can only be opened in read mode.
+
         :param key: fully qualified identifier for the object within the repository
         :param mode: the mode under which to open the handle
+        :raises aiida.common.ModificationNotAllowed: if the object lives in the object store and the mode is not read
         """
+        if self._get_manifest() is not None:
+            if any(char in mode for char in 'wax+'):
+                raise exceptions.ModificationNotAllowed('objects in the object store can only be opened in read mode')
+
+            entry = self._get_manifest_entry(key)
+
+            if isinstance(entry, dict):
+                raise IsADirectoryError('object {} is a directory'.format(key))
+
+            handle = get_object_store().open(entry)
+
+            if 'b' in mode:
+                return handle
+
+            return io.TextIOWrapper(handle, encoding='utf8')
+
         return open(self._get_base_folder().get_abs_path(key), mode=mode)
 
     def get_object(self, key):
@@ -113,6 +254,17 @@ class Repository:
         except ValueError:
             directory, filename = None, key
 
+        if self._get_manifest() is not None:
+            try:
+                entry = self._get_manifest_entry(key)
+            except IOError:
+                raise IOError('object {} does not exist'.format(key))
+
+            if isinstance(entry, dict):
+                return File(filename, FileType.DIRECTORY)
+
+            return File(filename, FileType.FILE)
+
         folder = self._get_base_folder()
 
         if directory:
@@ -128,6 +280,30 @@ class Repository:
 
         raise IOError('object {} does not exist'.format(key))
 
+    def get_object_location(self, key):
+        """Return the file on this file system that contains the object and the offset at which its content starts.
+
+        This allows to map the content of an object into memory without reading it first.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: tuple of the absolute path of the file and the offset in bytes
+        :raises IOError: if no object with the given key exists
+        """
+        if self._get_manifest() is not None:
+            entry = self._get_manifest_entry(key)
+
+            if isinstance(entry, dict):
+                raise IsADirectoryError('object {} is a directory'.format(key))
+
+            return get_object_store().get_object_location(entry)
+
+        filepath = self._get_base_folder().get_abs_path(key)
+
+        if not os.path.isfile(filepath):
+            raise IOError('object {} does not exist'.format(key))
+
+        return filepath, 0
+
     def get_object_content(self, key, mode='r'):
         """Return the content of a object identified by key.
 
@@ -157,6 +333,20 @@ class Repository:
         if not os.path.isabs(path):
             raise ValueError('the `path` must be an absolute path')
 
+        if self._get_manifest() is not None:
+            directory = self._get_manifest_directory(key, create=True)
+            object_store = get_object_store()
+
+            with object_store.lock():
+                if contents_only:
+                    for entry in os.listdir(path):
+                        directory[entry] = self._add_path_to_object_store(os.path.join(path, entry), object_store)
+                else:
+                    directory[os.path.basename(path)] = self._add_path_to_object_store(path, object_store)
+
+                self._write_manifest(self._get_manifest())
+            return
+
         folder = self._get_base_folder()
 
         if key:
@@ -225,6 +415,17 @@ class Repository:
 
         self.validate_object_key(key)
 
+        if self._get_manifest() is not None:
+            dirname, filename = os.path.split(key)
+            directory = self._get_manifest_directory(dirname, create=True)
+            encoding = None if 'b' in mode else (encoding or 'utf8')
+            object_store = get_object_store()
+
+            with object_store.lock():
+                directory[filename] = object_store.add_object_from_filelike(handle, encoding=encoding)
+                self._write_manifest(self._get_manifest())
+            return
+
         folder = self._get_base_folder()
 
         while os.sep in key:
@@ -248,6 +449,17 @@ class Repository:
 
         self.validate_object_key(key)
 
+        if self._get_manifest() is not None:
+            dirname, filename = os.path.split(key)
+            directory = self._get_manifest_directory(dirname)
+
+            if filename not in directory:
+                raise OSError('{} does not exist within the repository'.format(key))
+
+            directory.pop(filename)
+            self._write_manifest(self._get_manifest())
+            return
+
         self._get_base_folder().remove_path(key)
 
     def erase(self, force=False):
@@ -262,30 +474,88 @@ class Repository:
         if not force:
             self.validate_mutability()
 
+        if self._get_manifest() is not None:
+            self._get_manifest_directory().clear()
+
+            if any(_iter_manifest_object_keys(self._get_manifest())):
+                self._write_manifest(self._get_manifest())
+                return
+
+            # The manifest no longer references any objects, so it is removed instead of leaving behind an empty one
+            try:
+                os.remove(self._get_manifest_path())
+            except FileNotFoundError:
+                pass
+
+            self._manifest = {}
+            self._reset_checkout()
+            return
+
         self._get_base_folder().erase()
 
+    def exists(self):
+        """Return whether the content of the repository exists on disk.
+
+        For a stored repository this means that either its repository folder or its manifest exists.
+
+        :return: boolean, True if the repository exists, False otherwise
+        """
+        if not self._is_stored:
+            return self._temp_folder is not None and self._temp_folder.exists()
+
+        return self._get_manifest() is not None or self._repo_folder.exists()
+
     def store(self):
-        """Store the contents of the sandbox folder into the repository folder."""
+        """Store the contents of the sandbox folder into the repository folder or the object store.
+
+        The destination is determined by the `repository.backend` configuration option of the current profile.
+        """
         if self._is_stored:
             raise exceptions.ModificationNotAllowed('repository is already stored')
 
-        self._repo_folder.replace_with_folder(self._get_temp_folder().abspath, move=True, overwrite=True)
+        if is_object_store_enabled():
+            object_store = get_object_store()
+
+            with object_store.lock():
+                manifest = self._add_path_to_object_store(self._get_temp_folder().abspath, object_store)
+                self._write_manifest(manifest)
+
+            self._temp_folder.erase()
+            self._temp_folder = None
+        else:
+            self._repo_folder.replace_with_folder(self._get_temp_folder().abspath, move=True, overwrite=True)
+            self._manifest = False
+
         self._is_stored = True
 
     def restore(self):
-        """Move the contents from the repository folder back into the sandbox folder."""
+        """Move the contents from the repository folder or the object store back into the sandbox folder."""
         if not self._is_stored:
             raise exceptions.ModificationNotAllowed('repository is not yet stored')
 
-        self._temp_folder.replace_with_folder(self._repo_folder.abspath, move=True, overwrite=True)
+        manifest = self._get_manifest()
+
+        if manifest is not None:
+            self._reset_checkout()
+            self._export_manifest_directory(manifest, self._get_temp_folder().abspath, get_object_store())
+            os.remove(self._get_manifest_path())
+        else:
+            self._temp_folder.replace_with_folder(self._repo_folder.abspath, move=True, overwrite=True)
+
+        self._manifest = None
         self._is_stored = False
 
     def _get_base_folder(self):
         """Return the base sub folder in the repository.
 
+        .. note:: if the content of the repository lives in the object store, the returned folder contains a copy of
+            that content. Any changes made to that folder will therefore *not* be persisted.
+
         :return: a Folder object.
         """
-        if self._is_stored:
+        if self._get_manifest() is not None:
+            folder = self._get_checkout_folder()
+        elif self._is_stored:
             folder = self._repo_folder
         else:
             folder = self._get_temp_folder()
@@ -305,3 +575,218 @@ class Repository:
             self._temp_folder = SandboxFolder()
 
         return self._temp_folder
+
+    def _get_checkout_folder(self):
+        """Return a sandbox folder with a copy of the content of the repository in the object store.
+
+        Objects in the object store do not live in a directory structure that mirrors the repository, so for code that
+        requires a `Folder`, the content is copied once to the sandbox folder, which is otherwise unused once stored.
+
+        :return: a SandboxFolder object with a copy of the content of the repository.
+        """
+        folder = self._get_temp_folder()
+
+        if not self._is_checked_out:
+            self._export_manifest_directory(self._get_manifest(), folder.abspath, get_object_store())
+            self._is_checked_out = True
+
+        return folder
+
+    def _reset_checkout(self):
+        """Remove the copy of the content of the repository in the object store if it was created."""
+        if self._is_checked_out:
+            self._temp_folder.erase()
+            self._temp_folder = None
+            self._is_checked_out = False
+
+    def _get_manifest_path(self):
+        """Return the absolute path of the manifest file of this repository.
+
+        :return: absolute filepath of the manifest
+        """
+        uuid = str(self._uuid)
+        return os.path.join(
+            get_profile().repository_path, 'repository', 'manifest', uuid[:2], uuid[2:4], '{}.json'.format(uuid[4:])
+        )
+
+    def _get_manifest(self):
+        """Return the manifest of the repository if its content lives in the object store.
+
+        :return: the manifest or None if the repository is not stored or its content lives in a repository folder
+        """
+        if not self._is_stored:
+            return None
+
+        if self._manifest is None:
+            try:
+                with open(self._get_manifest_path(), 'r', encoding='utf8') as handle:
+                    self._manifest = json.load(handle)
+            except FileNotFoundError:
+                self._manifest = False
+
+        if self._manifest is False:
+            return None
+
+        return self._manifest
+
+    def _write_manifest(self, manifest):
+        """Write the manifest of the repository to disk.
+
+        The manifest is first written to a temporary file that then atomically replaces the existing manifest, if any.
+
+        :param manifest: the manifest to write
+        """
+        filepath = self._get_manifest_path()
+        dirname = os.path.dirname(filepath)
+        os.makedirs(dirname, exist_ok=True)
+
+        descriptor, temppath = tempfile.mkstemp(dir=dirname)
+
+        try:
+            with os.fdopen(descriptor, 'wb') as handle:
+                json.dump(manifest, handle)
+            os.replace(temppath, filepath)
+        finally:
+            if os.path.exists(temppath):
+                os.remove(temppath)
+
+        self._manifest = manifest
+        self._reset_checkout()
+
+    @staticmethod
+    def _split_key(key):
+        """Split an object key into its parts.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: list of path components
+        """
+        if not key:
+            return []
+
+        return [part for part in key.split(os.sep) if part not in ('', os.curdir)]
+
+    def _get_manifest_directory(self, key=None, create=False):
+        """Return the manifest entry of the directory with the given key, relative to the base path.
+
+        :param key: fully qualified identifier for the directory within the repository
+        :param create: boolean, if True, missing directories are created in the manifest
+        :return: the dictionary that represents the directory in the manifest
+        :raises IOError: if the directory does not exist and `create=False` or if the key corresponds to a file
+        """
+        directory = self._get_manifest()
+
+        for part in self._split_key(self._base_path):
+            directory = directory.setdefault(part, {})
+
+        for part in self._split_key(key):
+            if create and part not in directory:
+                directory[part] = {}
+
+            directory = directory.get(part, None)
+
+            if not isinstance(directory, dict):
+                raise IOError('directory {} does not exist'.format(key))
+
+        return directory
+
+    def _get_manifest_entry(self, key):
+        """Return the manifest entry of the object with the given key, relative to the base path.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: a dictionary if the object is a directory or the key of the object in the object store if it is a file
+        :raises IOError: if no object with the given key exists
+        """
+        dirname, filename = os.path.split(key)
+        directory = self._get_manifest_directory(dirname)
+
+        if not filename:
+            return directory
+
+        try:
+            return directory[filename]
+        except KeyError:
+            raise IOError('object {} does not exist'.format(key))
+
+    @classmethod
+    def _add_path_to_object_store(cls, path, object_store):
+        """Add the file or directory located at `path` on this file system to the object store.
+
+        :param path: absolute path of the file or directory to add
+        :param object_store: the object store to add the objects to
+        :return: the key of the object if `path` is a file, or the manifest entry of the directory otherwise
+        """
+        if os.path.isfile(path):
+            return object_store.add_object_from_file(path)
+
+        if os.path.isdir(path):
+            return {
+                entry: cls._add_path_to_object_store(os.path.join(path, entry), object_store)
+                for entry in os.listdir(path)
+            }
+
+        raise ValueError('can only add files or directories to the object store, not symlinks or the like')
+
+    @classmethod
+    def _export_manifest_directory(cls, directory, path, object_store):
+        """Copy the objects of a manifest directory entry to the directory at `path` on this file system.
+
+        :param directory: the manifest entry of the directory
+        :param path: absolute path of the target directory, which is created if it does not exist
+        :param object_store: the object store that contains the objects
+        """
+        os.makedirs(path, exist_ok=True)
+
+        for name, entry in directory.items():
+            if isinstance(entry, dict):
+                cls._export_manifest_directory(entry, os.path.join(path, name), object_store)
+            else:
+                object_store.copy_object(entry, os.path.join(path, name))
+
+
+@_make_hash.register(Repository)
+def _(repository, **kwargs):
+    """Hash the content of a `Repository` relative to its base path.
+
+    The digests are identical to those of the `Folder` that contains the same content, such that the hash does not
+    depend on whether the content lives in a repository folder or in the object store.
+
+    :param ignored_folder_content: list of filenames to be ignored for the hashing
+    :param digest_cache: optional `FileDigestCache` in which the content digests of objects are cached by their key
+    """
+    # pylint: disable=protected-access
+    if repository._get_manifest() is None:
+        return _make_hash(repository._get_base_folder(), **kwargs)
+
+    ignored_folder_content = kwargs.get('ignored_folder_content', [])
+    digest_cache = kwargs.get('digest_cache', None)
+    object_store = get_object_store()
+
+    def object_digest(hashkey):
+        """Return the content digest of an object, which never changes since objects are addressed by their content."""
+        digest = digest_cache.get(hashkey) if digest_cache is not None else None
+
+        if digest is None:
+            with object_store.open(hashkey) as handle:
+                digest = _stream_digest('fcontent', handle)
+
+            if digest_cache is not None:
+                digest_cache.set(hashkey, 0, 0, digest)
+
+        return digest
+
+    def directory_digests(directory):
+        """Traverse the given manifest directory and yield digests for the contained objects."""
+        for name, entry in sorted(directory.items(), key=itemgetter(0)):
+            if name in ignored_folder_content:
+                continue
+
+            if isinstance(entry, dict):
+                yield _single_digest('dir(', name.encode('utf-8'))
+                for digest in directory_digests(entry):
+                    yield digest
+                yield _END_DIGEST
+            else:
+                yield _single_digest('fname', name.encode('utf-8'))
+                yield object_digest(entry)
+
+    return [_single_digest('folder')] + list(directory_digests(repository._get_manifest_directory()))
@@ -9,6 +9,8 @@
 ###########################################################################
 """ Util methods """
 from datetime import datetime, timedelta
+import base64
+import json
 import urllib.parse
 
 from flask import jsonify
@@ -238,7 +240,14 @@ class Utils:
         return (resource_type, page, node_id, query_type)
 
     def validate_request(
-        self, limit=None, offset=None, perpage=None, page=None, query_type=None, is_querystring_defined=False
+        self,
+        limit=None,
+        offset=None,
+        perpage=None,
+        page=None,
+        query_type=None,
+        is_querystring_defined=False,
+        cursor=None
     ):
         # pylint: disable=fixme,no-self-use,too-many-arguments,too-many-branches
         """
@@ -265,6 +274,9 @@ class Utils:
         # 4. No querystring if query type = projectable_properties'
         if query_type in ('projectable_properties',) and is_querystring_defined:
             raise RestInputValidationError('projectable_properties requests do not allow specifying a query string')
+        # 5. cursor incompatible with pages and offset
+        if cursor is not None and (page is not None or offset is not None):
+            raise RestValidationError('cursor key is incompatible with pages and offset')
 
     def paginate(self, page, perpage, total_count):
         """
@@ -332,13 +344,59 @@ class Utils:
 
         return (limit, offset, rel_pages)
 
-    def build_headers(self, rel_pages=None, url=None, total_count=None):
+    @staticmethod
+    def encode_cursor(values):
+        """
+        Encode the values of the ordered properties of the last result of a page into an opaque cursor, which can be
+        passed with the `cursor` key of the query string to request the results after it (keyset pagination).
+
+        :param values: list of the values of the ordered properties
+        :return: the cursor, a URL safe string
+        """
+
+        def serialize(value):
+            if isinstance(value, datetime):
+                return {'datetime': value.isoformat()}
+            return value
+
+        data = json.dumps([serialize(value) for value in values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """
+        Decode a cursor created by :meth:`Utils.encode_cursor`.
+
+        :param cursor: the cursor string
+        :return: list of the values of the ordered properties
+        :raises RestInputValidationError: if the cursor is invalid
+        """
+        from dateutil import parser as dtparser
+
+        def deserialize(value):
+            if isinstance(value, dict):
+                return dtparser.parse(value['datetime'])
+            return value
+
+        try:
+            data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+            values = json.loads(data)
+            if not isinstance(values, list):
+                raise ValueError('the cursor does not contain a list')
+            return [deserialize(value) for value in values]
+        except (ValueError, TypeError, KeyError):
+            raise RestInputValidationError('the cursor is invalid')
+
+    def build_headers(self, rel_pages=None, url=None, total_count=None, cursor=None):
         """
         Construct the header dictionary for an HTTP response. It includes related
         pages, total count of results (before pagination).
 
         :param rel_pages: a dictionary defining related pages (first, prev, next, last)
         :param url: (string) the full url, i.e. the url that the client uses to get Rest resources
+        :param cursor: (string) the cursor to request the results after those of this response, see
+            :meth:`Utils.encode_cursor`. It is returned in the `X-Next-Cursor` field and in the link to the next
+            results.
         """
 
         ## Type validation
@@ -403,6 +461,19 @@ class Utils:
             else:
                 pass
 
+        # set the cursor of the next results and the link to them
+        if cursor is not None:
+            headers['X-Next-Cursor'] = cursor
+            expose_header.append('X-Next-Cursor')
+
+            if url is not None:
+                (path, query_string, _) = split_url(url)
+                fields = [field for field in query_string.split('&') if field and not field.startswith('cursor=')]
+                fields.append('cursor={}'.format(cursor))
+                headers['Link'] = headers.get('Link', '') + '<{}?{}>; rel=next, '.format(path, '&'.join(fields))
+                if 'Link' not in expose_header:
+                    expose_header.append('Link')
+
         # to expose header access in cross-domain requests
         headers['Access-Control-Expose-Headers'] = ','.join(expose_header)
 
@@ -509,6 +580,7 @@ class Utils:
         extras = None
         extras_filter = None
         full_type = None
+        cursor = None
 
         # io tree limit parameters
         tree_in_limit = None
@@ -562,6 +634,8 @@ class Utils:
             raise RestInputValidationError('You cannot specify extras_filter more than once')
         if 'full_type' in field_counts.keys() and field_counts['full_type'] > 1:
             raise RestInputValidationError('You cannot specify full_type more than once')
+        if 'cursor' in field_counts.keys() and field_counts['cursor'] > 1:
+            raise RestInputValidationError('You cannot specify cursor more than once')
 
         ## Extract results
         for field in field_list:
@@ -616,6 +690,12 @@ class Utils:
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'full_type'")
 
+            elif field[0] == 'cursor':
+                if field[1] == '=':
+                    cursor = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'cursor'")
+
             elif field[0] == 'in_limit':
                 if field[1] == '=':
                     tree_in_limit = field[2]
@@ -681,7 +761,7 @@ class Utils:
 
         return (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, cursor
         )
 
     def parse_query_string(self, query_string):
@@ -798,7 +878,9 @@ class Utils:
         single_field = Group(key + operator + value)
         list_field = Group(key + (Literal('=in=') | Literal('=notin=')) + value_list)
         orderby_field = Group(key + Literal('=') + value_list)
-        field = (list_field | orderby_field | single_field)
+        # The cursor is an opaque URL safe base64 string
+        cursor_field = Group(Literal('cursor') + Literal('=') + Word(alphanums + '-_'))
+        field = (cursor_field | list_field | orderby_field | single_field)
 
         # Fields separator
         separator = Suppress(Literal('&'))
@@ -148,7 +148,7 @@ class BaseResource(Resource):
         # pylint: disable=unused-variable
         (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, cursor
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -158,7 +158,8 @@ class BaseResource(Resource):
             perpage=perpage,
             page=page,
             query_type=query_type,
-            is_querystring_defined=(bool(query_string))
+            is_querystring_defined=(bool(query_string)),
+            cursor=cursor
         )
 
         ## Treat the projectable_properties case which does not imply access to the DataBase
@@ -184,11 +185,21 @@ class BaseResource(Resource):
                 headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
             else:
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                if cursor is not None:
+                    self.trans.set_after(self.utils.decode_cursor(cursor))
 
             ## Retrieve results
             results = self.trans.get_results()
 
+            if page is None:
+                ## Cursor to request the next results with keyset pagination
+                next_cursor = None
+                if node_id is None and offset is None:
+                    next_after = self.trans.get_next_after()
+                    if next_after is not None:
+                        next_cursor = self.utils.encode_cursor(next_after)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, cursor=next_cursor)
+
         ## Build response and return it
         data = dict(
             method=request.method,
@@ -235,7 +246,7 @@ class Node(BaseResource):
 
         (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, cursor
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -245,7 +256,8 @@ class Node(BaseResource):
             perpage=perpage,
             page=page,
             query_type=query_type,
-            is_querystring_defined=(bool(query_string))
+            is_querystring_defined=(bool(query_string)),
+            cursor=cursor
         )
 
         ## Treat the projectable properties case which does not imply access to the DataBase
@@ -312,6 +324,9 @@ class Node(BaseResource):
             else:
 
                 self.trans.set_limit_offset(limit=limit, offset=offset)
+                if cursor is not None:
+                    self.trans.set_after(self.utils.decode_cursor(cursor))
+
                 ## Retrieve results
                 results = self.trans.get_results()
 
@@ -333,7 +348,14 @@ class Node(BaseResource):
 
                     results = results['download']['data']
 
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                ## Cursor to request the next results with keyset pagination
+                next_cursor = None
+                if node_id is None and offset is None and query_type == 'default':
+                    next_after = self.trans.get_next_after()
+                    if next_after is not None:
+                        next_cursor = self.utils.encode_cursor(next_after)
+
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, cursor=next_cursor)
 
             if attributes_filter is not None and attributes:
                 for node in results['nodes']:
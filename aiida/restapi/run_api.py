@@ -37,6 +37,7 @@ def run_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **kwargs)
     :param catch_internal_server:  If true, catch and print all inter server errors
     :param debug: enable debugging
     :param wsgi_profile: use WSGI profiler middleware for finding bottlenecks in web application
+    :param approximate_count: use the estimates of the query planner for the total counts of the results
     :param hookup: If true, hook up application to built-in server, else just return it. This parameter
         is deprecated as of AiiDA 1.2.1. If you don't intend to run the API (hookup=False) use `configure_api` instead.
 
@@ -79,6 +80,7 @@ def configure_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **k
     :param config: directory containing the config.py file used to configure the RESTapi
     :param catch_internal_server:  If true, catch and print all inter server errors
     :param wsgi_profile: use WSGI profiler middleware for finding bottlenecks in web application
+    :param approximate_count: use the estimates of the query planner for the total counts of the results
 
     :returns: Flask RESTful API
     :rtype: :py:class:`flask_restful.Api`
@@ -88,6 +90,7 @@ def configure_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **k
     config = kwargs.pop('config', CLI_DEFAULTS['CONFIG_DIR'])
     catch_internal_server = kwargs.pop('catch_internal_server', CLI_DEFAULTS['CATCH_INTERNAL_SERVER'])
     wsgi_profile = kwargs.pop('wsgi_profile', CLI_DEFAULTS['WSGI_PROFILE'])
+    approximate_count = kwargs.pop('approximate_count', CLI_DEFAULTS['APPROXIMATE_COUNT'])
 
     if kwargs:
         raise ValueError('Unknown keyword arguments: {}'.format(kwargs))
@@ -120,4 +123,4 @@ def configure_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **k
         app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30])
 
     # Instantiate and return a Flask RESTful API by associating its app
-    return flask_api(app, **API_CONFIG)
+    return flask_api(app, APPROXIMATE_COUNT=approximate_count, **API_CONFIG)
@@ -41,6 +41,11 @@ class BaseTranslator:
     _is_id_query = None
     _total_count = None
 
+    # Limit of the query, and the number of results and last result row of the query, for keyset pagination
+    _limit = None
+    _result_count = 0
+    _last_result = None
+
     def __init__(self, **kwargs):
         """
         Initialise the parameters.
@@ -70,6 +75,7 @@ class BaseTranslator:
         self.qbobj = QueryBuilder()
 
         self.limit_default = kwargs['LIMIT_DEFAULT']
+        self.approximate_count = kwargs.get('APPROXIMATE_COUNT', False)
         self.schema = None
 
     def __repr__(self):
@@ -102,10 +108,11 @@ class BaseTranslator:
 
     def count(self):
         """
-        Count the number of rows returned by the query and set total_count
+        Count the number of rows returned by the query and set total_count, which is estimated by the query planner
+        for large results if the `APPROXIMATE_COUNT` option is set
         """
         if self._is_qb_initialized:
-            self._total_count = self.qbobj.count()
+            self._total_count = self.qbobj.count(approximate=self.approximate_count)
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
@@ -389,6 +396,7 @@ class BaseTranslator:
         if self._is_qb_initialized:
             if limit is not None:
                 self.qbobj.limit(limit)
+                self._limit = limit
             else:
                 pass
             if offset is not None:
@@ -398,6 +406,46 @@ class BaseTranslator:
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
+    def set_after(self, after):
+        """
+        Only return the results after the one with the given values of the ordered properties (keyset pagination)
+
+        :param after: list of the values of the ordered properties, as returned by :meth:`get_next_after`
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        order_count = sum(len(columns) for columns in self._query_help['order_by'].values())
+        if not isinstance(after, list) or len(after) != order_count:
+            raise RestInputValidationError('the cursor does not match the requested order')
+
+        self.qbobj.after(after)
+
+    def get_next_after(self):
+        """
+        Return the values of the ordered properties of the last result, to request the next results with
+        :meth:`set_after`. Must be called after :meth:`get_results`.
+
+        :return: list of the values of the ordered properties, or None if there are no more results
+        """
+        if self._last_result is None or self._limit is None or self._result_count < self._limit:
+            return None
+
+        order_by = self._query_help['order_by']
+
+        try:
+            return [self._last_result[tag][column] for tag, columns in order_by.items() for column in columns]
+        except KeyError:
+            pass
+
+        # Not all ordered properties are projected, so they have to be queried for the last result
+        queryhelp = self.qbobj.queryhelp
+        query_help = dict(self._query_help, project={tag: list(columns) for tag, columns in order_by.items()})
+        builder = QueryBuilder(**query_help).after(queryhelp['after'])
+        builder.offset((queryhelp['offset'] or 0) + self._result_count - 1).limit(1)
+
+        return builder.first()
+
     def get_formatted_result(self, label):
         """
         Runs the query and retrieves results tagged as "label".
@@ -412,8 +460,12 @@ class BaseTranslator:
             raise InvalidOperation('query builder object has not been initialized.')
 
         results = []
+        self._result_count = 0
+        self._last_result = None
         if self._total_count > 0:
             for res in self.qbobj.dict():
+                self._result_count += 1
+                self._last_result = res
                 tmp = res[label]
 
                 # Note: In code cleanup and design change, remove this node dependant part
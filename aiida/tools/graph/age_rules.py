@@ -310,6 +310,58 @@ class ReplaceRule(QueryRule):
         return operational_set.copy()
 
 
+class LinkGraphRule(Operation):
+    """
+    The LinkGraphRule accumulates the nodes visited like the UpdateRule, but follows the links in an in-memory
+    :py:class:`~aiida.tools.graph.link_graph.LinkGraph` instead of querying the database, expanding all walkers of an
+    iteration at once.
+    """
+
+    def __init__(self, link_graph, link_types, direction='forward', max_iterations=1, track_edges=False):
+        """Initialization method
+
+        :param link_graph: the `LinkGraph` whose links to follow
+        :param link_types: the `LinkType` of the links to follow
+        :param direction: ``forward`` to follow links from their source to their target, or ``backward`` to follow
+            them from their target to their source
+        :param max_iterations: maximum number of iterations to perform
+        :param bool track_edges: whether to track which edges are traversed and store them
+        """
+        from aiida.tools.graph.link_graph import LinkGraph
+
+        type_check(link_graph, LinkGraph)
+
+        if direction not in ('forward', 'backward'):
+            raise ValueError('direction has to be either `forward` or `backward`, but it is: {}'.format(direction))
+
+        super().__init__(max_iterations, track_edges=track_edges)
+        self._link_graph = link_graph
+        self._link_types = list(link_types)
+        self._direction = direction
+
+    def run(self, operational_set):
+        type_check(operational_set, Basket)
+        accumulator_set = operational_set.copy()
+        self._iterations_done = 0
+        new_results = operational_set.get_template()
+
+        while (operational_set and self._iterations_done < self._max_iterations):
+            self._iterations_done += 1
+            new_results.empty()
+
+            nodes, links = self._link_graph.expand(
+                operational_set['nodes'].keyset, self._link_types, self._direction, get_links=self._track_edges
+            )
+            new_results['nodes'].keyset = nodes
+            if self._track_edges:
+                new_results['nodes_nodes'].keyset = links
+
+            operational_set = new_results - accumulator_set
+            accumulator_set += new_results
+
+        return accumulator_set.copy()
+
+
 class RuleSaveWalkers(Operation):
     """Save the Walkers:
 
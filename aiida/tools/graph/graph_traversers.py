@@ -158,12 +158,29 @@ def validate_traversal_rules(ruleset=GraphTraversalRules.DEFAULT, **kwargs):
     return valid_output
 
 
-def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_forward=(), links_backward=()):
+def traverse_graph(
+    starting_pks,
+    max_iterations=None,
+    get_links=False,
+    links_forward=(),
+    links_backward=(),
+    engine=None,
+    link_graph=None
+):
     """
     This function will return the set of all nodes that can be connected
     to a list of initial nodes through any sequence of specified links.
     Optionally, it may also return the links that connect these nodes.
 
+    The traversal is performed by the engine set by the ``graph.traversal_engine`` option, unless specified.
+    The ``age`` engine applies the rules of the AiiDA Graph Explorer, with one query per rule per iteration.
+    The ``sql`` engine finds all the nodes with a single recursive query inside the database instead, which avoids
+    passing the growing sets of pks back and forth, but it only supports an unlimited number of iterations, so the
+    ``age`` engine is always used if ``max_iterations`` is set.
+
+    If a ``link_graph`` is passed, the ``age`` engine follows the links of that in-memory snapshot instead of querying
+    the database, which is much faster for repeated traversals of the same graph.
+
     :type starting_pks: list or tuple or set
     :param starting_pks: Contains the (valid) pks of the starting nodes.
 
@@ -182,12 +199,23 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
     :type links_backward: aiida.common.links.LinkType
     :param links_backward:
         List with all the links that should be traversed in the backward direction.
+
+    :param str engine: the traversal engine, either ``age`` or ``sql``.
+
+    :type link_graph: :py:class:`aiida.tools.graph.link_graph.LinkGraph`
+    :param link_graph: optional snapshot of the links to traverse instead of those in the database.
     """
-    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches,too-many-arguments
     from aiida import orm
     from aiida.tools.graph.age_entities import Basket
-    from aiida.tools.graph.age_rules import UpdateRule, RuleSequence, RuleSaveWalkers, RuleSetWalkers
+    from aiida.tools.graph.age_rules import LinkGraphRule, UpdateRule, RuleSequence, RuleSaveWalkers, RuleSetWalkers
     from aiida.common import exceptions
+    from aiida.manage.configuration import get_config_option
+
+    if engine is None:
+        engine = get_config_option('graph.traversal_engine')
+    elif engine not in ('age', 'sql'):
+        raise ValueError('engine has to be either `age` or `sql`, but it is: {}'.format(engine))
 
     if max_iterations is None:
         max_iterations = inf
@@ -231,6 +259,11 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
             'The following pks are not in the database and must be pruned before this   call: {}'.format(missing_pks)
         )
 
+    if engine == 'sql' and max_iterations is inf and link_graph is None:
+        return _traverse_graph_sql(
+            operational_set, get_links, filters_forwards['type']['in'], filters_backwards['type']['in']
+        )
+
     rules = []
     basket = Basket(nodes=operational_set)
 
@@ -246,7 +279,9 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
         stash = basket.get_template()
         rules += [RuleSaveWalkers(stash)]
 
-    if links_forward:
+    if links_forward and link_graph is not None:
+        rules += [LinkGraphRule(link_graph, links_forward, 'forward', max_iterations=1, track_edges=get_links)]
+    elif links_forward:
         query_outgoing = orm.QueryBuilder()
         query_outgoing.append(orm.Node, tag='sources')
         query_outgoing.append(orm.Node, edge_filters=filters_forwards, with_incoming='sources')
@@ -256,7 +291,9 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
     if links_forward and links_backward:
         rules += [RuleSetWalkers(stash)]
 
-    if links_backward:
+    if links_backward and link_graph is not None:
+        rules += [LinkGraphRule(link_graph, links_backward, 'backward', max_iterations=1, track_edges=get_links)]
+    elif links_backward:
         query_incoming = orm.QueryBuilder()
         query_incoming.append(orm.Node, tag='sources')
         query_incoming.append(orm.Node, edge_filters=filters_backwards, with_outgoing='sources')
@@ -274,3 +311,67 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
         output['links'] = results['nodes_nodes'].keyset
 
     return output
+
+
+# The nodes that can be reached from the starting nodes, where the edges are the links of the forward types from their
+# input to their output and the links of the backward types from their output to their input. Since the recursive term
+# uses ``UNION``, nodes that were already reached are discarded, so the recursion ends once no new nodes are found.
+_TRAVERSED_CTE_SQL = """
+WITH RECURSIVE traversed (id) AS (
+    SELECT unnest(CAST(:starting_pks AS integer[]))
+    UNION
+    SELECT edges.target_id
+    FROM traversed
+    JOIN (
+        SELECT input_id AS source_id, output_id AS target_id
+        FROM db_dblink WHERE type = ANY(CAST(:links_forward AS varchar[]))
+        UNION ALL
+        SELECT output_id AS source_id, input_id AS target_id
+        FROM db_dblink WHERE type = ANY(CAST(:links_backward AS varchar[]))
+    ) AS edges ON edges.source_id = traversed.id
+)
+"""
+
+_TRAVERSE_NODES_SQL = _TRAVERSED_CTE_SQL + """
+SELECT id FROM traversed
+"""
+
+# The links that are traversed from the nodes that were reached, all of which connect two of those nodes
+_TRAVERSE_LINKS_SQL = _TRAVERSED_CTE_SQL + """
+SELECT input_id, output_id, type, label FROM db_dblink
+WHERE (type = ANY(CAST(:links_forward AS varchar[])) AND input_id IN (SELECT id FROM traversed))
+OR (type = ANY(CAST(:links_backward AS varchar[])) AND output_id IN (SELECT id FROM traversed))
+"""
+
+
+def _traverse_graph_sql(starting_pks, get_links, links_forward, links_backward):
+    """Traverse the graph with a recursive query inside the database, see `traverse_graph`.
+
+    The queries run on the connection of the session of the backend, such that they see the same data as the rest of
+    the ORM, including changes that are not yet committed.
+
+    :param starting_pks: set of the pks of the starting nodes, which should exist
+    :param bool get_links: pass True to also return the links between all nodes
+    :param links_forward: list with the values of the link types to traverse in the forward direction
+    :param links_backward: list with the values of the link types to traverse in the backward direction
+    :return: dictionary with the set of node pks and the set of `LinkQuadruple` or None
+    """
+    from sqlalchemy import text
+    from aiida.manage.manager import get_manager
+    from aiida.orm.utils.links import LinkQuadruple
+
+    parameters = {
+        'starting_pks': list(starting_pks),
+        'links_forward': list(links_forward),
+        'links_backward': list(links_backward),
+    }
+
+    connection = get_manager().get_backend().get_session().connection()
+
+    nodes = {pk for pk, in connection.execute(text(_TRAVERSE_NODES_SQL), parameters)}
+
+    links = None
+    if get_links:
+        links = {LinkQuadruple(*row) for row in connection.execute(text(_TRAVERSE_LINKS_SQL), parameters)}
+
+    return {'nodes': nodes, 'links': links}
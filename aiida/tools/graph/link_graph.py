@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""In-memory snapshot of the links between nodes for fast repeated traversals of the provenance graph."""
+import numpy as np
+
+from aiida.common.links import LinkType
+from aiida.orm.utils.links import LinkQuadruple
+
+__all__ = ('LinkGraph',)
+
+# The codes of the link types, which are the indices of the types in this tuple
+LINK_TYPE_VALUES = tuple(link_type.value for link_type in LinkType)
+
+
+class LinkGraph:
+    """Snapshot of the links between nodes, stored as compressed sparse row (CSR) adjacency arrays indexed by pk.
+
+    Every link is stored once, with its id, source, target and the codes of its type and label, in arrays ordered by
+    the link id. For each direction, an index array ``indptr`` over the pks and an ``order`` array of link positions
+    are kept, such that the links of node ``pk`` are ``order[indptr[pk]:indptr[pk + 1]]``. This allows to expand a
+    whole set of nodes along its links with a few vectorized operations, without querying the database.
+
+    The snapshot is loaded when it is constructed and only changes when :meth:`refresh` is called. Links are never
+    removed, except when the database is reset, so only the links with an id larger than the last loaded one are
+    fetched, unless links have been deleted since, in which case all links are loaded again.
+    """
+
+    def __init__(self):
+        self._reset()
+        self.refresh()
+
+    def __len__(self):
+        return len(self._link_ids)
+
+    def _reset(self):
+        """Remove all links from the snapshot."""
+        self._link_ids = np.empty(0, dtype=np.int64)
+        self._sources = np.empty(0, dtype=np.int64)
+        self._targets = np.empty(0, dtype=np.int64)
+        self._type_codes = np.empty(0, dtype=np.int8)
+        self._label_codes = np.empty(0, dtype=np.int32)
+        self._labels = []
+        self._label_index = {}
+        self._forward = self._build_index(self._sources, 0)
+        self._backward = self._build_index(self._targets, 0)
+
+    @staticmethod
+    def _build_index(keys, size):
+        """Return the CSR index of the links keyed on the given node pks.
+
+        :param keys: array with the pk of the node of each link by which the links should be indexed
+        :param size: the number of pks to index, which should be larger than any key
+        :return: tuple of the ``indptr`` array of length ``size + 1`` and the ``order`` array of link positions
+        """
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+        order = np.argsort(keys, kind='stable')
+        return indptr, order
+
+    def refresh(self):
+        """Load the links that have been added to the database since the snapshot was loaded or last refreshed.
+
+        :return: the number of links that were loaded
+        """
+        from sqlalchemy import text
+        from aiida.manage.manager import get_manager
+
+        last_id = int(self._link_ids[-1]) if len(self._link_ids) else 0
+        engine = get_manager().get_backend().get_session().get_bind()
+
+        with engine.begin() as connection:
+            # If links with an id up to the last loaded one were deleted or committed out of order, reload everything
+            count = connection.execute(text('SELECT count(*) FROM db_dblink WHERE id <= :last_id'), last_id=last_id)
+            if count.scalar() != len(self._link_ids):
+                self._reset()
+                last_id = 0
+
+            rows = connection.execute(
+                text('SELECT id, input_id, output_id, type, label FROM db_dblink WHERE id > :last_id ORDER BY id'),
+                last_id=last_id
+            ).fetchall()
+
+        if not rows:
+            return 0
+
+        link_ids, sources, targets, types, labels = zip(*rows)
+        type_codes = [LINK_TYPE_VALUES.index(link_type) for link_type in types]
+
+        self._link_ids = np.concatenate([self._link_ids, np.array(link_ids, dtype=np.int64)])
+        self._sources = np.concatenate([self._sources, np.array(sources, dtype=np.int64)])
+        self._targets = np.concatenate([self._targets, np.array(targets, dtype=np.int64)])
+        self._type_codes = np.concatenate([self._type_codes, np.array(type_codes, dtype=np.int8)])
+        self._label_codes = np.concatenate([self._label_codes, np.array(self._get_label_codes(labels), dtype=np.int32)])
+
+        size = int(max(self._sources.max(), self._targets.max())) + 1
+        self._forward = self._build_index(self._sources, size)
+        self._backward = self._build_index(self._targets, size)
+
+        return len(rows)
+
+    def _get_label_codes(self, labels):
+        """Return the codes of the given labels, assigning new codes to labels that were not seen before.
+
+        :param labels: iterable of link labels
+        :return: list of label codes
+        """
+        codes = []
+
+        for label in labels:
+            try:
+                codes.append(self._label_index[label])
+            except KeyError:
+                self._label_index[label] = len(self._labels)
+                self._labels.append(label)
+                codes.append(self._label_index[label])
+
+        return codes
+
+    def expand(self, pks, link_types, direction='forward', get_links=False):
+        """Return the nodes that are reached from the given nodes by following one of their links of the given types.
+
+        :param pks: iterable of the pks of the nodes to expand
+        :param link_types: iterable of the `LinkType` of the links to follow
+        :param direction: ``forward`` to follow links from their source to their target, or ``backward`` to follow them
+            from their target to their source
+        :param bool get_links: pass True to also return the links that were followed
+        :return: tuple of the set of pks that were reached and the set of `LinkQuadruple` of the links that were
+            followed, or None if ``get_links`` is False
+        """
+        if direction == 'forward':
+            indptr, order = self._forward
+            reached = self._targets
+        elif direction == 'backward':
+            indptr, order = self._backward
+            reached = self._sources
+        else:
+            raise ValueError('direction has to be either `forward` or `backward`, but it is: {}'.format(direction))
+
+        frontier = np.fromiter(pks, dtype=np.int64)
+        frontier = frontier[(frontier >= 0) & (frontier < len(indptr) - 1)]
+
+        # Gather the positions of the links of all nodes in the frontier by offsetting a range of the total number of
+        # links with the start of the links of each node, minus the number of links of the nodes before it
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        positions = order[offsets]
+
+        type_codes = [LINK_TYPE_VALUES.index(LinkType(link_type).value) for link_type in link_types]
+        positions = positions[np.isin(self._type_codes[positions], type_codes)]
+
+        links = None
+        if get_links:
+            links = set(
+                LinkQuadruple(source, target, LINK_TYPE_VALUES[type_code], self._labels[label_code])
+                for source, target, type_code, label_code in zip(
+                    self._sources[positions].tolist(), self._targets[positions].tolist(),
+                    self._type_codes[positions].tolist(), self._label_codes[positions].tolist()
+                )
+            )
+
+        return set(np.unique(reached[positions]).tolist()), links
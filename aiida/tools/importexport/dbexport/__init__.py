@@ -17,7 +17,7 @@ import time
 from aiida import get_version, orm
 from aiida.common import json
 from aiida.common.exceptions import LicensingException
-from aiida.common.folders import RepositoryFolder, SandboxFolder, Folder
+from aiida.common.folders import SandboxFolder, Folder
 from aiida.common.lang import type_check
 from aiida.common.log import override_log_formatter, LOG_LEVEL_REPORT
 from aiida.orm.utils.repository import Repository
@@ -717,14 +717,14 @@ def export_tree(
             thisnodefolder = nodesubfolder.get_subfolder(sharded_uuid, create=False, reset_limit=True)
 
             # Make sure the node's repository folder was not deleted
-            src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
-            if not src.exists():
+            repository = Repository(uuid=uuid, is_stored=True)
+            if not repository.exists():
                 raise exceptions.ArchiveExportError(
                     'Unable to find the repository folder for Node with UUID={} in the local repository'.format(uuid)
                 )
 
             # In this way, I copy the content of the folder, and not the folder itself
-            thisnodefolder.insert_path(src=src.abspath, dest_name='.')
+            thisnodefolder.insert_path(src=repository._get_base_folder().abspath, dest_name='.')  # pylint: disable=protected-access
 
     close_progress_bar(leave=False)
 
@@ -23,7 +23,7 @@ from aiida.common.links import LinkType, validate_link_label
 from aiida.common.log import override_log_formatter
 from aiida.common.utils import grouper, get_object_from_string
 from aiida.manage.configuration import get_config_option
-from aiida.orm.utils.repository import Repository
+from aiida.orm.utils.repository import Repository, is_object_store_enabled
 from aiida.orm import QueryBuilder, Node, Group, ImportGroup
 
 from aiida.tools.importexport.common import exceptions, get_progress_bar, close_progress_bar
@@ -446,11 +446,17 @@ def import_data_dj(
                                 'Unable to find the repository folder for Node with UUID={} in the exported '
                                 'file'.format(import_entry_uuid)
                             )
-                        destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
-                        # Replace the folder, possibly destroying existing previous folders, and move the files
-                        # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
                         progress_bar.set_description_str(pbar_node_base_str + 'Repository', refresh=True)
-                        destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
+                        if is_object_store_enabled():
+                            # Add the files to the object store, which will skip those that are already present
+                            repository = Repository(uuid=import_entry_uuid, is_stored=False)
+                            repository.put_object_from_tree(subfolder.abspath)
+                            repository.store()
+                        else:
+                            destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
+                            # Replace the folder, possibly destroying existing previous folders, and move the files
+                            # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
+                            destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
 
                         # For DbNodes, we also have to store its attributes
                         IMPORT_LOGGER.debug('STORING NEW NODE ATTRIBUTES...')
@@ -24,7 +24,7 @@ from aiida.common.log import override_log_formatter
 from aiida.common.utils import get_object_from_string
 from aiida.orm import QueryBuilder, Node, Group, ImportGroup
 from aiida.orm.utils.links import link_triple_exists, validate_link
-from aiida.orm.utils.repository import Repository
+from aiida.orm.utils.repository import Repository, is_object_store_enabled
 
 from aiida.tools.importexport.common import exceptions, get_progress_bar, close_progress_bar
 from aiida.tools.importexport.common.archive import extract_tree, extract_tar, extract_zip
@@ -516,11 +516,17 @@ def import_data_sqla(
                                 'Unable to find the repository folder for Node with UUID={} in the exported '
                                 'file'.format(import_entry_uuid)
                             )
-                        destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
-                        # Replace the folder, possibly destroying existing previous folders, and move the files
-                        # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
                         progress_bar.set_description_str(pbar_node_base_str + 'Repository', refresh=True)
-                        destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
+                        if is_object_store_enabled():
+                            # Add the files to the object store, which will skip those that are already present
+                            repository = Repository(uuid=import_entry_uuid, is_stored=False)
+                            repository.put_object_from_tree(subfolder.abspath)
+                            repository.store()
+                        else:
+                            destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
+                            # Replace the folder, possibly destroying existing previous folders, and move the files
+                            # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
+                            destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
 
                         # For Nodes, we also have to store Attributes!
                         IMPORT_LOGGER.debug('STORING NEW NODE ATTRIBUTES...')
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=import-error,no-name-in-module,invalid-name
+"""Test migration that adds an index on the `_aiida_hash` extra of nodes."""
+
+from .test_migrations_common import TestMigrations
+
+
+class TestDbNodeExtrasHashIndexMigration(TestMigrations):
+    """Test migration that adds an index on the `_aiida_hash` extra of nodes."""
+
+    migrate_from = '0044_dbgroup_type_string'
+    migrate_to = '0045_dbnode_extras_hash_index'
+
+    def test_hash_index(self):
+        """Test that the index on the hash extra was created."""
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_db_dbnode_extras_aiida_hash'")
+            indexdefs = [row[0] for row in cursor.fetchall()]
+
+        self.assertEqual(len(indexdefs), 1)
+        self.assertIn('_aiida_hash', indexdefs[0])
@@ -132,3 +132,63 @@ class TestGroupsDjango(AiidaTestCase):
 
         self.assertEqual(grp.pk, gcopy.pk)
         self.assertEqual(grp.uuid, gcopy.uuid)
+
+
+class TestNodeDjango(AiidaTestCase):
+    """Test the Django implementation of the Node class."""
+
+    def test_deferred_json_columns(self):
+        """Test that the attributes and extras of a loaded node are only loaded from the database once accessed."""
+        node = Data()
+        node.set_attribute('attribute', 'value')
+        node.set_extra('extra', 'value')
+        node.store()
+
+        for loaded in [orm.load_node(node.pk), self.backend.nodes.get(node.pk)]:
+            dbmodel = loaded.backend_entity.dbmodel if isinstance(loaded, orm.Node) else loaded.dbmodel
+            self.assertTrue({'attributes', 'extras'}.issubset(dbmodel.get_deferred_fields()))
+
+            # Getting a single key fetches only the value of that key
+            self.assertEqual(loaded.get_attribute('attribute'), 'value')
+            self.assertEqual(loaded.get_extra('extra'), 'value')
+            self.assertIn('attributes', dbmodel.get_deferred_fields())
+
+            self.assertEqual(loaded.attributes, {'attribute': 'value'})
+
+
+class TestResultCacheDjango(AiidaTestCase):
+    """Test the invalidation of the results cached by the `QueryBuilder` for Django connections."""
+
+    def setUp(self):
+        from aiida.manage import configuration
+        from aiida.orm import querybuilder
+
+        super().setUp()
+        config = configuration.get_config()
+        config.set_option('querybuilder.result_cache_size', 100, scope=config.current_profile.name)
+        querybuilder._RESULT_CACHE = None  # pylint: disable=protected-access
+
+    def tearDown(self):
+        from aiida.manage import configuration
+        from aiida.orm import querybuilder
+
+        config = configuration.get_config()
+        config.unset_option('querybuilder.result_cache_size', scope=config.current_profile.name)
+        querybuilder._RESULT_CACHE = None  # pylint: disable=protected-access
+        super().tearDown()
+
+    def test_single_on_commit(self):
+        """Test that a transaction that writes many times registers a single callback to invalidate the cache."""
+        from django.db import connection, transaction
+        from aiida.orm import querybuilder
+
+        write_counter = querybuilder._WRITE_COUNTER  # pylint: disable=protected-access
+
+        with transaction.atomic():
+            for value in range(3):
+                orm.Int(value).store()
+
+            callbacks = [func for _, func in connection.run_on_commit]
+            self.assertEqual(callbacks.count(querybuilder.invalidate_result_cache), 1)
+
+        self.assertEqual(querybuilder._WRITE_COUNTER, write_counter + 1)  # pylint: disable=protected-access
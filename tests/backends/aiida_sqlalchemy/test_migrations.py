@@ -1708,3 +1708,24 @@ class TestGroupTypeStringMigration(TestMigrationsSQLA):
                 self.assertEqual(group_autorun.type_string, 'core.auto')
             finally:
                 session.close()
+
+
+class TestDbNodeExtrasHashIndexMigration(TestMigrationsSQLA):
+    """Test the migration that adds an index on the `_aiida_hash` extra of nodes."""
+
+    migrate_from = 'bf591f31dd12'  # bf591f31dd12_dbgroup_type_string.py
+    migrate_to = '3a5c1f6e7d2b'  # 3a5c1f6e7d2b_dbnode_extras_hash_index.py
+
+    def test_hash_index(self):
+        """Test that the index on the hash extra was created."""
+        from sqlalchemy.sql import text
+
+        with self.get_session() as session:
+            try:
+                indexdefs = session.execute(
+                    text("SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_db_dbnode_extras_aiida_hash'")
+                ).fetchall()
+                self.assertEqual(len(indexdefs), 1)
+                self.assertIn('_aiida_hash', indexdefs[0][0])
+            finally:
+                session.close()
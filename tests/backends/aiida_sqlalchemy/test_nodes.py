@@ -98,6 +98,34 @@ class TestNodeBasicSQLA(AiidaTestCase):
         finally:
             session.rollback()
 
+    def test_deferred_json_columns(self):
+        """Test that the attributes and extras of a loaded node are only loaded from the database once accessed."""
+        from sqlalchemy import inspect
+        from aiida.orm import load_node
+        from aiida.backends.sqlalchemy import get_scoped_session
+
+        node = Data()
+        node.set_attribute('attribute', 'value')
+        node.set_extra('extra', 'value')
+        node.store()
+
+        # Remove the model from the session, otherwise loading the node returns the same instance
+        get_scoped_session().expunge_all()
+
+        for loaded in [load_node(node.pk), self.backend.nodes.get(node.pk)]:
+            dbmodel = loaded.backend_entity.dbmodel if isinstance(loaded, orm.Node) else loaded.dbmodel
+            self.assertIn('attributes', inspect(dbmodel).unloaded)
+            self.assertIn('extras', inspect(dbmodel).unloaded)
+            self.assertNotIn('label', inspect(dbmodel).unloaded)
+
+            # Getting a single key fetches only the value of that key
+            self.assertEqual(loaded.get_attribute('attribute'), 'value')
+            self.assertEqual(loaded.get_extra('extra'), 'value')
+            self.assertIn('attributes', inspect(dbmodel).unloaded)
+
+            self.assertEqual(loaded.attributes, {'attribute': 'value'})
+            get_scoped_session().expunge_all()
+
     def test_multiple_node_creation(self):
         """
         This test checks that a node is not added automatically to the session
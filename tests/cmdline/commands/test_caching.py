@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for `verdi caching`."""
+import json
+
+from click.testing import CliRunner
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.cmdline.commands import cmd_caching
+from aiida.manage.caching import CachingStatistics, reset_caching_statistics
+from aiida.manage.configuration import get_config
+
+
+class TestVerdiCaching(AiidaTestCase):
+    """Tests for `verdi caching`."""
+
+    def setUp(self):
+        config = get_config()
+        config.set_option('caching.statistics', True, scope=config.current_profile.name)
+        reset_caching_statistics()
+        self.cli_runner = CliRunner()
+
+    def tearDown(self):
+        reset_caching_statistics()
+        config = get_config()
+        config.unset_option('caching.statistics', scope=config.current_profile.name)
+
+    def test_stats(self):
+        """Test that `verdi caching stats` shows the recorded statistics, also as JSON."""
+        result = self.cli_runner.invoke(cmd_caching.caching_stats, [])
+        self.assertClickResultNoException(result)
+        self.assertIn('no cache lookups have been recorded', result.output)
+
+        statistics = CachingStatistics()
+        statistics.record('process.calculation.calcfunction.', 'some.process', hit=True)
+        statistics.record('process.calculation.calcfunction.', 'some.process', hit=False, invalid=1)
+        statistics.flush()
+
+        result = self.cli_runner.invoke(cmd_caching.caching_stats, [])
+        self.assertClickResultNoException(result)
+        self.assertIn('some.process', result.output)
+        self.assertIn('50.0%', result.output)
+
+        result = self.cli_runner.invoke(cmd_caching.caching_stats, ['--json'])
+        self.assertClickResultNoException(result)
+        entries = json.loads(result.output)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['process_type'], 'some.process')
+        self.assertEqual(entries[0]['attempts'], 2)
+        self.assertEqual(entries[0]['invalid'], 1)
+
+    def test_reset(self):
+        """Test that `verdi caching reset` deletes the recorded statistics."""
+        statistics = CachingStatistics()
+        statistics.record('process.calculation.calcfunction.', 'some.process', hit=True)
+        statistics.flush()
+
+        result = self.cli_runner.invoke(cmd_caching.caching_reset, ['--force'])
+        self.assertClickResultNoException(result)
+
+        result = self.cli_runner.invoke(cmd_caching.caching_stats, ['--json'])
+        self.assertClickResultNoException(result)
+        self.assertEqual(json.loads(result.output), [])
@@ -579,6 +579,42 @@ class TestVerdiRehash(AiidaTestCase):
         self.assertClickResultNoException(result)
         self.assertTrue('{} nodes'.format(expected_node_count) in result.output)
 
+    def test_rehash_batches(self):
+        """Rehashing in batches smaller than the number of nodes should rehash all nodes."""
+        from aiida.orm import load_node
+
+        self.node_int.set_extra('_aiida_hash', 'invalid')
+
+        expected_node_count = 5
+        options = ['-f', '--batch-size', '2']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue('{} nodes'.format(expected_node_count) in result.output)
+        self.assertEqual(load_node(self.node_int.pk).get_extra('_aiida_hash'), self.node_int.get_hash())
+
+    def test_rehash_resume(self):
+        """Resuming a run should only rehash the nodes after the recorded cursor, which is removed upon completion."""
+        from aiida.common.exceptions import NotExistent
+        from aiida.manage.manager import get_manager
+
+        settings = get_manager().get_backend_manager().get_settings_manager()
+        settings.set(cmd_node.REHASH_CURSOR_KEY, {'entry_point': None, 'pk': self.node_bool_false.pk})
+
+        expected_node_count = 2
+        options = ['-f', '--resume']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue('{} nodes'.format(expected_node_count) in result.output)
+
+        with self.assertRaises(NotExistent):
+            settings.get(cmd_node.REHASH_CURSOR_KEY)
+
+    def test_rehash_resume_explicit_pk(self):
+        """The resume option cannot be combined with explicit identifiers."""
+        options = ['-f', '--resume', str(self.node_bool_true.pk)]
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertIsNotNone(result.exception)
+
     def test_rehash_entry_point_no_matches(self):
         """Limiting the queryset by defining explicit entry point, with no nodes should exit with non-zero status."""
         options = ['-f', '-e', 'aiida.data:structure']
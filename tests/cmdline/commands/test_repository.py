@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for `verdi repository`."""
+import io
+
+from click.testing import CliRunner
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.cmdline.commands import cmd_repository
+from aiida.orm.utils.repository import get_object_store
+
+
+class TestVerdiRepository(AiidaTestCase):
+    """Tests for `verdi repository`."""
+
+    def setUp(self):
+        self.cli_runner = CliRunner()
+
+    def test_repack(self):
+        """Test that `verdi repository repack` moves loose objects into packs."""
+        object_store = get_object_store()
+        hashkey = object_store.add_object_from_filelike(io.BytesIO(b'content'))
+
+        result = self.cli_runner.invoke(cmd_repository.repository_repack, [])
+        self.assertClickResultNoException(result)
+
+        loose, packed = object_store.count_objects()
+        self.assertEqual(loose, 0)
+        self.assertGreaterEqual(packed, 1)
+        self.assertEqual(object_store.get_object_content(hashkey), b'content')
+
+        result = self.cli_runner.invoke(cmd_repository.repository_status, [])
+        self.assertClickResultNoException(result)
+        self.assertIn('Loose objects:  0', result.output)
+
+    def test_clean(self):
+        """Test that `verdi repository clean` deletes objects that are not referenced by any node."""
+        object_store = get_object_store()
+        hashkey = object_store.add_object_from_filelike(io.BytesIO(b'unreferenced'))
+
+        result = self.cli_runner.invoke(cmd_repository.repository_clean, [])
+        self.assertClickResultNoException(result)
+        self.assertFalse(object_store.has_object(hashkey))
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.common.datastructures` module."""
+import unittest
+
+from aiida.common.datastructures import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """Tests for the `LRUCache` class."""
+
+    def test_eviction(self):
+        """Test that the least recently used entries are evicted."""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+
+        cache.set('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_sizeof(self):
+        """Test that the total size of the entries is bounded when a `sizeof` callable is defined."""
+        cache = LRUCache(maxsize=10, sizeof=len)
+        cache.set('a', 'x' * 4)
+        cache.set('b', 'x' * 4)
+        self.assertEqual(cache.currsize, 8)
+
+        cache.set('c', 'x' * 4)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.currsize, 8)
+
+        cache.set('d', 'x' * 11)
+        self.assertNotIn('d', cache)
+
+        cache.maxsize = 4
+        self.assertEqual(list(cache._entries), ['c'])  # pylint: disable=protected-access
+
+    def test_statistics(self):
+        """Test the hit and miss counters."""
+        cache = LRUCache(maxsize=None)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('b')
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_pop_clear(self):
+        """Test the `pop` and `clear` methods."""
+        cache = LRUCache(maxsize=None)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertIsNone(cache.pop('a'))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.currsize, 0)
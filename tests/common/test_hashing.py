@@ -13,6 +13,8 @@ Unittests for aiida.common.hashing:make_hash with hardcoded hash values
 
 import itertools
 import collections
+import os
+import tempfile
 from datetime import datetime
 import uuid
 
@@ -24,7 +26,8 @@ try:
 except ImportError:
     import unittest
 
-from aiida.common.hashing import make_hash, float_to_text
+from aiida.common.hashing import make_hash, float_to_text, get_file_content_digest, FileDigestCache, \
+    HASHING_CHUNK_SIZE, _single_digest
 from aiida.common.folders import SandboxFolder
 from aiida.backends.testbase import AiidaTestCase
 from aiida.orm import Dict
@@ -210,6 +213,57 @@ class MakeHashTest(unittest.TestCase):
             self.assertNotEqual(make_hash(folder), folder_hash)
             self.assertEqual(make_hash(folder, ignored_folder_content=['file3.npy', 'some_subdir']), folder_hash)
 
+    def test_folder_digest_cache(self):
+        """The folder hash should not depend on whether file digests are streamed or retrieved from the cache."""
+        with SandboxFolder(sandbox_in_repo=False) as folder, tempfile.TemporaryDirectory() as dirpath:
+            content = os.urandom(3 * HASHING_CHUNK_SIZE + 7)
+            with folder.open('large', 'wb') as handle:
+                handle.write(content)
+
+            filepath = folder.get_abs_path('large')
+            self.assertEqual(get_file_content_digest(filepath), _single_digest('fcontent', content))
+
+            # Make the file old enough to be added to the cache
+            os.utime(filepath, (0, 0))
+            digest_cache = FileDigestCache(os.path.join(dirpath, 'digests.sqlite'))
+            folder_hash = make_hash(folder)
+
+            self.assertEqual(make_hash(folder, digest_cache=digest_cache), folder_hash)
+            self.assertEqual(len(digest_cache), 1)
+            self.assertEqual(make_hash(folder, digest_cache=digest_cache), folder_hash)
+
+            # A modification of the file invalidates the cached digest
+            with folder.open('large', 'ab') as handle:
+                handle.write(b'more')
+
+            self.assertNotEqual(make_hash(folder, digest_cache=digest_cache), folder_hash)
+            self.assertEqual(make_hash(folder, digest_cache=digest_cache), make_hash(folder))
+
+            digest_cache.clear()
+            self.assertEqual(len(digest_cache), 0)
+
+    def test_digest_cache_locked(self):
+        """A database that is locked by another process should be treated as a cache miss instead of failing."""
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, 'digests.sqlite')
+            digest_cache = FileDigestCache(filepath, timeout=0)
+            digest_cache.set('path', 1, 1, b'digest')
+            self.assertEqual(digest_cache.get('path', 1, 1), b'digest')
+
+            connection = sqlite3.connect(filepath)
+            try:
+                connection.execute('BEGIN EXCLUSIVE')
+                self.assertIsNone(digest_cache.get('path', 1, 1))
+                digest_cache.set('other', 1, 1, b'digest')
+            finally:
+                connection.rollback()
+                connection.close()
+
+            self.assertEqual(digest_cache.get('path', 1, 1), b'digest')
+            self.assertIsNone(digest_cache.get('other', 1, 1))
+
 
 class CheckDBRoundTrip(AiidaTestCase):
     """
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.common.objectstore` module."""
+import hashlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from aiida.common.objectstore import ObjectStore
+
+
+class TestObjectStore(unittest.TestCase):
+    """Tests for the `ObjectStore` class."""
+
+    def setUp(self):
+        self.basepath = tempfile.mkdtemp()
+        self.store = ObjectStore(self.basepath)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.basepath)
+
+    def test_add_object_from_filelike(self):
+        """Test that the key of an object is the hash of its content."""
+        content = b'some content'
+        hashkey = self.store.add_object_from_filelike(io.BytesIO(content))
+
+        self.assertEqual(hashkey, hashlib.sha256(content).hexdigest())
+        self.assertTrue(self.store.has_object(hashkey))
+        self.assertEqual(self.store.get_object_content(hashkey), content)
+
+    def test_add_object_from_filelike_encoding(self):
+        """Test that text content is encoded when an encoding is specified."""
+        content = 'sąžininga'
+        hashkey = self.store.add_object_from_filelike(io.StringIO(content), encoding='utf8')
+
+        self.assertEqual(self.store.get_object_content(hashkey), content.encode('utf8'))
+
+    def test_deduplication(self):
+        """Test that identical content is only stored once."""
+        hashkeys = [self.store.add_object_from_filelike(io.BytesIO(b'content')) for _ in range(3)]
+
+        self.assertEqual(len(set(hashkeys)), 1)
+        self.assertEqual(list(self.store.iter_object_keys()), hashkeys[:1])
+        self.assertEqual(os.listdir(os.path.join(self.basepath, 'sandbox')), [])
+
+    def test_delete_object(self):
+        """Test the `delete_object` method."""
+        hashkey = self.store.add_object_from_filelike(io.BytesIO(b'content'))
+        self.store.delete_object(hashkey)
+
+        self.assertFalse(self.store.has_object(hashkey))
+
+        with self.assertRaises(IOError):
+            self.store.open(hashkey)
+
+        with self.assertRaises(IOError):
+            self.store.delete_object(hashkey)
+
+    def test_repack(self):
+        """Test that `repack` moves small loose objects into packs that can still be read."""
+        contents = [('content {}'.format(index) * (index + 1)).encode('utf8') for index in range(20)]
+        hashkeys = [self.store.add_object_from_filelike(io.BytesIO(content)) for content in contents]
+        hashkey_large = self.store.add_object_from_filelike(io.BytesIO(b'a' * 1000))
+
+        count = self.store.repack(max_object_size=500, pack_size_target=100, batch_size=3)
+
+        self.assertEqual(count, len(contents))
+        self.assertEqual(self.store.count_objects(), (1, len(contents)))
+        self.assertGreater(len(os.listdir(os.path.join(self.basepath, 'packs'))), 1)
+
+        for hashkey, content in zip(hashkeys, contents):
+            self.assertTrue(self.store.has_object(hashkey))
+            self.assertEqual(self.store.get_object_content(hashkey), content)
+
+        self.assertEqual(self.store.get_object_content(hashkey_large), b'a' * 1000)
+        self.assertEqual(sorted(self.store.iter_object_keys()), sorted(hashkeys + [hashkey_large]))
+
+    def test_repack_add_existing(self):
+        """Test that adding an object that is already packed does not create a loose copy."""
+        hashkey = self.store.add_object_from_filelike(io.BytesIO(b'content'))
+        self.store.repack()
+
+        self.assertEqual(self.store.add_object_from_filelike(io.BytesIO(b'content')), hashkey)
+        self.assertEqual(self.store.count_objects(), (0, 1))
+
+    def test_delete_packed_object(self):
+        """Test the `delete_object` method for a packed object."""
+        hashkey = self.store.add_object_from_filelike(io.BytesIO(b'content'))
+        self.store.repack()
+        self.store.delete_object(hashkey)
+
+        self.assertFalse(self.store.has_object(hashkey))
+        self.assertEqual(self.store.count_objects(), (0, 0))
+
+    def test_delete_unreferenced_objects(self):
+        """Test that `delete_unreferenced_objects` deletes loose and packed objects that are not referenced."""
+        packed = self.store.add_object_from_filelike(io.BytesIO(b'packed'))
+        self.store.repack()
+        referenced = self.store.add_object_from_filelike(io.BytesIO(b'referenced'))
+        loose = self.store.add_object_from_filelike(io.BytesIO(b'loose'))
+
+        with self.store.lock(exclusive=True):
+            self.assertEqual(self.store.delete_unreferenced_objects({referenced}), 2)
+
+        self.assertTrue(self.store.has_object(referenced))
+        self.assertFalse(self.store.has_object(packed))
+        self.assertFalse(self.store.has_object(loose))
+
+    def test_index_connection_reused(self):
+        """Test that lookups of packed objects reuse the connection to the index and the pack file handles."""
+        from unittest.mock import patch
+
+        hashkeys = [self.store.add_object_from_filelike(io.BytesIO(str(index).encode())) for index in range(3)]
+        self.store.repack()
+
+        with patch('sqlite3.connect', wraps=sqlite3.connect) as connect, patch('builtins.open', wraps=open) as opener:
+            for _ in range(2):
+                for index, hashkey in enumerate(hashkeys):
+                    self.assertEqual(self.store.get_object_content(hashkey), str(index).encode())
+
+        self.assertLessEqual(connect.call_count, 1)
+        self.assertLessEqual(len([call for call in opener.call_args_list if 'packs' in call[0][0]]), 1)
+
+    def test_lookup_does_not_create_index(self):
+        """Test that looking up an object in a store that was never repacked does not create the index."""
+        self.assertFalse(self.store.has_object('0' * 64))
+        self.assertEqual(self.store.count_objects(), (0, 0))
+        self.assertFalse(os.path.exists(os.path.join(self.basepath, 'packs.idx')))
+
+    def test_store_recreated(self):
+        """Test that an instance notices when the store is removed and created again."""
+        self.store.add_object_from_filelike(io.BytesIO(b'content'))
+        self.store.repack()
+        self.assertEqual(self.store.count_objects(), (0, 1))
+
+        shutil.rmtree(self.basepath)
+        hashkey = self.store.add_object_from_filelike(io.BytesIO(b'other'))
+        self.store.repack()
+
+        self.assertEqual(self.store.count_objects(), (0, 1))
+        self.assertEqual(self.store.get_object_content(hashkey), b'other')
@@ -30,6 +30,11 @@ def return_stored_calcfunction():
     return Int(2).store()
 
 
+@calcfunction
+def multiple_outputs_calcfunction(data):
+    return {'output_{}'.format(index): Int(data.value + index) for index in range(3)}
+
+
 @calcfunction
 def execution_counter_calcfunction(data):
     global EXECUTION_COUNTER  # pylint: disable=global-statement
@@ -66,6 +71,23 @@ class TestCalcFunction(AiidaTestCase):
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.CREATE).all()), 1)
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.RETURN).all()), 0)
 
+    def test_calcfunction_multiple_outputs(self):
+        """Verify that all new outputs of a calcfunction are stored together with their CREATE links."""
+        result, node = multiple_outputs_calcfunction.run_get_node(self.default_int)
+
+        self.assertTrue(node.is_finished_ok)
+        self.assertEqual(
+            sorted(node.get_outgoing(link_type=LinkType.CREATE).all_link_labels()),
+            ['output_0', 'output_1', 'output_2']
+        )
+
+        for index in range(3):
+            output = result['output_{}'.format(index)]
+            self.assertTrue(output.is_stored)
+            self.assertEqual(output.value, self.default_int.value + index)
+            self.assertEqual(output.get_incoming().one().node.pk, node.pk)
+            self.assertEqual(output.get_extra('_aiida_hash'), output.get_hash())
+
     def test_calcfunction_return_stored(self):
         """Verify that a calcfunction will raise when a stored node is returned."""
 
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the statistics of the cache lookups."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from aiida.manage.caching import (
+    CachingStatistics, get_statistics_directory, load_caching_statistics, reset_caching_statistics
+)
+from aiida.manage.configuration import get_config
+
+
+@pytest.fixture
+def record_statistics():
+    """Enable writing the caching statistics to disk for the current profile and delete them afterwards."""
+    config = get_config()
+    config.set_option('caching.statistics', True, scope=config.current_profile.name)
+    reset_caching_statistics()
+    yield
+    reset_caching_statistics()
+    config.unset_option('caching.statistics', scope=config.current_profile.name)
+
+
+def test_record():
+    """Test that the lookups are counted and timed per node type and process type."""
+    statistics = CachingStatistics()
+    statistics.record('node.', 'process', hit=True, hash_time=0.5, lookup_time=1.)
+    statistics.record('node.', 'process', hit=False, invalid=2, hash_time=0.5, lookup_time=1.)
+    statistics.record('node.', None, hit=False)
+
+    assert statistics.get_entries() == [{
+        'node_type': 'node.',
+        'process_type': None,
+        'attempts': 1,
+        'hits': 0,
+        'misses': 1,
+        'invalid': 0,
+        'hash_time': 0,
+        'lookup_time': 0,
+    }, {
+        'node_type': 'node.',
+        'process_type': 'process',
+        'attempts': 2,
+        'hits': 1,
+        'misses': 1,
+        'invalid': 2,
+        'hash_time': 1.,
+        'lookup_time': 2.,
+    }]
+
+    statistics.reset()
+    assert statistics.get_entries() == []
+
+
+@pytest.mark.usefixtures('record_statistics')
+def test_load():
+    """Test that the statistics that are written by multiple processes are summed when loaded."""
+    for _ in range(2):
+        statistics = CachingStatistics()
+        statistics.record('node.', 'process', hit=True, hash_time=0.5, lookup_time=1.)
+        statistics.flush()
+
+    entries = load_caching_statistics()
+    assert len(entries) == 1
+    assert entries[0]['attempts'] == 2
+    assert entries[0]['hits'] == 2
+    assert entries[0]['lookup_time'] == 2.
+
+    reset_caching_statistics()
+    assert load_caching_statistics() == []
+
+
+@pytest.mark.usefixtures('record_statistics')
+def test_load_merge_terminated():
+    """Test that the files of processes that have terminated are merged into a single file when loaded."""
+    statistics = CachingStatistics()
+    statistics.record('node.', 'process', hit=True)
+    statistics.flush()
+
+    # Write the files of two processes that have terminated, by using the pid of a process that has finished
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    dirpath = get_statistics_directory()
+
+    for suffix in ['aaaaaaaa', 'bbbbbbbb']:
+        with open(os.path.join(dirpath, '{}-{}.json'.format(process.pid, suffix)), 'w', encoding='utf8') as handle:
+            json.dump(statistics.get_entries(), handle)
+
+    for _ in range(2):
+        entries = load_caching_statistics()
+        assert len(entries) == 1
+        assert entries[0]['attempts'] == 3
+
+    # Only the file of this process remains next to the aggregate of the terminated processes
+    filename = os.path.basename(statistics._filepath)  # pylint: disable=protected-access
+    filenames = [name for name in os.listdir(dirpath) if name.endswith('.json')]
+    assert sorted(filenames) == sorted(['aggregate.json', filename])
+
+
+def test_load_disabled():
+    """Test that nothing is written if the `caching.statistics` option is disabled."""
+    reset_caching_statistics()
+
+    statistics = CachingStatistics()
+    statistics.record('node.', 'process', hit=True)
+    statistics.flush()
+
+    assert load_caching_statistics() == []
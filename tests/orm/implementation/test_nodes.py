@@ -298,6 +298,18 @@ class TestBackendNode(AiidaTestCase):
         node.store()
         self.assertEqual(node.get_attribute('attribute'), 'value')
 
+        # Once stored, only the value of the key is fetched from the database, which should distinguish a value of
+        # `None` from a key that does not exist
+        node.set_attribute('none', None)
+        node.set_attribute('nested', {'a': [1, 2], 'b': {'c': True}})
+        node.set_attribute('1', 'digits')
+        self.assertIsNone(node.get_attribute('none'))
+        self.assertEqual(node.get_attribute('nested'), {'a': [1, 2], 'b': {'c': True}})
+        self.assertEqual(node.get_attribute('1'), 'digits')
+
+        with self.assertRaises(AttributeError):
+            node.get_attribute('unexisting')
+
     def test_get_attribute_many(self):
         """Test the `BackendNode.get_attribute_many` method."""
         node = self.create_node()
@@ -546,6 +558,18 @@ class TestBackendNode(AiidaTestCase):
         node.store()
         self.assertEqual(node.get_extra('extra'), 'value')
 
+        # Once stored, only the value of the key is fetched from the database, which should distinguish a value of
+        # `None` from a key that does not exist
+        node.set_extra('none', None)
+        node.set_extra('nested', {'a': [1, 2], 'b': {'c': True}})
+        node.set_extra('1', 'digits')
+        self.assertIsNone(node.get_extra('none'))
+        self.assertEqual(node.get_extra('nested'), {'a': [1, 2], 'b': {'c': True}})
+        self.assertEqual(node.get_extra('1'), 'digits')
+
+        with self.assertRaises(AttributeError):
+            node.get_extra('unexisting')
+
     def test_get_extra_many(self):
         """Test the `BackendNode.get_extra_many` method."""
         node = self.create_node()
@@ -770,3 +794,56 @@ class TestBackendNode(AiidaTestCase):
         # Reload the node yet again and verify that the `attribute_three` attribute is still there
         rereloaded = self.backend.nodes.get(node.pk)
         self.assertIn('attribute_three', rereloaded.attributes.keys())
+
+    def test_bulk_set_extra(self):
+        """Test the `BackendNodeCollection.bulk_set_extra` method."""
+        nodes = [self.create_node().store() for _ in range(3)]
+        nodes[0].set_extra('other', 'value')
+
+        self.backend.nodes.bulk_set_extra('extra', {nodes[0].pk: 'a', nodes[1].pk: {'nested': [1, 2]}})
+
+        self.assertEqual(self.backend.nodes.get(nodes[0].pk).extras, {'other': 'value', 'extra': 'a'})
+        self.assertEqual(self.backend.nodes.get(nodes[1].pk).extras, {'extra': {'nested': [1, 2]}})
+        self.assertEqual(self.backend.nodes.get(nodes[2].pk).extras, {})
+
+    def test_bulk_store(self):
+        """Test the `BackendNodeCollection.bulk_store` method."""
+        from aiida.common.links import LinkType
+
+        source = self.create_node().store()
+        nodes = [self.create_node() for _ in range(3)]
+        nodes[0].set_attribute('attribute', 1)
+        nodes[1].set_extra('extra', 'value')
+        links = [(source, nodes[0], LinkType.CREATE, 'first'), (nodes[0], nodes[2], LinkType.INPUT_CALC, 'second')]
+
+        self.backend.nodes.bulk_store(nodes, links)
+
+        for node in nodes:
+            self.assertTrue(node.is_stored)
+            self.assertIsNotNone(node.mtime)
+            self.assertEqual(self.backend.nodes.get(node.pk).uuid, node.uuid)
+
+        self.assertEqual(len({node.pk for node in nodes}), len(nodes))
+        self.assertEqual(self.backend.nodes.get(nodes[0].pk).attributes, {'attribute': 1})
+        self.assertEqual(self.backend.nodes.get(nodes[1].pk).extras, {'extra': 'value'})
+
+        # The models of stored nodes are updated as usual
+        nodes[2].set_extra('extra', 'other')
+        self.assertEqual(self.backend.nodes.get(nodes[2].pk).extras, {'extra': 'other'})
+
+        parents = {tuple(row) for row in self.backend.query_manager.get_all_parents([nodes[2].pk])}
+        self.assertEqual(parents, {(source.pk,), (nodes[0].pk,)})
+
+    def test_bulk_store_integrity_error(self):
+        """Test that `BackendNodeCollection.bulk_store` stores none of the nodes if one of them cannot be stored."""
+        stored = self.create_node().store()
+        node = self.create_node()
+        duplicate = self.create_node()
+        duplicate.dbmodel.uuid = stored.uuid
+
+        with self.assertRaises(exceptions.IntegrityError):
+            self.backend.nodes.bulk_store([node, duplicate])
+
+        self.assertFalse(node.is_stored)
+        node.store()
+        self.assertTrue(node.is_stored)
@@ -9,14 +9,18 @@
 ###########################################################################
 # pylint: disable=too-many-public-methods
 """Tests for the Node ORM class."""
+import io
 import os
 import tempfile
+import threading
 
 import pytest
 
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions, LinkType
-from aiida.orm import Data, Log, Node, User, CalculationNode, WorkflowNode, load_node
+from aiida.engine import calcfunction
+from aiida.manage.caching import enable_caching, get_caching_statistics
+from aiida.orm import Data, Int, Log, Node, User, CalculationNode, WorkflowNode, load_node
 from aiida.orm.utils.links import LinkTriple
 
 
@@ -622,6 +626,65 @@ class TestNodeLinks(AiidaTestCase):
         uuids_expected = set([data_one.uuid, data_two.uuid])
         self.assertEqual(uuids_outgoing, uuids_expected)
 
+    def test_add_links(self):
+        """Test the `Node.objects.add_links` method that validates and adds multiple links at once."""
+        workflow = WorkflowNode().store()
+        calculation = CalculationNode().store()
+        stored = Data().store()
+        outputs = [Data() for _ in range(3)]
+
+        links = [(calculation, output, LinkType.CREATE, 'out_{}'.format(index)) for index, output in enumerate(outputs)]
+        links.append((workflow, stored, LinkType.RETURN, 'result'))
+        Node.objects.add_links(links)
+
+        # The links from or to unstored nodes are cached, the others are stored immediately
+        for index, output in enumerate(outputs):
+            link_triple = LinkTriple(calculation, LinkType.CREATE, 'out_{}'.format(index))
+            self.assertEqual(output.get_incoming().all(), [link_triple])
+
+        self.assertEqual(workflow.get_outgoing().all_link_labels(), ['result'])
+
+        Node.objects.bulk_store(outputs)
+        self.assertEqual(len(calculation.get_outgoing(link_type=LinkType.CREATE).all()), 3)
+
+    def test_add_links_invalid(self):
+        """Test that `Node.objects.add_links` validates the links against each other and the stored links."""
+        calculation = CalculationNode().store()
+        output = Data()
+        output.add_incoming(calculation, LinkType.CREATE, 'output')
+        output.store()
+
+        data_one = Data()
+        data_two = Data()
+
+        # The same link label is used twice within the links
+        with self.assertRaises(ValueError):
+            Node.objects.add_links([
+                (calculation, data_one, LinkType.CREATE, 'label'),
+                (calculation, data_two, LinkType.CREATE, 'label'),
+            ])
+
+        # None of the links should have been added
+        self.assertFalse(data_one.has_cached_links())
+        self.assertFalse(data_two.has_cached_links())
+
+        # The link label is already used by a stored link
+        with self.assertRaises(ValueError):
+            Node.objects.add_links([(calculation, data_one, LinkType.CREATE, 'output')])
+
+        # The link would introduce a cycle
+        data = Data().store()
+        consumer = CalculationNode()
+        consumer.add_incoming(data, LinkType.INPUT_CALC, 'input')
+        consumer.store()
+
+        with self.assertRaises(ValueError):
+            Node.objects.add_links([(consumer, data, LinkType.CREATE, 'output')])
+
+        # The checks of `validate_incoming` of the target are still performed
+        with self.assertRaises(ValueError):
+            Node.objects.add_links([(Data().store(), calculation, LinkType.INPUT_CALC, 'input')])
+
     def test_get_node_by_label(self):
         """Test the get_node_by_label() method of the `LinkManager`
 
@@ -828,3 +891,135 @@ def test_store_from_cache():
     assert clone.is_stored
     assert clone.get_cache_source() == data.uuid
     assert data.get_hash() == clone.get_hash()
+
+
+@calcfunction
+def constant_calcfunction():
+    """Calcfunction without inputs, such that a clone of its node has the same hash."""
+    return Int(1)
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_find_cache_sources():
+    """Test the batch lookup of cache sources with `Node.objects.find_cache_sources`."""
+    _, source = constant_calcfunction.run_get_node()
+    clone = source.clone()
+    other = CalculationNode()
+
+    assert Node.objects.find_cache_sources([clone, other]) == [None, None]
+
+    with enable_caching():
+        sources = Node.objects.find_cache_sources([clone, other])
+
+        assert sources[0].uuid == source.uuid
+        assert sources[1] is None
+
+        # The resolved cache source is used when the node is stored
+        clone.store()
+
+    assert clone.get_cache_source() == source.uuid
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_caching_statistics():
+    """Test that the cache lookups performed when storing nodes are recorded in the caching statistics."""
+    statistics = get_caching_statistics()
+    statistics.reset()
+
+    with enable_caching():
+        _, source = constant_calcfunction.run_get_node()
+        _, clone = constant_calcfunction.run_get_node()
+
+    assert clone.get_cache_source() == source.uuid
+
+    entries = [entry for entry in statistics.get_entries() if entry['process_type'] == source.process_type]
+    assert len(entries) == 1
+    assert entries[0]['attempts'] == 2
+    assert entries[0]['hits'] == 1
+    assert entries[0]['misses'] == 1
+    assert entries[0]['hash_time'] > 0
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_bulk_store():
+    """Test storing multiple nodes and their links at once with `Node.objects.bulk_store`."""
+    calculation = CalculationNode().store()
+    outputs = [Int(value) for value in range(3)]
+
+    for index, output in enumerate(outputs):
+        output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output_{}'.format(index))
+
+    other = CalculationNode()
+    other.add_incoming(outputs[0], link_type=LinkType.INPUT_CALC, link_label='input')
+
+    nodes = Node.objects.bulk_store(outputs + [other, calculation])
+
+    assert nodes == outputs + [other, calculation]
+    assert all(node.is_stored for node in nodes)
+    assert not any(node.has_cached_links() for node in nodes)
+
+    for output in outputs:
+        loaded = load_node(output.pk)
+        assert loaded.value == output.value
+        assert loaded.get_hash() == loaded.get_extra('_aiida_hash')
+
+    assert sorted(link.link_label for link in calculation.get_outgoing().all()) == ['output_0', 'output_1', 'output_2']
+    assert other.get_incoming().one().node.pk == outputs[0].pk
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_bulk_store_unstored_source():
+    """Test that `Node.objects.bulk_store` raises if the source of a link is neither stored nor one of the nodes."""
+    calculation = CalculationNode()
+    output = Int(1)
+    output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        Node.objects.bulk_store([output])
+
+    assert not output.is_stored
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_store_all_unstored_parents():
+    """Test that `Node.store_all` stores the unstored sources of its cached links in bulk, together with their files."""
+    inputs = [Int(value) for value in range(3)]
+    inputs[0].put_object_from_filelike(io.StringIO('content'), 'file.txt')
+
+    calculation = CalculationNode()
+
+    for index, node in enumerate(inputs):
+        calculation.add_incoming(node, link_type=LinkType.INPUT_CALC, link_label='input_{}'.format(index))
+
+    calculation.store_all()
+
+    assert calculation.is_stored
+    assert all(node.is_stored for node in inputs)
+    assert not any(node.has_cached_links() for node in inputs + [calculation])
+    assert load_node(inputs[0].pk).list_object_names() == ['file.txt']
+
+    for node in inputs:
+        loaded = load_node(node.pk)
+        assert loaded.value == node.value
+        assert loaded.get_extra('_aiida_hash') == loaded.get_hash()
+
+    incoming = calculation.get_incoming(link_type=LinkType.INPUT_CALC).all()
+    assert sorted((link.link_label, link.node.pk) for link in incoming) == [
+        ('input_{}'.format(index), node.pk) for index, node in enumerate(inputs)
+    ]
+
+
+def test_defer_validation_thread():
+    """Test that `defer_validation` only defers the validation of links in the current thread."""
+    from aiida.orm.utils.links import defer_validation, is_validation_deferred
+
+    results = []
+
+    with defer_validation():
+        thread = threading.Thread(target=lambda: results.append(is_validation_deferred()))
+        thread.start()
+        thread.join()
+        assert is_validation_deferred()
+
+    assert results == [False]
+    assert not is_validation_deferred()
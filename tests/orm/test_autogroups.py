@@ -9,7 +9,9 @@
 ###########################################################################
 """Tests for the Autogroup functionality."""
 from aiida.backends.testbase import AiidaTestCase
-from aiida.orm import AutoGroup, QueryBuilder
+from aiida.manage.configuration import get_config
+from aiida.orm import autogroup as autogroup_module
+from aiida.orm import AutoGroup, Data, QueryBuilder
 from aiida.orm.autogroup import Autogroup
 
 
@@ -113,3 +115,28 @@ class TestAutogroup(AiidaTestCase):
             group.label, expected_label,
             "The auto-group should be labelled '{}', it is instead '{}'".format(expected_label, group.label)
         )
+
+    def test_buffer(self):
+        """Test that stored nodes are buffered and added to the group in bulk if `autogroup.buffer_size` is set."""
+        config = get_config()
+        config.set_option('autogroup.buffer_size', 3, scope=config.current_profile.name)
+
+        autogroup = Autogroup()
+        autogroup.set_group_label_prefix('test_prefix_buffer')
+        autogroup_module.CURRENT_AUTOGROUP = autogroup
+
+        try:
+            nodes = [Data().store() for _ in range(2)]
+            self.assertEqual(autogroup.get_or_create_group().count(), 0)
+
+            nodes.append(Data().store())
+            self.assertEqual(set(node.pk for node in autogroup.get_or_create_group().nodes), set(n.pk for n in nodes))
+
+            nodes.append(Data().store())
+            self.assertEqual(autogroup.get_or_create_group().count(), 3)
+
+            autogroup.flush()
+            self.assertEqual(set(node.pk for node in autogroup.get_or_create_group().nodes), set(n.pk for n in nodes))
+        finally:
+            autogroup_module.CURRENT_AUTOGROUP = None
+            config.unset_option('autogroup.buffer_size', scope=config.current_profile.name)
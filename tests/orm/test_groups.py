@@ -163,6 +163,76 @@ class TestGroups(AiidaTestCase):
         group.remove_nodes([node_01, node_02])
         self.assertEqual(set(_.pk for _ in nodes), set(_.pk for _ in group.nodes))
 
+    def test_add_nodes_by_pk(self):
+        """Test adding nodes by their pks."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        group = orm.Group(label='test_add_nodes_by_pk').store()
+
+        self.assertEqual(group.add_nodes_by_pk([node.pk for node in nodes[:2]]), 2)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes[:2]))
+
+        # Nodes that are already present are skipped
+        self.assertEqual(group.add_nodes_by_pk(node.pk for node in nodes), 1)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes))
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            orm.Group(label='test_add_nodes_by_pk_unstored').add_nodes_by_pk([nodes[0].pk])
+
+    def test_add_nodes_from_query(self):
+        """Test adding the nodes matched by a query."""
+        nodes = [orm.Int(value).store() for value in range(4)]
+        group = orm.Group(label='test_add_nodes_from_query').store()
+        filters = {'id': {'in': [node.pk for node in nodes]}, 'attributes.value': {'>': 1}}
+        builder = orm.QueryBuilder().append(orm.Int, filters=filters, project='id')
+
+        self.assertEqual(group.add_nodes_from_query(builder), 2)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes[2:]))
+        self.assertEqual(group.add_nodes_from_query(builder), 0)
+
+        with self.assertRaises(ValueError):
+            group.add_nodes_from_query(orm.QueryBuilder().append(orm.Int, project=['id', 'uuid']))
+
+    def test_remove_nodes_by_pk(self):
+        """Test removing nodes by their pks and the nodes matched by a query."""
+        nodes = [orm.Int(value).store() for value in range(4)]
+        group = orm.Group(label='test_remove_nodes_by_pk').store()
+        group.add_nodes(nodes)
+
+        self.assertEqual(group.remove_nodes_by_pk([nodes[0].pk, nodes[0].pk]), 1)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes[1:]))
+
+        filters = {'id': {'in': [node.pk for node in nodes]}, 'attributes.value': {'<': 3}}
+        builder = orm.QueryBuilder().append(orm.Int, filters=filters, project='id')
+        self.assertEqual(group.remove_nodes_from_query(builder), 2)
+        self.assertEqual([_.pk for _ in group.nodes], [nodes[3].pk])
+
+    def test_sync(self):
+        """Test setting the nodes of a group by their pks or by a query."""
+        nodes = [orm.Int(value).store() for value in range(4)]
+        group = orm.Group(label='test_sync').store()
+        group.add_nodes(nodes[:2])
+
+        self.assertEqual(group.sync([nodes[1].pk, nodes[2].pk]), (1, 1))
+        self.assertEqual(set(_.pk for _ in group.nodes), set([nodes[1].pk, nodes[2].pk]))
+
+        filters = {'id': {'in': [node.pk for node in nodes]}, 'attributes.value': {'>': 2}}
+        builder = orm.QueryBuilder().append(orm.Int, filters=filters, project='id')
+        self.assertEqual(group.sync(builder), (1, 2))
+        self.assertEqual([_.pk for _ in group.nodes], [nodes[3].pk])
+
+        self.assertEqual(group.sync([]), (0, 1))
+        self.assertTrue(group.is_empty)
+
+    def test_add_nodes_by_pk_transaction(self):
+        """Test adding nodes by their pks that were stored in the same, ongoing transaction."""
+        group = orm.Group(label='test_add_nodes_by_pk_transaction').store()
+
+        with self.backend.transaction():
+            nodes = [orm.Data().store() for _ in range(2)]
+            self.assertEqual(group.add_nodes_by_pk([node.pk for node in nodes]), 2)
+
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes))
+
     def test_clear(self):
         """Test the `clear` method to remove all nodes."""
         node_01 = orm.Data().store()
@@ -426,6 +426,27 @@ class TestQueryBuilder(AiidaTestCase):
         self.assertEqual(orm.QueryBuilder().append(orm.Node, filters={'attributes.fa': {'>': 1.02}}).count(), 4)
         self.assertEqual(orm.QueryBuilder().append(orm.Node, filters={'attributes.fa': {'>=': 1.02}}).count(), 5)
 
+    def test_operator_eq_string(self):
+        """Test that the equality filter on a string only matches values of type string, at any depth."""
+        nodes = [orm.Data() for _ in range(4)]
+
+        nodes[0].set_extra('key', '5')
+        nodes[1].set_extra('key', 5)
+        nodes[2].set_extra('key', {'nested': '5'})
+        nodes[3].set_extra('key', {'nested': 5})
+
+        for node in nodes:
+            node.store()
+
+        def query(filters):
+            filters['id'] = {'in': [node.pk for node in nodes]}
+            return sorted(orm.QueryBuilder().append(orm.Data, filters=filters, project='id').all(flat=True))
+
+        self.assertEqual(query({'extras.key': '5'}), [nodes[0].pk])
+        self.assertEqual(query({'extras.key.nested': '5'}), [nodes[2].pk])
+        self.assertEqual(query({'extras.key': {'!==': '5'}}), sorted([node.pk for node in nodes[1:]]))
+        self.assertEqual(query({'extras.missing': {'!==': '5'}}), sorted([node.pk for node in nodes]))
+
     def test_subclassing(self):
         s = orm.StructureData()
         s.set_attribute('cat', 'miau')
@@ -777,6 +798,400 @@ class TestQueryBuilderCornerCases(AiidaTestCase):
         qb.all()
 
 
+class TestQueryCache(AiidaTestCase):
+    """Tests for the reuse of built queries through the query cache."""
+
+    def setUp(self):
+        super().setUp()
+        self.nodes = [orm.Int(value) for value in (1, 2, 3)]
+        for index, node in enumerate(self.nodes):
+            node.label = 'label_{}'.format(index)
+            node.store()
+
+    def query(self, filters):
+        filters['id'] = {'in': [node.pk for node in self.nodes]}
+        return sorted(orm.QueryBuilder().append(orm.Int, filters=filters, project='id').all(flat=True))
+
+    def test_reuse(self):
+        """Test that a query with the same structure but other filter values is taken from the cache."""
+        from aiida.orm.querybuilder import get_query_cache
+
+        cache = get_query_cache()
+        cache.clear()
+        hits = cache.hits
+
+        self.assertEqual(self.query({'label': 'label_0'}), [self.nodes[0].pk])
+        self.assertEqual(self.query({'label': 'label_1'}), [self.nodes[1].pk])
+        self.assertEqual(self.query({'label': {'like': 'label_%'}}), sorted(node.pk for node in self.nodes))
+        self.assertEqual(self.query({'attributes.value': {'>': 1}}), [self.nodes[1].pk, self.nodes[2].pk])
+        self.assertEqual(self.query({'attributes.value': {'>': 2}}), [self.nodes[2].pk])
+        self.assertEqual(cache.hits, hits + 2)
+
+    def test_reuse_in(self):
+        """Test that a query with the `in` operator is reused for lists of other values and lengths."""
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': [self.nodes[0].pk]}}, project='id')
+        self.assertEqual(builder.all(flat=True), [self.nodes[0].pk])
+
+        pks = [self.nodes[1].pk, self.nodes[2].pk]
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': pks}}, project='id')
+        self.assertEqual(sorted(builder.all(flat=True)), pks)
+        self.assertEqual(builder.count(), 2)
+        self.assertIn(str(self.nodes[2].pk), str(builder))
+
+    def test_value_types(self):
+        """Test that queries that filter on values of different types do not share the same cache entry."""
+        self.nodes[0].set_extra('key', 5)
+        self.nodes[1].set_extra('key', '5')
+        self.nodes[2].set_extra('key', True)
+
+        self.assertEqual(self.query({'extras.key': 5}), [self.nodes[0].pk])
+        self.assertEqual(self.query({'extras.key': '5'}), [self.nodes[1].pk])
+        self.assertEqual(self.query({'extras.key': True}), [self.nodes[2].pk])
+        self.assertEqual(self.query({'extras.key': 5.}), [self.nodes[0].pk])
+
+
+class TestResultCache(AiidaTestCase):
+    """Tests for the caching of the results of the `QueryBuilder`."""
+
+    def setUp(self):
+        """Enable the result cache for the current profile."""
+        from aiida.orm import querybuilder
+
+        super().setUp()
+        config = configuration.get_config()
+        config.set_option('querybuilder.result_cache_size', 100, scope=config.current_profile.name)
+        querybuilder._RESULT_CACHE = None  # pylint: disable=protected-access
+        self.nodes = [orm.Int(value).store() for value in range(3)]
+
+    def tearDown(self):
+        from aiida.orm import querybuilder
+
+        config = configuration.get_config()
+        config.unset_option('querybuilder.result_cache_size', scope=config.current_profile.name)
+        config.unset_option('querybuilder.result_cache_ttl', scope=config.current_profile.name)
+        querybuilder._RESULT_CACHE = None  # pylint: disable=protected-access
+        super().tearDown()
+
+    @staticmethod
+    def get_builder():
+        return orm.QueryBuilder().append(orm.Int, filters={'attributes.value': {'>': 0}}, project='attributes.value')
+
+    def test_cache(self):
+        """Test that the results of identical queries are taken from the cache until this process writes."""
+        from aiida.orm.querybuilder import get_result_cache
+
+        cache = get_result_cache()
+
+        self.assertEqual(sorted(self.get_builder().all(flat=True)), [1, 2])
+        self.assertEqual(self.get_builder().count(), 2)
+        self.assertEqual(len(self.get_builder().dict()), 2)
+
+        hits = cache.hits
+        results = self.get_builder().all()
+        results.append(None)
+        self.assertEqual(len(self.get_builder().all()), 2)
+        self.assertEqual(self.get_builder().count(), 2)
+        self.assertEqual(len(self.get_builder().dict()), 2)
+        self.assertEqual(cache.hits, hits + 4)
+
+        self.nodes[0].set_extra('key', 'value')
+        self.assertEqual(len(self.get_builder().all()), 2)
+        self.assertEqual(cache.hits, hits + 4)
+
+        orm.Int(3).store()
+        self.assertEqual(sorted(self.get_builder().all(flat=True)), [1, 2, 3])
+        self.assertEqual(self.get_builder().count(), 3)
+
+        builder = self.get_builder()
+        builder.distinct()
+        self.assertEqual(builder.count(), 3)
+
+    def test_expiry(self):
+        """Test that cached results expire, such that writes by other processes are eventually noticed."""
+        import time
+        from aiida.orm import querybuilder
+
+        config = configuration.get_config()
+        config.set_option('querybuilder.result_cache_ttl', 1, scope=config.current_profile.name)
+
+        write_counter = querybuilder._WRITE_COUNTER  # pylint: disable=protected-access
+        self.assertEqual(self.get_builder().count(), 2)
+
+        # Reset the counter to emulate a node that is stored by another process
+        orm.Int(3).store()
+        querybuilder._WRITE_COUNTER = write_counter  # pylint: disable=protected-access
+        self.assertEqual(self.get_builder().count(), 2)
+
+        time.sleep(1.1)
+        self.assertEqual(self.get_builder().count(), 3)
+
+    def test_group_relabel(self):
+        """Test that changing the label of a group invalidates the cached results."""
+        group = orm.Group(label='result_cache').store()
+        builder = orm.QueryBuilder().append(orm.Group, filters={'id': group.pk}, project='label')
+        self.assertEqual(builder.all(flat=True), ['result_cache'])
+
+        group.label = 'result_cache_relabeled'
+        builder = orm.QueryBuilder().append(orm.Group, filters={'id': group.pk}, project='label')
+        self.assertEqual(builder.all(flat=True), ['result_cache_relabeled'])
+
+    def test_disabled(self):
+        """Test that writes are not tracked if the result cache is disabled."""
+        from aiida.orm import querybuilder
+
+        config = configuration.get_config()
+        config.unset_option('querybuilder.result_cache_size', scope=config.current_profile.name)
+        querybuilder._RESULT_CACHE = None  # pylint: disable=protected-access
+        self.assertFalse(querybuilder.is_result_cache_enabled())
+
+        write_counter = querybuilder._WRITE_COUNTER  # pylint: disable=protected-access
+        orm.Int(3).store()
+        self.assertEqual(querybuilder._WRITE_COUNTER, write_counter)  # pylint: disable=protected-access
+
+    def test_comment_edit(self):
+        """Test that editing and deleting a comment invalidates the cached results."""
+        comment = orm.Comment(self.nodes[0], orm.User.objects.get_default(), 'content').store()
+        builder = orm.QueryBuilder().append(orm.Comment, filters={'id': comment.pk}, project='content')
+        self.assertEqual(builder.all(flat=True), ['content'])
+
+        comment.set_content('edited')
+        builder = orm.QueryBuilder().append(orm.Comment, filters={'id': comment.pk}, project='content')
+        self.assertEqual(builder.all(flat=True), ['edited'])
+
+        orm.Comment.objects.delete(comment.pk)
+        builder = orm.QueryBuilder().append(orm.Comment, filters={'id': comment.pk}, project='content')
+        self.assertEqual(builder.count(), 0)
+
+
+class TestApproximateCount(AiidaTestCase):
+    """Tests for the approximate counts of `QueryBuilder.count`."""
+
+    def setUp(self):
+        super().setUp()
+        self.pks = [orm.Data().store().pk for _ in range(3)]
+
+    def test_small(self):
+        """Test that small results are counted exactly."""
+        builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': self.pks}})
+        self.assertEqual(builder.count(approximate=True), len(self.pks))
+        self.assertEqual(builder.count(approximate=True), builder.count())
+
+    def test_estimate(self):
+        """Test that the estimate of the query planner is returned if it is not below the minimum."""
+        from unittest.mock import patch
+
+        builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': self.pks}})
+
+        with patch.object(orm.QueryBuilder, 'APPROXIMATE_COUNT_MINIMUM', 0):
+            count = builder.count(approximate=True)
+
+        self.assertIsInstance(count, int)
+        self.assertGreaterEqual(count, 1)
+
+    def test_estimate_failed(self):
+        """Test that the exact count is returned if the estimate fails, without rolling back the session."""
+        from unittest.mock import patch
+        from sqlalchemy.exc import OperationalError
+
+        node = orm.Data().store()
+        node.set_extra('pending', True)
+        builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': self.pks}})
+
+        with patch('aiida.orm.querybuilder._estimate_count', side_effect=OperationalError('EXPLAIN', {}, None)):
+            self.assertEqual(builder.count(approximate=True), len(self.pks))
+
+        self.assertEqual(orm.load_node(node.pk).get_extra('pending'), True)
+
+
+class TestStreaming(AiidaTestCase):
+    """Tests for streaming the results of the `QueryBuilder` through a dedicated session."""
+
+    def setUp(self):
+        super().setUp()
+        self.nodes = [orm.Int(value).store() for value in range(5)]
+        self.pks = [node.pk for node in self.nodes]
+
+    def test_iterall(self):
+        """Test that streamed results can be used while the shared session commits, here by setting extras."""
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': self.pks}}, project=['*', 'id'])
+
+        pks = []
+        for node, pk in builder.iterall(batch_size=2, stream=True):
+            node.set_extra('streamed', True)
+            pks.append(pk)
+
+        self.assertEqual(sorted(pks), self.pks)
+        for node in self.nodes:
+            self.assertTrue(orm.load_node(node.pk).get_extra('streamed'))
+
+    def test_iterdict(self):
+        """Test that streamed results are returned as dictionaries."""
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': self.pks}}, project='id', tag='node')
+        pks = [entry['node']['id'] for entry in builder.iterdict(batch_size=2, stream=True)]
+        self.assertEqual(sorted(pks), self.pks)
+
+    def test_close(self):
+        """Test that the iteration over the streamed results can be stopped early."""
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': self.pks}})
+        results = builder.iterall(batch_size=1, stream=True)
+        self.assertIsInstance(next(results)[0], orm.Int)
+        results.close()
+
+        self.assertEqual(builder.count(), len(self.pks))
+
+
+class TestKeysetPagination(AiidaTestCase):
+    """Tests for the keyset pagination of the `QueryBuilder` with `after`."""
+
+    def setUp(self):
+        super().setUp()
+        self.pks = []
+        for index in range(7):
+            node = orm.Data()
+            node.label = 'label_{}'.format(index % 3)
+            self.pks.append(node.store().pk)
+
+    def paginate(self, order):
+        """Return all rows for the given order, retrieving them in pages of 2 rows with keyset pagination."""
+        builder = orm.QueryBuilder().append(
+            orm.Data, tag='node', filters={'id': {'in': self.pks}}, project=['label', 'id']
+        ).order_by({'node': order}).limit(2)
+
+        rows = []
+        page = builder.all()
+        while page:
+            rows.extend(page)
+            page = builder.after(page[-1]).all()
+
+        return rows
+
+    def test_after(self):
+        """Test that paging through the results with `after` returns all rows in order."""
+        for order in (['label', 'id'], [{'label': 'desc'}, {'id': 'desc'}], [{'label': 'desc'}, 'id']):
+            expected = orm.QueryBuilder().append(
+                orm.Data, tag='node', filters={'id': {'in': self.pks}}, project=['label', 'id']
+            ).order_by({'node': order}).all()
+            self.assertEqual(self.paginate(order), expected)
+
+    def test_invalid(self):
+        """Test that `after` requires a value for each item of the order."""
+        from aiida.common.exceptions import InputValidationError
+
+        builder = orm.QueryBuilder().append(orm.Data, tag='node')
+
+        with self.assertRaises(InputValidationError):
+            builder.after([1]).all()
+
+        with self.assertRaises(InputValidationError):
+            builder.order_by({'node': ['label', 'id']}).after([1]).all()
+
+        with self.assertRaises(InputValidationError):
+            builder.after(1)
+
+
+class TestRows(AiidaTestCase):
+    """Tests for the lightweight records returned by `QueryBuilder.iterrows`."""
+
+    def setUp(self):
+        super().setUp()
+        self.nodes = [orm.Int(value).store() for value in range(3)]
+        self.pks = [node.pk for node in self.nodes]
+
+    def test_iterrows(self):
+        """Test that entities are returned as records next to the other projections."""
+        from aiida.orm.querybuilder import EntityRow
+
+        builder = orm.QueryBuilder().append(
+            orm.Int, filters={'id': {'in': self.pks}}, project=['id', '*', 'attributes.value']
+        ).order_by({orm.Int: 'id'})
+
+        rows = list(builder.iterrows(batch_size=2))
+        self.assertEqual(len(rows), len(self.nodes))
+
+        for node, (pk, row, value) in zip(self.nodes, rows):
+            self.assertIsInstance(row, EntityRow)
+            self.assertEqual(pk, node.pk)
+            self.assertEqual(row.id, node.pk)
+            self.assertEqual(row.uuid, node.uuid)
+            self.assertEqual(row.node_type, node.node_type)
+            self.assertEqual(row.attributes, {'value': node.value})
+            self.assertEqual(value, node.value)
+
+            loaded = row.load()
+            self.assertIsInstance(loaded, orm.Int)
+            self.assertEqual(loaded.uuid, node.uuid)
+
+        # The query of the builder itself should not be affected
+        self.assertEqual([node.uuid for _, node, _ in builder.all()], [node.uuid for node in self.nodes])
+
+    def test_default_projection(self):
+        """Test that the last vertex is returned as a record if nothing is projected."""
+        builder = orm.QueryBuilder().append(orm.User, tag='user').append(orm.Int, with_user='user')
+        builder.add_filter(orm.Int, {'id': {'in': self.pks}})
+        self.assertEqual(sorted(row.id for row, in builder.iterrows()), self.pks)
+
+    def test_computer(self):
+        """Test the records of computers, whose `metadata` column has a different name in the backend."""
+        builder = orm.QueryBuilder().append(orm.Computer, filters={'id': self.computer.pk})
+        [[row]] = builder.iterrows()
+        self.assertEqual(row.name, self.computer.name)
+        self.assertEqual(row.metadata, self.computer.get_metadata())
+        self.assertEqual(row.load().uuid, self.computer.uuid)
+
+
+class TestProfiling(AiidaTestCase):
+    """Tests for the timing of the queries executed by the `QueryBuilder` and the logging of slow queries."""
+
+    def setUp(self):
+        """Enable the profiling of queries for the current profile."""
+        from aiida.orm.querybuilder import get_query_statistics
+
+        super().setUp()
+        config = configuration.get_config()
+        config.set_option('querybuilder.profile', True, scope=config.current_profile.name)
+        self.nodes = [orm.Int(value).store() for value in range(3)]
+        self.pks = [node.pk for node in self.nodes]
+        get_query_statistics().reset()
+
+    def tearDown(self):
+        config = configuration.get_config()
+        config.unset_option('querybuilder.profile', scope=config.current_profile.name)
+        super().tearDown()
+
+    def test_statistics(self):
+        """Test that the executed queries are aggregated per call site."""
+        from aiida.orm.querybuilder import get_query_statistics
+
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': self.pks}}, project='id')
+
+        for _ in range(2):
+            self.assertEqual(len(builder.all()), len(self.pks))
+
+        self.assertEqual(builder.count(), len(self.pks))
+
+        entries = get_query_statistics().get_entries()
+        self.assertEqual(sorted(entry['count'] for entry in entries), [1, 2])
+        self.assertEqual(sum(entry['rows'] for entry in entries), 2 * len(self.pks) + 1)
+
+        for entry in entries:
+            self.assertIn(__file__.rstrip('c'), entry['call_site'])
+            self.assertGreaterEqual(entry['total_time'], entry['max_time'])
+
+    def test_slow_query(self):
+        """Test that a query that exceeds the threshold is logged with its SQL and bind parameters."""
+        from aiida.orm.querybuilder import _record_query
+
+        query = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': self.pks}}, project='id').get_query()
+
+        with self.assertLogs('aiida.orm.querybuilder', level='WARNING') as logs:
+            _record_query(query, 'call_site', 2., len(self.pks))
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('slow query of 2000 ms returning 3 rows at call_site', logs.output[0])
+        self.assertIn('db_dbnode', logs.output[0])
+        self.assertIn(str(self.pks), logs.output[0])
+
+
 class TestAttributes(AiidaTestCase):
 
     def test_attribute_existence(self):
@@ -1294,6 +1709,110 @@ class QueryBuilderPath(AiidaTestCase):
         # self.assertTrue(set(next(zip(*qb.all()))), set([5]))
 
 
+class TestClosureTable(AiidaTestCase):
+    """Test the ancestor and descendant relationships when the closure table of the provenance graph exists."""
+
+    def tearDown(self):
+        from aiida.backends.general.closure import drop_closure_table
+        drop_closure_table()
+        super().tearDown()
+
+    @staticmethod
+    def get_relatives(node, relationship):
+        """Return the set of pks and depths of the ancestors or descendants of the given node."""
+        builder = orm.QueryBuilder().append(orm.Node, filters={'id': node.pk}, tag='node')
+        builder.append(orm.Node, project='id', edge_project='depth', **{relationship: 'node'})
+        return {tuple(row) for row in builder.all()}
+
+    def test_closure_table(self):
+        """Test that the closure table gives the same relatives as the recursive query and is kept up to date."""
+        from aiida.backends.general.closure import build_closure_table, closure_table_exists
+        from aiida.manage.database.delete.nodes import delete_nodes
+
+        data_one = orm.Data().store()
+        calc_one = orm.CalculationNode()
+        calc_one.add_incoming(data_one, link_type=LinkType.INPUT_CALC, link_label='input')
+        calc_one.store()
+        data_two = orm.Data()
+        data_two.add_incoming(calc_one, link_type=LinkType.CREATE, link_label='output')
+        data_two.store()
+
+        build_closure_table()
+        self.assertTrue(closure_table_exists())
+
+        # Links that are added after the table has been built, including a shorter path from `data_one` to `data_three`
+        calc_two = orm.CalculationNode()
+        calc_two.add_incoming(data_two, link_type=LinkType.INPUT_CALC, link_label='input')
+        calc_two.add_incoming(data_one, link_type=LinkType.INPUT_CALC, link_label='other')
+        calc_two.store()
+        data_three = orm.Data()
+        data_three.add_incoming(calc_two, link_type=LinkType.CREATE, link_label='output')
+        data_three.store()
+
+        self.assertEqual(
+            self.get_relatives(data_three, 'with_descendants'), {(data_one.pk, 1), (calc_one.pk, 2), (data_two.pk, 1),
+                                                                 (calc_two.pk, 0)}
+        )
+        self.assertEqual(
+            self.get_relatives(data_one, 'with_ancestors'), {(calc_one.pk, 0), (data_two.pk, 1), (calc_two.pk, 0),
+                                                             (data_three.pk, 1)}
+        )
+
+        delete_nodes([calc_two.pk], force=True)
+
+        self.assertEqual(self.get_relatives(data_one, 'with_ancestors'), {(calc_one.pk, 0), (data_two.pk, 1)})
+        self.assertEqual(self.get_relatives(data_two, 'with_descendants'), {(data_one.pk, 1), (calc_one.pk, 0)})
+
+    def test_closure_table_other_session(self):
+        """Test that the closure table is kept up to date for links that are added and deleted outside of the ORM."""
+        from sqlalchemy import text
+        from aiida.backends.general.closure import build_closure_table
+        from aiida.manage.manager import get_manager
+
+        data_one = orm.Data().store()
+        calc = orm.CalculationNode().store()
+        data_two = orm.Data().store()
+        pks = [data_one.pk, calc.pk, data_two.pk]
+
+        build_closure_table()
+
+        # A separate connection, with its own transactions, as used by another process
+        engine = get_manager().get_backend().get_session().get_bind()
+        select = text('SELECT ancestor_id, descendant_id, depth FROM db_dbnode_closure WHERE ancestor_id = ANY(:pks)')
+        insert = text(
+            'INSERT INTO db_dblink (input_id, output_id, type, label) VALUES (:source, :target, :type, :label)'
+        )
+
+        with engine.begin() as connection:
+            connection.execute(
+                insert, [{
+                    'source': data_one.pk,
+                    'target': calc.pk,
+                    'type': LinkType.INPUT_CALC.value,
+                    'label': 'input'
+                }, {
+                    'source': calc.pk,
+                    'target': data_two.pk,
+                    'type': LinkType.CREATE.value,
+                    'label': 'output'
+                }]
+            )
+
+        with engine.begin() as connection:
+            rows = {tuple(row) for row in connection.execute(select, pks=pks)}
+
+        self.assertEqual(rows, {(data_one.pk, calc.pk, 0), (calc.pk, data_two.pk, 0), (data_one.pk, data_two.pk, 1)})
+        self.assertEqual(self.get_relatives(data_two, 'with_descendants'), {(data_one.pk, 1), (calc.pk, 0)})
+
+        with engine.begin() as connection:
+            connection.execute(text('DELETE FROM db_dblink WHERE input_id = :source'), source=data_one.pk)
+
+        with engine.begin() as connection:
+            rows = {tuple(row) for row in connection.execute(select, pks=pks)}
+
+        self.assertEqual(rows, {(calc.pk, data_two.pk, 0)})
+
+
 class TestConsistency(AiidaTestCase):
 
     def test_create_node_and_query(self):
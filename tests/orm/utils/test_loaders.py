@@ -10,9 +10,11 @@
 """Module to test orm utilities to load nodes, codes etc."""
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common.exceptions import NotExistent
-from aiida.orm import Node, Group, Data
+from aiida.manage.configuration import get_config
+from aiida.manage.manager import get_manager
+from aiida.orm import CalculationNode, Node, Group, Data
 from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node
-from aiida.orm.utils.loaders import NodeEntityLoader
+from aiida.orm.utils.loaders import NodeEntityLoader, clear_identity_map, get_identity_map
 
 
 class TestOrmUtils(AiidaTestCase):
@@ -211,3 +213,82 @@ class TestOrmUtils(AiidaTestCase):
 
         with self.assertRaises(NotExistent):
             load_group('non-existent-uuid')
+
+
+class TestIdentityMap(AiidaTestCase):
+    """Test the identity map of the nodes loaded by `load_node`."""
+
+    def setUp(self):
+        """Enable the identity map for the current profile."""
+        super().setUp()
+        config = get_config()
+        config.set_option('orm.identity_map_size', 2, scope=config.current_profile.name)
+        clear_identity_map()
+
+    def tearDown(self):
+        config = get_config()
+        config.unset_option('orm.identity_map_size', scope=config.current_profile.name)
+        clear_identity_map()
+        super().tearDown()
+
+    def test_same_instance(self):
+        """Test that loading a node again by its pk or full UUID returns the same instance."""
+        node = Data().store()
+        loaded_node = load_node(node.pk)
+
+        self.assertIsNot(loaded_node, node)
+        self.assertIs(load_node(node.pk), loaded_node)
+        self.assertIs(load_node(pk=node.pk), loaded_node)
+        self.assertIs(load_node(node.uuid), loaded_node)
+        self.assertIs(load_node(uuid=node.uuid.replace('-', '')), loaded_node)
+
+        # A partial UUID is resolved by a query, but the node that is loaded is still put in the map
+        partially_loaded_node = load_node(uuid=node.uuid[:8])
+        self.assertIsNot(partially_loaded_node, loaded_node)
+        self.assertIs(load_node(node.pk), partially_loaded_node)
+
+    def test_sub_classes(self):
+        """Test that a node in the map is only returned if it is an instance of the requested classes."""
+        node = Data().store()
+        load_node(node.pk)
+
+        with self.assertRaises(NotExistent):
+            load_node(node.pk, sub_classes=(CalculationNode,))
+
+    def test_eviction(self):
+        """Test that the least recently used nodes are evicted and that modified or deleted nodes are evicted."""
+        nodes = [Data().store() for _ in range(3)]
+        loaded_nodes = [load_node(node.pk) for node in nodes]
+
+        self.assertEqual(len(get_identity_map()), 2)
+        self.assertIsNot(load_node(nodes[0].pk), loaded_nodes[0])
+        self.assertIs(load_node(nodes[2].pk), loaded_nodes[2])
+
+        nodes[2].set_extra('key', 'value')
+        loaded_node = load_node(nodes[2].pk)
+        self.assertIsNot(loaded_node, loaded_nodes[2])
+        self.assertEqual(loaded_node.get_extra('key'), 'value')
+
+        Node.objects.delete(nodes[2].pk)
+        with self.assertRaises(NotExistent):
+            load_node(nodes[2].uuid)
+
+    def test_session_reset(self):
+        """Test that a new map is used after the database session has been reset."""
+        node = Data().store()
+        identity_map = get_identity_map()
+        loaded_node = load_node(node.pk)
+
+        get_manager().get_backend_manager().reset_backend_environment()
+
+        self.assertIsNot(get_identity_map(), identity_map)
+        self.assertIsNot(load_node(node.pk), loaded_node)
+
+    def test_disabled(self):
+        """Test that the identity map is disabled by default."""
+        config = get_config()
+        config.unset_option('orm.identity_map_size', scope=config.current_profile.name)
+        node = Data().store()
+
+        self.assertIsNone(get_identity_map())
+        self.assertIsNot(load_node(node.pk), load_node(node.pk))
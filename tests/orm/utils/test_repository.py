@@ -14,8 +14,9 @@ import shutil
 import tempfile
 
 from aiida.backends.testbase import AiidaTestCase
+from aiida.manage.configuration import get_config
 from aiida.orm import Node, Data
-from aiida.orm.utils.repository import File, FileType
+from aiida.orm.utils.repository import File, FileType, delete_unreferenced_objects, get_object_store
 from aiida.common.exceptions import ModificationNotAllowed
 
 
@@ -191,3 +192,104 @@ class TestRepository(AiidaTestCase):
         self.assertEqual(sorted(node.list_object_names('subdir')), ['a.txt', 'b.txt', 'nested'])
 
         self.assertRaises(ModificationNotAllowed, node._repository.erase)  # pylint: disable=protected-access
+
+
+class TestRepositoryObjectStore(TestRepository):
+    """Tests for the node `Repository` utility class with the content of stored nodes in the object store."""
+
+    def setUp(self):
+        """Enable the object store backend for the current profile."""
+        super().setUp()
+        config = get_config()
+        config.set_option('repository.backend', 'objectstore', scope=config.current_profile.name)
+
+    def tearDown(self):
+        config = get_config()
+        config.unset_option('repository.backend', scope=config.current_profile.name)
+        super().tearDown()
+
+    def test_store(self):
+        """Test that the content of a stored node is retrievable from the object store."""
+        node = Data()
+        node.put_object_from_tree(self.tempdir, '')
+        node.store()
+
+        self.assertIsNotNone(node._repository._get_manifest())  # pylint: disable=protected-access
+        self.assertEqual(sorted(node.list_object_names()), ['c.txt', 'subdir'])
+        self.assertEqual(node.get_object('subdir/nested'), File('nested', FileType.DIRECTORY))
+
+        key = os.path.join('subdir', 'nested', 'deep.txt')
+        self.assertEqual(node.get_object_content(key), self.get_file_content(key))
+        self.assertEqual(node.get_object_content(key, mode='rb'), self.get_file_content(key).encode('utf8'))
+
+        with self.assertRaises(ModificationNotAllowed):
+            node.open(key, mode='w')
+
+    def test_deduplication(self):
+        """Test that identical files of different nodes are only stored once in the object store."""
+        nodes = []
+
+        for _ in range(2):
+            node = Data()
+            node.put_object_from_tree(self.tempdir, '')
+            node.store()
+            nodes.append(node)
+
+        manifests = [node._repository._get_manifest() for node in nodes]  # pylint: disable=protected-access
+        self.assertEqual(manifests[0], manifests[1])
+
+        object_store = get_object_store()
+        self.assertTrue(object_store.has_object(manifests[0]['path']['c.txt']))
+        self.assertTrue(object_store.has_object(manifests[0]['path']['subdir']['a.txt']))
+
+    def test_hash(self):
+        """Test that the hash of a node does not depend on the repository backend."""
+        node = Data()
+        node.put_object_from_tree(self.tempdir, '')
+        node.store()
+
+        folder_node = Data()
+        folder_node.put_object_from_tree(self.tempdir, '')
+
+        self.assertEqual(node.get_hash(), folder_node._get_hash())  # pylint: disable=protected-access
+
+    def test_hash_digest_cache(self):
+        """Test that the content digests of objects are cached by their key and do not change the hash."""
+        from aiida.common.hashing import FileDigestCache
+
+        node = Data()
+        node.put_object_from_tree(self.tempdir, '')
+        node.store()
+
+        digest_cache = FileDigestCache(os.path.join(self.tempdir, 'digests.sqlite'))
+        node_hash = node.get_hash()
+
+        self.assertEqual(node.get_hash(digest_cache=digest_cache), node_hash)
+        self.assertGreater(len(digest_cache), 0)
+        self.assertEqual(node.get_hash(digest_cache=digest_cache), node_hash)
+
+    def test_delete_unreferenced_objects(self):
+        """Test that the objects of a deleted node are deleted once no other node references them."""
+        nodes = []
+
+        for _ in range(2):
+            node = Data()
+            node.put_object_from_tree(self.tempdir, '')
+            node.store()
+            nodes.append(node)
+
+        manifest_path = nodes[0]._repository._get_manifest_path()  # pylint: disable=protected-access
+        hashkey = nodes[0]._repository._get_manifest()['path']['c.txt']  # pylint: disable=protected-access
+        object_store = get_object_store()
+
+        Node.objects.delete(nodes[0].pk)
+        self.assertFalse(os.path.exists(manifest_path))
+
+        # The objects are still referenced by the other node
+        delete_unreferenced_objects()
+        self.assertTrue(object_store.has_object(hashkey))
+        self.assertEqual(nodes[1].get_object_content('c.txt'), self.get_file_content('c.txt'))
+
+        Node.objects.delete(nodes[1].pk)
+        self.assertGreaterEqual(delete_unreferenced_objects(), 4)
+        self.assertFalse(object_store.has_object(hashkey))
@@ -415,6 +415,34 @@ class RESTApiTestSuite(RESTApiTestCase):
         """
         RESTApiTestCase.process_test(self, 'computers', '/computers?offset=2&orderby=+id', expected_range=[2, None])
 
+    def test_computers_list_cursor(self):
+        """
+        Get the list of computers from database using the cursor
+        returned in the headers of the previous results.
+        It should return the rows after those of the previous results.
+        """
+        url = self.get_url_prefix() + '/computers?limit=2&orderby=-name'
+
+        with self.app.test_client() as client:
+            response = client.get(url)
+            cursor = response.headers['X-Next-Cursor']
+            self.assertIn('cursor={}>; rel=next'.format(cursor), response.headers['Link'])
+
+            response = client.get(url + '&cursor=' + cursor)
+            names = [computer['name'] for computer in json.loads(response.data)['data']['computers']]
+
+        expected = sorted([computer['name'] for computer in self.get_dummy_data()['computers']], reverse=True)
+        self.assertEqual(names, expected[2:4])
+
+    def test_computers_list_cursor_offset(self):
+        """
+        If we pass the cursor and offset at same time, it should return the error message.
+        """
+        expected_error = 'cursor key is incompatible with pages and offset'
+        RESTApiTestCase.process_test(
+            self, 'computers', '/computers?offset=2&cursor=W10&orderby=+id', expected_errormsg=expected_error
+        )
+
     def test_computers_list_limit_offset_perpage(self):
         """
         If we pass the limit, offset and perpage at same time, it
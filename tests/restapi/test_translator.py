@@ -9,8 +9,11 @@
 ###########################################################################
 """Tests for the `aiida.restapi.translator` module."""
 # pylint: disable=invalid-name
+import pytest
+
+from aiida.restapi.translator.computer import ComputerTranslator
 from aiida.restapi.translator.nodes.node import NodeTranslator
-from aiida.orm import Data
+from aiida.orm import Computer, Data, QueryBuilder
 
 
 def test_get_all_download_formats():
@@ -22,3 +25,13 @@ def test_get_all_download_formats_missing_get_export_formats(monkeypatch):
     """Test `get_all_download_formats` does not except if a `Data` class does not implement `get_export_formats`."""
     monkeypatch.delattr(Data, 'get_export_formats')
     NodeTranslator.get_all_download_formats()
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'aiida_localhost')
+def test_approximate_count():
+    """Test that the total count of a translator with the `APPROXIMATE_COUNT` option is that of the query."""
+    from aiida.restapi.common.config import API_CONFIG
+
+    translator = ComputerTranslator(APPROXIMATE_COUNT=True, **API_CONFIG)
+    translator.set_query()
+    assert translator.get_total_count() == QueryBuilder().append(Computer).count() == 1
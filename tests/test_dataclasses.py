@@ -2614,6 +2614,135 @@ class TestArrayData(AiidaTestCase):
         self.assertEqual(first.shape, n.get_shape('first'))
         self.assertEqual(second.shape, n.get_shape('second'))
 
+    def test_get_array_mmap(self):
+        """Check that `get_array` can return read-only memory-mapped arrays."""
+        import numpy
+
+        node = ArrayData()
+        first = numpy.random.rand(2, 3, 4)
+        node.set_array('first', first)
+        fortran = numpy.asfortranarray(numpy.random.rand(3, 5))
+        node.set_array('fortran', fortran)
+        node.set_array('empty', numpy.zeros((0, 3)))
+
+        for _ in range(2):
+            array = node.get_array('first', mmap=True)
+            self.assertIsInstance(array, numpy.memmap)
+            self.assertFalse(array.flags.writeable)
+            self.assertTrue(numpy.array_equal(array, first))
+            self.assertTrue(numpy.array_equal(node.get_array('fortran', mmap=True), fortran))
+            self.assertEqual(node.get_array('empty', mmap=True).shape, (0, 3))
+            node.store()
+
+        with self.assertRaises(KeyError):
+            node.get_array('nonexistent_array', mmap=True)
+
+    def test_get_array_mmap_versions(self):
+        """Check that arrays can be memory-mapped from files in all versions of the `.npy` format."""
+        import io
+        import numpy
+        import numpy.lib.format
+
+        array = numpy.random.rand(4, 3)
+        # A field name that cannot be encoded in latin-1 requires version 3.0 of the format
+        structured = numpy.array([(1, 2.), (3, 4.)], dtype=[('ω', numpy.int32), ('b', numpy.float64)])
+        arrays = {'one': (array, (1, 0)), 'two': (array, (2, 0)), 'three': (structured, (3, 0))}
+
+        node = ArrayData()
+
+        for name, (value, version) in arrays.items():
+            handle = io.BytesIO()
+            numpy.lib.format.write_array(handle, value, version=version, allow_pickle=False)
+            handle.seek(0)
+            node.put_object_from_filelike(handle, '{}.npy'.format(name), mode='wb', encoding=None)
+            node.set_attribute('{}{}'.format(node.array_prefix, name), list(value.shape))
+
+        for _ in range(2):
+            for name, (value, _) in arrays.items():
+                mapped = node.get_array(name, mmap=True)
+                self.assertEqual(mapped.dtype, value.dtype)
+                self.assertEqual(mapped.tolist(), value.tolist())
+            node.store()
+
+    def test_array_cache(self):
+        """Check that the arrays of stored nodes are cached in the process-wide cache."""
+        import numpy
+        from aiida.orm.nodes.data.array.array import get_array_cache
+
+        node = ArrayData()
+        node.set_array('first', numpy.arange(10))
+        node.store()
+
+        cache = get_array_cache()
+        array = node.get_array('first')
+
+        self.assertFalse(array.flags.writeable)
+        self.assertIs(load_node(node.pk).get_array('first'), array)
+        self.assertIn((node.uuid, 'first'), cache)
+
+        node.clear_internal_cache()
+        self.assertNotIn((node.uuid, 'first'), cache)
+
+    def test_chunk_cache(self):
+        """Check that the chunks read from a stored array are cached, so reading all rows decompresses each once."""
+        import numpy
+        from unittest.mock import patch
+        from aiida.orm.nodes.data.array.array import get_array_cache
+
+        first = numpy.random.rand(10, 3)
+        node = ArrayData()
+        node.set_array('first', first, chunk_size=4)
+        node.store()
+        node.clear_internal_cache()
+
+        # pylint: disable=protected-access
+        with patch.object(ArrayData, '_get_array_chunks', wraps=node._get_array_chunks) as get_array_chunks:
+            rows = [node.get_array_slice('first', index, index + 1)[0] for index in range(10)]
+
+        self.assertEqual(get_array_chunks.call_count, 3)
+        self.assertTrue(numpy.array_equal(numpy.array(rows), first))
+        self.assertIn((node.uuid, 'first', 'chunks'), get_array_cache())
+
+        node.clear_internal_cache()
+        self.assertNotIn((node.uuid, 'first', 'chunks'), get_array_cache())
+
+    def test_chunked_array(self):
+        """Check that arrays stored in the chunked format can be read whole or in slices."""
+        import numpy
+
+        node = ArrayData()
+        first = numpy.random.rand(10, 3)
+        node.set_array('first', first, chunk_size=4)
+        node.set_array('plain', first)
+        node.set_array('empty', numpy.zeros((0, 3)), chunk_size=4)
+
+        self.assertEqual(node.get_chunk_size('first'), 4)
+        self.assertIsNone(node.get_chunk_size('plain'))
+        self.assertEqual(set(node.get_arraynames()), {'first', 'plain', 'empty'})
+        self.assertIn('first.npz', node.list_object_names())
+
+        for _ in range(2):
+            self.assertTrue(numpy.array_equal(node.get_array('first'), first))
+            self.assertEqual(node.get_shape('first'), (10, 3))
+            self.assertEqual(node.get_array('empty').shape, (0, 3))
+            for start, stop in [(0, 1), (3, 9), (4, 8), (-2, None), (None, None), (8, 3)]:
+                for name in ['first', 'plain']:
+                    self.assertTrue(numpy.array_equal(node.get_array_slice(name, start, stop), first[start:stop]))
+            node.store()
+
+        with self.assertRaises(ValueError):
+            ArrayData().set_array('scalar', numpy.array(1.), chunk_size=4)
+
+        # Overwriting an array in a different format should replace the file
+        node = ArrayData()
+        node.set_array('first', first, chunk_size=4)
+        node.set_array('first', first)
+        self.assertEqual(node.list_object_names(), ['first.npy'])
+        self.assertIsNone(node.get_chunk_size('first'))
+
+        node.delete_array('first')
+        self.assertEqual(node.get_arraynames(), [])
+
     def test_iteration(self):
         """
         Check the functionality of the get_iterarrays() iterator
@@ -2642,6 +2771,8 @@ class TestArrayData(AiidaTestCase):
 
 class TestTrajectoryData(AiidaTestCase):
     """Tests the TrajectoryData objects."""
+    from aiida.orm.nodes.data.cif import has_pycifrw
+    from aiida.orm.nodes.data.structure import has_ase
 
     def test_creation(self):
         """Check the methods to set and retrieve a trajectory."""
@@ -2823,6 +2954,64 @@ class TestTrajectoryData(AiidaTestCase):
             # Step 66 does not exist
             n.get_index_from_stepid(66)
 
+    def test_chunked_trajectory(self):
+        """Check that the data of single steps can be retrieved from a trajectory stored in the chunked format."""
+        import numpy
+
+        numsteps = 7
+        symbols = ['H', 'O', 'C']
+        positions = numpy.random.rand(numsteps, 3, 3)
+        velocities = numpy.random.rand(numsteps, 3, 3)
+
+        trajectory = TrajectoryData()
+        trajectory.set_trajectory(symbols=symbols, positions=positions, velocities=velocities, chunk_size=3)
+        trajectory.store()
+
+        self.assertEqual(trajectory.get_chunk_size('positions'), 3)
+        self.assertIsNone(trajectory.get_chunk_size('steps'))
+        self.assertTrue(numpy.array_equal(trajectory.get_positions(), positions))
+
+        for index in [0, 4, numsteps - 1, -1]:
+            stepid, time, cell, step_symbols, step_positions, step_velocities = trajectory.get_step_data(index)
+            self.assertEqual(stepid, numpy.arange(numsteps)[index])
+            self.assertIsNone(time)
+            self.assertIsNone(cell)
+            self.assertEqual(step_symbols, symbols)
+            self.assertTrue(numpy.array_equal(step_positions, positions[index]))
+            self.assertTrue(numpy.array_equal(step_velocities, velocities[index]))
+
+        with self.assertRaises(IndexError):
+            trajectory.get_step_data(numsteps)
+
+        with self.assertRaises(IndexError):
+            trajectory.get_step_data(-numsteps - 1)
+
+    @unittest.skipIf(not has_ase(), 'Unable to import ase')
+    @unittest.skipIf(not has_pycifrw(), 'Unable to import PyCifRW')
+    def test_chunked_trajectory_cif(self):
+        """Check that exporting a whole trajectory reads its arrays at once, instead of the data of each step."""
+        import numpy
+        from unittest.mock import patch
+
+        numsteps = 5
+        trajectory = TrajectoryData()
+        trajectory.set_trajectory(
+            symbols=['H', 'O'],
+            positions=numpy.random.rand(numsteps, 2, 3),
+            cells=numpy.array([numpy.eye(3) * (step + 2) for step in range(numsteps)]),
+            chunk_size=2
+        )
+        trajectory.store()
+
+        # pylint: disable=protected-access
+        with patch.object(TrajectoryData, 'get_array_slice') as get_array_slice:
+            content, _ = trajectory._exportcontent('cif')
+
+        get_array_slice.assert_not_called()
+        self.assertEqual(
+            content, b''.join(trajectory._exportcontent('cif', trajectory_index=step)[0] for step in range(numsteps))
+        )
+
     def test_conversion_to_structure(self):
         """
         Check the methods to export a given time step to a StructureData node.
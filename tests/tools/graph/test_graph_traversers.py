@@ -86,14 +86,17 @@ class TestTraverseGraph(AiidaTestCase):
     """Test class for traverse_graph"""
 
     def _single_test(self, starting_nodes=(), expanded_nodes=(), links_forward=(), links_backward=()):
-        """Auxiliary method to perform a single test run and assertion"""
-        obtained_nodes = traverse_graph(
-            starting_nodes,
-            links_forward=links_forward,
-            links_backward=links_backward,
-        )['nodes']
+        """Auxiliary method to perform a single test run and assertion for each traversal engine"""
         expected_nodes = set(starting_nodes + expanded_nodes)
-        self.assertEqual(obtained_nodes, expected_nodes)
+
+        for engine in ('age', 'sql'):
+            obtained_nodes = traverse_graph(
+                starting_nodes,
+                links_forward=links_forward,
+                links_backward=links_backward,
+                engine=engine,
+            )['nodes']
+            self.assertEqual(obtained_nodes, expected_nodes)
 
     def test_traversal_individually(self):
         """
@@ -344,6 +347,52 @@ class TestTraverseGraph(AiidaTestCase):
                                         links_backward=links_backward)['nodes']
         self.assertEqual(obtained_nodes, expected_nodes)
 
+    def test_traversal_sql_engine(self):
+        """Test that the `sql` engine returns the same nodes and links as the `age` engine."""
+        nodes_dict = create_minimal_graph()
+        starting_pks = [nodes_dict['calc_0'].pk]
+        links = {
+            'links_forward': [LinkType.CREATE, LinkType.INPUT_WORK],
+            'links_backward': [LinkType.INPUT_CALC, LinkType.CALL_CALC],
+        }
+
+        expected = traverse_graph(starting_pks, get_links=True, engine='age', **links)
+        obtained = traverse_graph(starting_pks, get_links=True, engine='sql', **links)
+        self.assertEqual(obtained['nodes'], expected['nodes'])
+        self.assertEqual(obtained['links'], expected['links'])
+        self.assertIn(nodes_dict['work_2'].pk, obtained['nodes'])
+
+        obtained = traverse_graph(starting_pks, engine='sql', **links)
+        self.assertEqual(obtained['nodes'], expected['nodes'])
+        self.assertIsNone(obtained['links'])
+
+        # A limited number of iterations is always handled by the `age` engine
+        expected = traverse_graph(starting_pks, max_iterations=1, engine='age', **links)
+        obtained = traverse_graph(starting_pks, max_iterations=1, engine='sql', **links)
+        self.assertEqual(obtained['nodes'], expected['nodes'])
+
+        with self.assertRaises(ValueError):
+            traverse_graph(starting_pks, engine='invalid')
+
+    def test_traversal_link_graph(self):
+        """Test that traversing an in-memory `LinkGraph` returns the same nodes and links as querying the database."""
+        from aiida.tools.graph.link_graph import LinkGraph
+
+        nodes_dict = create_minimal_graph()
+        link_graph = LinkGraph()
+        links = {
+            'links_forward': [LinkType.CREATE, LinkType.INPUT_WORK],
+            'links_backward': [LinkType.INPUT_CALC, LinkType.CALL_CALC],
+        }
+
+        for pk in [node.pk for node in nodes_dict.values()]:
+            for max_iterations in (None, 1):
+                kwargs = dict(max_iterations=max_iterations, get_links=True, **links)
+                expected = traverse_graph([pk], engine='age', **kwargs)
+                obtained = traverse_graph([pk], link_graph=link_graph, **kwargs)
+                self.assertEqual(obtained['nodes'], expected['nodes'])
+                self.assertEqual(obtained['links'], expected['links'])
+
     def test_traversal_errors(self):
         """This will test the errors of the traversers."""
         from aiida.common.exceptions import NotExistent
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for aiida.tools.graph.link_graph"""
+from aiida import orm
+from aiida.backends.testbase import AiidaTestCase
+from aiida.common.links import LinkType
+from aiida.orm.utils.links import LinkQuadruple
+from aiida.tools.graph.link_graph import LinkGraph
+
+
+class TestLinkGraph(AiidaTestCase):
+    """Tests for the in-memory `LinkGraph`."""
+
+    def setUp(self):
+        super().setUp()
+        self.data_i = orm.Data().store()
+        self.calc = orm.CalculationNode()
+        self.calc.add_incoming(self.data_i, link_type=LinkType.INPUT_CALC, link_label='input')
+        self.calc.store()
+        self.data_o = orm.Data().store()
+        self.data_o.add_incoming(self.calc, link_type=LinkType.CREATE, link_label='output')
+
+    def test_expand(self):
+        """Test expanding nodes along their links in both directions."""
+        link_graph = LinkGraph()
+
+        nodes, links = link_graph.expand([self.data_i.pk], [LinkType.INPUT_CALC], 'forward', get_links=True)
+        self.assertEqual(nodes, {self.calc.pk})
+        self.assertEqual(links, {LinkQuadruple(self.data_i.pk, self.calc.pk, LinkType.INPUT_CALC.value, 'input')})
+
+        nodes, links = link_graph.expand([self.calc.pk], [LinkType.INPUT_CALC, LinkType.CREATE], 'backward')
+        self.assertEqual(nodes, {self.data_i.pk})
+        self.assertIsNone(links)
+
+        nodes, _ = link_graph.expand([self.data_i.pk, self.calc.pk], [LinkType.CREATE], 'forward')
+        self.assertEqual(nodes, {self.data_o.pk})
+
+        # Nodes without links are not expanded
+        self.assertEqual(link_graph.expand([self.data_o.pk], list(LinkType), 'forward')[0], set())
+
+        with self.assertRaises(ValueError):
+            link_graph.expand([self.data_i.pk], [LinkType.CREATE], 'sideways')
+
+    def test_refresh(self):
+        """Test that refreshing the snapshot loads the links that were added since."""
+        link_graph = LinkGraph()
+        count = len(link_graph)
+
+        calc = orm.CalculationNode()
+        calc.add_incoming(self.data_o, link_type=LinkType.INPUT_CALC, link_label='input')
+        calc.store()
+
+        self.assertEqual(link_graph.expand([self.data_o.pk], [LinkType.INPUT_CALC], 'forward')[0], set())
+        self.assertEqual(link_graph.refresh(), 1)
+        self.assertEqual(len(link_graph), count + 1)
+        self.assertEqual(link_graph.expand([self.data_o.pk], [LinkType.INPUT_CALC], 'forward')[0], {calc.pk})
+        self.assertEqual(link_graph.refresh(), 0)